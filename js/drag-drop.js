@@ -123,7 +123,7 @@ function handleDrop(e) {
     }
 
     // Check if cell is empty (no hard blocks, soft blocks OK)
-    const cellType = game.grid[cellY][cellX];
+    const cellType = game.board.getTerrain(cellX, cellY);
     if (cellType === 2) {
         log('⚠️ Cannot spawn NPC on hard block');
         return;
@@ -171,7 +171,7 @@ function spawnNPC(npc, x, y) {
     player.npcEmoji = npc.emoji;
     player.isNPC = true;
 
-    game.players.push(player);
+    game.addPlayer(player);
 
     // Set NPC prompt in AI controller
     ai.setPrompt(playerId, npc.prompt);
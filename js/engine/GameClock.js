@@ -0,0 +1,127 @@
+// GameClock.js - Time source for the engine and games
+// All wall-clock reads, timers and frame scheduling go through one clock so
+// tests can run the real timing code under virtual time
+
+/**
+ * GameClock - Default clock backed by Date.now(), setTimeout and requestAnimationFrame
+ *
+ * Under Chrome DevTools Protocol virtual time (Emulation.setVirtualTimePolicy)
+ * Date.now() and timers are virtualized by the browser. Animation frames are
+ * driven by the compositor instead, so set `useTimerFrames` to schedule frames
+ * as timers when running under virtual time (or wherever requestAnimationFrame
+ * does not exist).
+ */
+class GameClock {
+    /**
+     * @param {Object} options - {useTimerFrames: boolean, frameInterval: ms}
+     */
+    constructor(options = {}) {
+        this.useTimerFrames = options.useTimerFrames || typeof requestAnimationFrame === 'undefined';
+        this.frameInterval = options.frameInterval || 16;
+    }
+
+    /**
+     * Current time in milliseconds
+     * @returns {number}
+     */
+    now() {
+        return Date.now();
+    }
+
+    /**
+     * Schedule a callback after a delay
+     * @param {Function} callback
+     * @param {number} delay - Milliseconds
+     * @returns {*} Timer handle
+     */
+    setTimeout(callback, delay) {
+        return setTimeout(callback, delay);
+    }
+
+    /**
+     * Cancel a scheduled callback
+     * @param {*} handle - Timer handle from setTimeout()
+     */
+    clearTimeout(handle) {
+        clearTimeout(handle);
+    }
+
+    /**
+     * Schedule a callback for the next frame
+     * @param {Function} callback
+     * @returns {Object} Frame handle
+     */
+    requestFrame(callback) {
+        if (this.useTimerFrames) {
+            return { timer: this.setTimeout(callback, this.frameInterval) };
+        }
+        return { frame: requestAnimationFrame(callback) };
+    }
+
+    /**
+     * Cancel a scheduled frame
+     * @param {Object} handle - Frame handle from requestFrame()
+     */
+    cancelFrame(handle) {
+        if (!handle) return;
+        if (handle.timer !== undefined) {
+            this.clearTimeout(handle.timer);
+        } else if (handle.frame !== undefined) {
+            cancelAnimationFrame(handle.frame);
+        }
+    }
+}
+
+/**
+ * ManualClock - Deterministic clock that only moves when advanced
+ *
+ * Used for headless simulation (Node) where there is no browser to
+ * virtualize time: the runner advances the clock by turnDelay per turn so
+ * explosion lifetimes behave exactly as they would in real time.
+ */
+class ManualClock extends GameClock {
+    /**
+     * @param {number} startTime - Initial time in milliseconds
+     */
+    constructor(startTime = 0) {
+        super({ useTimerFrames: true });
+        this.time = startTime;
+        this.timers = []; // [{id, due, callback}] sorted by due
+        this.nextTimerId = 1;
+    }
+
+    now() {
+        return this.time;
+    }
+
+    setTimeout(callback, delay) {
+        const timer = { id: this.nextTimerId++, due: this.time + Math.max(0, delay), callback };
+        let i = this.timers.length;
+        while (i > 0 && this.timers[i - 1].due > timer.due) i--;
+        this.timers.splice(i, 0, timer);
+        return timer.id;
+    }
+
+    clearTimeout(handle) {
+        this.timers = this.timers.filter(t => t.id !== handle);
+    }
+
+    /**
+     * Move time forward, firing due timers in order
+     * @param {number} ms - Milliseconds to advance
+     */
+    advance(ms) {
+        const target = this.time + ms;
+        while (this.timers.length > 0 && this.timers[0].due <= target) {
+            const timer = this.timers.shift();
+            this.time = timer.due;
+            timer.callback();
+        }
+        this.time = target;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { GameClock, ManualClock };
+}
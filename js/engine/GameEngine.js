@@ -112,6 +112,33 @@ class IGame {
     getCurrentPlayer() {
         throw new Error('getCurrentPlayer() must be implemented by game');
     }
+
+    /**
+     * Optional: counter that changes whenever the game state changes.
+     * Games without it are rendered on every frame.
+     * @returns {number}
+     */
+    getStateVersion() {
+        throw new Error('getStateVersion() is optional and was not implemented by game');
+    }
+
+    /**
+     * Optional: true while something must be redrawn every frame
+     * (e.g. explosions on screen) even though the state is unchanged
+     * @returns {boolean}
+     */
+    isAnimating() {
+        throw new Error('isAnimating() is optional and was not implemented by game');
+    }
+
+    /**
+     * Optional: record a structured gameplay event (see GameEvents.js)
+     * @param {string} type - Event type
+     * @param {Object} data - Event payload
+     */
+    recordEvent(type, data) {
+        throw new Error('recordEvent() is optional and was not implemented by game');
+    }
 }
 
 /**
@@ -123,17 +150,24 @@ class GameEngine {
      * @param {IGame} game - Game implementation
      * @param {LLMAdapter} llmAdapter - LLM integration adapter
      * @param {Object} renderer - Rendering interface
+     * @param {GameClock} clock - Time source (default: wall clock)
      */
-    constructor(game, llmAdapter, renderer) {
+    constructor(game, llmAdapter, renderer, clock = null) {
         this.game = game;
         this.llm = llmAdapter;
         this.renderer = renderer;
+        this.clock = clock || new GameClock();
 
         this.running = false;
         this.paused = false;
         this.turnInProgress = false;
         this.lastTurnTime = 0;
-        this.animationFrameId = null;
+        this.animationFrameId = null; // Pending frame or sleep (clock.requestFrame handle)
+        this.renderedVersion = null; // game.getStateVersion() at the last render
+        this.initialized = false;
+
+        // Engine-level readiness signals (initialized, turn-complete, game-over)
+        this.signals = new GameSignals();
     }
 
     /**
@@ -148,8 +182,32 @@ class GameEngine {
             ...config
         };
 
+        this.setGame(this.game);
         this.game.initialize(config);
         this.renderer.initialize(this.game, config);
+
+        this.initialized = true;
+        this.signals.emit('initialized', {});
+    }
+
+    /**
+     * Attach a game instance, sharing the engine clock with it
+     * @param {IGame} game - Game implementation
+     */
+    setGame(game) {
+        this.game = game;
+        if (typeof game.setClock === 'function') {
+            game.setClock(this.clock);
+        }
+    }
+
+    /**
+     * Replace the engine clock (e.g. when switching to virtual time)
+     * @param {GameClock} clock - Time source
+     */
+    setClock(clock) {
+        this.clock = clock;
+        this.setGame(this.game);
     }
 
     /**
@@ -159,6 +217,7 @@ class GameEngine {
         this.game.start();
         this.running = true;
         this.paused = false;
+        this.cancelLoop();
         this.gameLoop();
     }
 
@@ -169,6 +228,7 @@ class GameEngine {
         this.game.pause();
         this.paused = !this.paused;
         if (!this.paused && this.running) {
+            this.cancelLoop();
             this.gameLoop();
         }
     }
@@ -177,26 +237,73 @@ class GameEngine {
      * Stop and reset game
      */
     reset() {
-        if (this.animationFrameId) {
-            cancelAnimationFrame(this.animationFrameId);
-        }
+        this.cancelLoop();
         this.running = false;
         this.paused = false;
         this.turnInProgress = false;
         this.lastTurnTime = 0;
         this.game.reset();
         this.renderer.render(this.game.getGameState());
+        this.renderedVersion = this.getStateVersion();
+    }
+
+    /**
+     * Cancel the pending loop iteration (frame or sleep)
+     */
+    cancelLoop() {
+        if (this.animationFrameId) {
+            this.clock.cancelFrame(this.animationFrameId);
+            this.animationFrameId = null;
+        }
+    }
+
+    /**
+     * Game state version, or null if the game doesn't track one
+     * @returns {number|null}
+     */
+    getStateVersion() {
+        return typeof this.game.getStateVersion === 'function' ? this.game.getStateVersion() : null;
+    }
+
+    /**
+     * Check if the game has an animation that needs every frame
+     * @returns {boolean}
+     */
+    isAnimating() {
+        return typeof this.game.isAnimating === 'function' && this.game.isAnimating();
+    }
+
+    /**
+     * Snapshot and render only if the state changed since the last render
+     * (or always, for games without a state version)
+     * @returns {boolean} True if a frame was rendered
+     */
+    renderIfChanged() {
+        const version = this.getStateVersion();
+        if (version !== null && version === this.renderedVersion && !this.isAnimating()) {
+            return false;
+        }
+
+        this.renderer.render(this.game.getGameState());
+        this.renderedVersion = version;
+        return true;
     }
 
     /**
      * Main game loop
+     *
+     * While an AI turn is in flight the loop awaits it and schedules nothing.
+     * Between turns it renders only changed state, and when nothing is
+     * animating it sleeps until the next turn is due instead of polling
+     * every animation frame.
      */
     async gameLoop() {
+        this.animationFrameId = null;
         if (!this.running || this.paused) {
             return;
         }
 
-        const now = Date.now();
+        const now = this.clock.now();
 
         // Check for game over
         if (this.game.isGameOver()) {
@@ -211,11 +318,23 @@ class GameEngine {
         }
 
         // Render current state (after turn execution so explosions are visible)
-        const state = this.game.getGameState();
-        this.renderer.render(state);
+        this.renderIfChanged();
 
-        // Continue loop
-        this.animationFrameId = requestAnimationFrame(() => this.gameLoop());
+        if (this.game.isGameOver()) {
+            this.endGame();
+            return;
+        }
+
+        // Continue loop: every frame while animating (or without a state version), else sleep
+        if (!this.running || this.paused || this.animationFrameId) {
+            return;
+        }
+        const sleep = this.lastTurnTime + this.config.turnDelay - this.clock.now();
+        if (this.getStateVersion() === null || this.isAnimating() || sleep <= 0) {
+            this.animationFrameId = this.clock.requestFrame(() => this.gameLoop());
+        } else {
+            this.animationFrameId = { timer: this.clock.setTimeout(() => this.gameLoop(), sleep) };
+        }
     }
 
     /**
@@ -238,11 +357,13 @@ class GameEngine {
             this.game.nextTurn();
 
         } catch (error) {
-            console.error('[GameEngine] Turn execution error:', error);
+            logger.error('engine', '[GameEngine] Turn execution error:', error);
             this.game.nextTurn(); // Advance even on error
         } finally {
             this.turnInProgress = false;
         }
+
+        this.signals.emit('turn-complete', { turn: this.game.turnCount });
     }
 
     /**
@@ -284,6 +405,26 @@ class GameEngine {
         this.running = false;
         const winner = this.game.getWinner();
         this.renderer.showGameOver(winner, this.game);
+        this.signals.emit('game-over', { winner });
+    }
+
+    /**
+     * Resolve once the engine has completed turn n
+     * @param {number} n - Turn number
+     * @returns {Promise<Object>}
+     */
+    whenTurnComplete(n) {
+        return this.signals.waitFor('turn-complete', e => e.turn >= n,
+            () => !this.turnInProgress && this.game.turnCount >= n);
+    }
+
+    /**
+     * Resolve once the engine has ended the game
+     * @returns {Promise<Object>}
+     */
+    whenGameOver() {
+        return this.signals.waitFor('game-over', () => true,
+            () => this.initialized && !this.running && this.game.isGameOver());
     }
 
     /**
@@ -304,7 +445,7 @@ class GameEngine {
         // Validate and process move
         const validation = this.game.validateMove(this.game.getGameState(), playerId, move);
         if (!validation.valid) {
-            console.warn('[GameEngine] Invalid manual move:', validation.errors);
+            logger.warn('engine', '[GameEngine] Invalid manual move:', validation.errors);
             return false;
         }
 
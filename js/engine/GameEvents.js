@@ -0,0 +1,125 @@
+// GameEvents.js - Typed gameplay event ring buffer
+// Tests and tools drain structured events in one call instead of scraping
+// console text line by line.
+
+/**
+ * Event types recorded by the engine and games:
+ * - 'bomb-placed'   {playerId, bombId, x, y, range}
+ * - 'bomb-exploded' {playerId, bombId, x, y, range, cells, chainedFrom}
+ *                   (cells = blast size, chainedFrom = bombId that set it off or null)
+ * - 'player-killed' {playerId, x, y, bombId, ownerId}
+ * - 'loot-spawned'  {lootType, lootId, x, y}
+ * - 'loot-picked'   {playerId, lootType, lootId, x, y}
+ * - 'prompt-built'  {playerId, systemLength, userLength, systemHash, userHash}
+ *                   (+ {system, user} prompt text when `promptText` is on)
+ * - 'llm-response'  {playerId, provider, model, move, valid}
+ */
+const GAME_EVENT_TYPES = Object.freeze([
+    'bomb-placed',
+    'bomb-exploded',
+    'player-killed',
+    'loot-spawned',
+    'loot-picked',
+    'prompt-built',
+    'llm-response'
+]);
+
+/**
+ * GameEvents - Bounded buffer of {seq, type, turn, round, ...data} events
+ *
+ * drain() returns everything recorded since the previous drain. When more
+ * than `capacity` events pile up between drains the oldest are overwritten
+ * and reported as `dropped`.
+ */
+class GameEvents {
+    /**
+     * @param {Object} options
+     * @param {number} options.capacity - Maximum buffered events (default 4096)
+     * @param {boolean} options.enabled - Record events (default true)
+     * @param {boolean} options.promptText - Keep full prompt text on
+     *     'prompt-built' events (default false: lengths and hashes only)
+     */
+    constructor(options = {}) {
+        this.capacity = Math.max(1, options.capacity || 4096);
+        this.enabled = options.enabled !== false;
+        this.promptText = options.promptText === true;
+        this.buffer = new Array(this.capacity);
+        this.nextSeq = 1;
+        this.drainedSeq = 0; // Last seq returned by drain()
+    }
+
+    /**
+     * Record an event
+     * @param {string} type - One of GAME_EVENT_TYPES
+     * @param {Object} data - Event payload (plain JSON values)
+     * @param {Object} time - {turn, round} the event happened in
+     */
+    record(type, data, time = {}) {
+        if (!this.enabled) return;
+
+        const seq = this.nextSeq++;
+        this.buffer[seq % this.capacity] = {
+            seq,
+            type,
+            turn: time.turn !== undefined ? time.turn : null,
+            round: time.round !== undefined ? time.round : null,
+            ...data
+        };
+    }
+
+    /**
+     * 32-bit FNV-1a hash of a string as 8 hex digits (identifies prompt text
+     * without keeping it in the buffer)
+     */
+    static hashText(text) {
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < text.length; i++) {
+            hash ^= text.charCodeAt(i);
+            hash = Math.imul(hash, 0x01000193);
+        }
+        return (hash >>> 0).toString(16).padStart(8, '0');
+    }
+
+    /**
+     * Number of events waiting to be drained (capped at capacity)
+     */
+    get pending() {
+        return Math.min(this.nextSeq - 1 - this.drainedSeq, this.capacity);
+    }
+
+    /**
+     * Take all events recorded since the last drain, oldest first
+     * @param {Object} filter - Optional {types: [...]} to keep only some types
+     * @returns {Object} {events, dropped}
+     */
+    drain(filter = {}) {
+        const last = this.nextSeq - 1;
+        const first = Math.max(this.drainedSeq + 1, last - this.capacity + 1);
+        const dropped = first - (this.drainedSeq + 1);
+        const types = filter.types ? new Set(filter.types) : null;
+
+        const events = [];
+        for (let seq = first; seq <= last; seq++) {
+            const event = this.buffer[seq % this.capacity];
+            if (!types || types.has(event.type)) {
+                events.push(event);
+            }
+        }
+
+        this.drainedSeq = last;
+        return { events, dropped };
+    }
+
+    /**
+     * Forget buffered events
+     */
+    clear() {
+        this.buffer = new Array(this.capacity);
+        this.drainedSeq = this.nextSeq - 1;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { GameEvents, GAME_EVENT_TYPES };
+}
@@ -0,0 +1,336 @@
+// GameLog.js - Bounded event log store and virtualized log panel
+// LogStore keeps the last N entries in a ring buffer; LogPanel shows them
+// with only the visible lines in the DOM, so long sessions stay flat.
+
+const LOG_LEVELS = Object.freeze(['info', 'success', 'warn', 'error']);
+
+// "P3", "Player 3", "[P3]" -> 3
+const LOG_PLAYER_PATTERN = /\b(?:P|Player\s*)(\d{1,2})\b/;
+
+/**
+ * LogStore - Ring buffer of log entries
+ *
+ * Entries are {seq, time, level, message, playerId}. Once `capacity` is
+ * reached the oldest entry is overwritten; `seq` keeps counting so viewers
+ * can tell how many entries were dropped.
+ */
+class LogStore {
+    /**
+     * @param {Object} options
+     * @param {number} options.capacity - Maximum entries kept (default 5000)
+     */
+    constructor(options = {}) {
+        this.capacity = Math.max(1, options.capacity || 5000);
+        this.entries = new Array(this.capacity);
+        this.start = 0; // Index of the oldest entry
+        this.size = 0;
+        this.nextSeq = 1;
+        this.listeners = [];
+    }
+
+    /**
+     * Add an entry
+     * @param {string} message
+     * @param {string} level - One of LOG_LEVELS (unknown levels become 'info')
+     * @param {number|null} playerId - Player the entry is about (default: parsed from message)
+     * @returns {Object} The stored entry
+     */
+    add(message, level = 'info', playerId = undefined) {
+        const text = String(message);
+        if (playerId === undefined) {
+            const match = text.match(LOG_PLAYER_PATTERN);
+            playerId = match ? parseInt(match[1], 10) : null;
+        }
+
+        const entry = {
+            seq: this.nextSeq++,
+            time: Date.now(),
+            level: LOG_LEVELS.includes(level) ? level : 'info',
+            message: text,
+            playerId
+        };
+
+        if (this.size < this.capacity) {
+            this.entries[(this.start + this.size) % this.capacity] = entry;
+            this.size++;
+        } else {
+            this.entries[this.start] = entry;
+            this.start = (this.start + 1) % this.capacity;
+        }
+
+        for (const listener of this.listeners) {
+            listener(entry);
+        }
+        return entry;
+    }
+
+    /**
+     * Entry by age: 0 = oldest, size - 1 = newest
+     */
+    get(index) {
+        return this.entries[(this.start + index) % this.capacity];
+    }
+
+    /**
+     * Number of entries dropped because the buffer was full
+     */
+    get dropped() {
+        return this.nextSeq - 1 - this.size;
+    }
+
+    /**
+     * Entries oldest first, optionally filtered
+     * @param {Object} filter - {level, playerId} (null/undefined = any)
+     * @returns {Object[]}
+     */
+    toArray(filter = {}) {
+        const result = [];
+        for (let i = 0; i < this.size; i++) {
+            const entry = this.get(i);
+            if (LogStore.matches(entry, filter)) {
+                result.push(entry);
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Check an entry against a {level, playerId} filter
+     */
+    static matches(entry, filter) {
+        if (filter.level && entry.level !== filter.level) return false;
+        if (filter.playerId !== undefined && filter.playerId !== null && entry.playerId !== filter.playerId) return false;
+        return true;
+    }
+
+    /**
+     * Export the whole buffer
+     * @param {string} format - 'text' (one line per entry) or 'json'
+     * @returns {string}
+     */
+    export(format = 'text') {
+        const entries = this.toArray();
+        if (format === 'json') {
+            return JSON.stringify({ dropped: this.dropped, entries }, null, 2);
+        }
+        return entries
+            .map(e => `${new Date(e.time).toISOString()} [${e.level.toUpperCase()}] ${e.message}`)
+            .join('\n');
+    }
+
+    /**
+     * Remove all entries
+     */
+    clear() {
+        this.entries = new Array(this.capacity);
+        this.start = 0;
+        this.size = 0;
+    }
+
+    /**
+     * Subscribe to new entries
+     * @param {Function} listener - Called with each added entry
+     */
+    onAdd(listener) {
+        this.listeners.push(listener);
+    }
+}
+
+/**
+ * LogPanel - Virtualized view of a LogStore (newest entry on top)
+ *
+ * The content element gets the full list height; a small pool of
+ * fixed-height line elements is positioned over the visible rows only.
+ * Redraws are batched to one per animation frame.
+ */
+class LogPanel {
+    /**
+     * @param {LogStore} store
+     * @param {Object} options
+     * @param {string} options.scrollId - Scrolling container id (default 'gameLog')
+     * @param {string} options.contentId - Content element id (default 'logContent')
+     * @param {number} options.rowHeight - Line height in px (must match CSS)
+     * @param {number} options.overscan - Extra lines rendered above/below the viewport
+     */
+    constructor(store, options = {}) {
+        this.store = store;
+        this.options = {
+            scrollId: options.scrollId || 'gameLog',
+            contentId: options.contentId || 'logContent',
+            rowHeight: options.rowHeight || 18,
+            overscan: options.overscan || 5
+        };
+
+        this.filter = { level: null, playerId: null };
+        this.filtered = null; // Filtered entries (oldest first), rebuilt on demand
+        this.scroller = null;
+        this.content = null;
+        this.lines = []; // Pooled line elements
+        this.viewportHeight = 0;
+        this.resizeObserver = null;
+        this.drawScheduled = false;
+
+        this.store.onAdd(() => {
+            this.filtered = null;
+            this.scheduleDraw();
+        });
+    }
+
+    /**
+     * Bind to the DOM (call once the page has loaded)
+     * @returns {boolean} True if the panel elements exist
+     */
+    attach() {
+        this.scroller = document.getElementById(this.options.scrollId);
+        this.content = document.getElementById(this.options.contentId);
+        if (!this.scroller || !this.content) return false;
+
+        this.content.classList.add('virtual-log');
+        this.content.innerHTML = '';
+        this.lines = [];
+
+        this.viewportHeight = this.scroller.clientHeight;
+        this.scroller.addEventListener('scroll', () => this.scheduleDraw());
+
+        // The scroller grows with its content up to max-height, so track its
+        // own size (not just window resizes) or rows past the first few stay blank
+        const onResize = () => {
+            this.viewportHeight = this.scroller.clientHeight;
+            this.scheduleDraw();
+        };
+        if (typeof ResizeObserver !== 'undefined') {
+            this.resizeObserver = new ResizeObserver(onResize);
+            this.resizeObserver.observe(this.scroller);
+        } else {
+            window.addEventListener('resize', onResize);
+        }
+
+        this.draw();
+        return true;
+    }
+
+    /**
+     * Show only entries matching a level and/or player (null = any)
+     * @param {Object} filter - {level, playerId}
+     */
+    setFilter(filter = {}) {
+        this.filter = {
+            level: filter.level || null,
+            playerId: filter.playerId !== undefined && filter.playerId !== null && filter.playerId !== '' ? Number(filter.playerId) : null
+        };
+        this.filtered = null;
+        this.scheduleDraw();
+    }
+
+    /**
+     * Number of entries shown with the current filter
+     */
+    get count() {
+        return this.isFiltering() ? this.getFiltered().length : this.store.size;
+    }
+
+    isFiltering() {
+        return this.filter.level !== null || this.filter.playerId !== null;
+    }
+
+    getFiltered() {
+        if (!this.filtered) {
+            this.filtered = this.store.toArray(this.filter);
+        }
+        return this.filtered;
+    }
+
+    /**
+     * Entry shown on row `row` (0 = newest)
+     */
+    entryAt(row) {
+        if (this.isFiltering()) {
+            const filtered = this.getFiltered();
+            return filtered[filtered.length - 1 - row];
+        }
+        return this.store.get(this.store.size - 1 - row);
+    }
+
+    /**
+     * Redraw on the next animation frame (coalesces bursts of log lines)
+     */
+    scheduleDraw() {
+        if (this.drawScheduled || !this.content) return;
+        this.drawScheduled = true;
+
+        const run = () => {
+            this.drawScheduled = false;
+            this.draw();
+        };
+        if (typeof requestAnimationFrame === 'function') {
+            requestAnimationFrame(run);
+        } else {
+            setTimeout(run, 0);
+        }
+    }
+
+    /**
+     * Render the visible rows
+     */
+    draw() {
+        if (!this.content) return;
+
+        const { rowHeight, overscan } = this.options;
+        const count = this.count;
+        this.content.style.height = `${count * rowHeight}px`;
+
+        const scrollTop = Math.max(0, this.scroller.scrollTop - this.content.offsetTop);
+        const first = Math.max(0, Math.floor(scrollTop / rowHeight) - overscan);
+        const last = Math.min(count, Math.ceil((scrollTop + this.viewportHeight) / rowHeight) + overscan);
+
+        // Grow the pool as needed; hide spare lines
+        const visible = last - first;
+        while (this.lines.length < visible) {
+            const line = document.createElement('div');
+            line.className = 'log-line';
+            this.content.appendChild(line);
+            this.lines.push(line);
+        }
+
+        for (let i = 0; i < this.lines.length; i++) {
+            const line = this.lines[i];
+            if (i >= visible) {
+                line.style.display = 'none';
+                continue;
+            }
+
+            const entry = this.entryAt(first + i);
+            if (line.seq !== entry.seq) {
+                const text = `[${new Date(entry.time).toLocaleTimeString()}] ${entry.message}`;
+                line.textContent = text;
+                line.title = text;
+                line.className = `log-line log-${entry.level}`;
+                line.seq = entry.seq;
+            }
+            line.style.display = '';
+            line.style.transform = `translateY(${(first + i) * rowHeight}px)`;
+        }
+    }
+
+    /**
+     * Download the full buffer (unfiltered)
+     * @param {string} format - 'text' or 'json'
+     * @returns {string} The exported log
+     */
+    download(format = 'text') {
+        const data = this.store.export(format);
+        const blob = new Blob([data], { type: format === 'json' ? 'application/json' : 'text/plain' });
+        const url = URL.createObjectURL(blob);
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = `bombervibe-log-${new Date().toISOString().replace(/[:.]/g, '-')}.${format === 'json' ? 'json' : 'txt'}`;
+        link.click();
+        URL.revokeObjectURL(url);
+        return data;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { LogStore, LogPanel, LOG_LEVELS };
+}
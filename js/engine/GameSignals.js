@@ -0,0 +1,96 @@
+// GameSignals.js - Lightweight event hub with promise-based readiness hooks
+// Lets tests and tools await game milestones instead of sleeping
+
+/**
+ * GameSignals - Named events plus awaitable conditions
+ *
+ * Events used by the engine and games:
+ * - 'initialized'        {seed}
+ * - 'turn'               {turn, round}     (after each nextTurn)
+ * - 'round'              {round}           (when a new round begins)
+ * - 'explosions-settled' {turn}            (last active explosion removed)
+ * - 'game-over'          {winner}
+ */
+class GameSignals {
+    constructor() {
+        this.listeners = {}; // {eventName: Set<handler>}
+    }
+
+    /**
+     * Subscribe to an event
+     * @param {string} event - Event name
+     * @param {Function} handler - Called with event data
+     * @returns {Function} Unsubscribe function
+     */
+    on(event, handler) {
+        if (!this.listeners[event]) {
+            this.listeners[event] = new Set();
+        }
+        this.listeners[event].add(handler);
+        return () => this.off(event, handler);
+    }
+
+    /**
+     * Unsubscribe from an event
+     * @param {string} event - Event name
+     * @param {Function} handler - Handler passed to on()
+     */
+    off(event, handler) {
+        if (this.listeners[event]) {
+            this.listeners[event].delete(handler);
+        }
+    }
+
+    /**
+     * Publish an event to all subscribers
+     * @param {string} event - Event name
+     * @param {Object} data - Event payload
+     */
+    emit(event, data = {}) {
+        const handlers = this.listeners[event];
+        if (!handlers || handlers.size === 0) return;
+
+        // Copy so handlers can unsubscribe while we iterate
+        for (const handler of [...handlers]) {
+            try {
+                handler(data);
+            } catch (error) {
+                console.error(`[GameSignals] Handler for '${event}' failed:`, error);
+            }
+        }
+    }
+
+    /**
+     * Wait for the next event matching a predicate
+     * @param {string} event - Event name
+     * @param {Function} predicate - (data) => boolean (default: any)
+     * @param {Function} alreadyMet - Optional () => boolean checked first; resolves immediately if true
+     * @returns {Promise<Object>} Resolves with event data
+     */
+    waitFor(event, predicate = () => true, alreadyMet = null) {
+        if (alreadyMet && alreadyMet()) {
+            return Promise.resolve({ alreadyMet: true });
+        }
+
+        return new Promise(resolve => {
+            const unsubscribe = this.on(event, data => {
+                if (predicate(data)) {
+                    unsubscribe();
+                    resolve(data);
+                }
+            });
+        });
+    }
+
+    /**
+     * Remove all subscribers
+     */
+    clear() {
+        this.listeners = {};
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { GameSignals };
+}
@@ -0,0 +1,90 @@
+// HandleRegistry.js - Monotonic integer handles with O(1) lookup
+// Entities get a small integer handle from a per-game counter, so IDs are
+// deterministic (no wall-clock timestamps) and lookups are a Map get
+// instead of a scan over an entity list.
+
+/**
+ * HandleRegistry - Allocates handles and maps them to live entities
+ *
+ * Handles start at 1 (0 is free for "none" in typed-array layers) and are
+ * never reused until clear() resets the counter for a new game.
+ */
+class HandleRegistry {
+    constructor() {
+        this.clear();
+    }
+
+    /**
+     * Reserve the next handle (without registering anything)
+     * @returns {number}
+     */
+    allocate() {
+        return this.nextHandle++;
+    }
+
+    /**
+     * Register an entity, giving it a handle if it has none
+     * @param {Object} entity
+     * @returns {number} The entity's handle
+     */
+    add(entity) {
+        if (!entity.handle) {
+            entity.handle = this.allocate();
+        } else if (entity.handle >= this.nextHandle) {
+            this.nextHandle = entity.handle + 1;
+        }
+        this.entities.set(entity.handle, entity);
+        return entity.handle;
+    }
+
+    /**
+     * Entity for a handle (null = none)
+     */
+    get(handle) {
+        return this.entities.get(handle) || null;
+    }
+
+    /**
+     * Check if an entity is registered
+     */
+    has(entity) {
+        return !!entity.handle && this.entities.get(entity.handle) === entity;
+    }
+
+    /**
+     * Unregister an entity
+     * @returns {boolean} True if it was registered
+     */
+    remove(entity) {
+        if (!this.has(entity)) return false;
+        this.entities.delete(entity.handle);
+        return true;
+    }
+
+    /**
+     * Number of registered entities
+     */
+    get size() {
+        return this.entities.size;
+    }
+
+    /**
+     * Registered entities, in registration order
+     */
+    values() {
+        return this.entities.values();
+    }
+
+    /**
+     * Forget every entity and restart handles at 1
+     */
+    clear() {
+        this.entities = new Map(); // handle -> entity
+        this.nextHandle = 1;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { HandleRegistry };
+}
@@ -40,20 +40,20 @@ class LLMAdapter {
             this.apiUrl = 'https://api.groq.com/openai/v1/chat/completions';
             this.tacticalModel = 'moonshotai/kimi-k2-instruct-0905';
             this.memoryModel = 'moonshotai/kimi-k2-instruct-0905';
-            console.log('[LLM] Detected Groq Cloud API key - using Kimi K2 model');
+            logger.info('llm', '[LLM] Detected Groq Cloud API key - using Kimi K2 model');
         } else if (key.startsWith('sk-')) {
             this.apiProvider = 'openai';
             this.apiUrl = 'https://api.openai.com/v1/chat/completions';
             this.tacticalModel = 'gpt-4.1-mini';
             this.memoryModel = 'gpt-4.1-mini';
-            console.log('[LLM] Detected OpenAI API key - using GPT-4.1-mini model');
+            logger.info('llm', '[LLM] Detected OpenAI API key - using GPT-4.1-mini model');
         } else {
             // Default to OpenAI for unknown prefixes
             this.apiProvider = 'openai';
             this.apiUrl = 'https://api.openai.com/v1/chat/completions';
             this.tacticalModel = 'gpt-4.1-mini';
             this.memoryModel = 'gpt-4.1-mini';
-            console.log('[LLM] Unknown API key format - defaulting to OpenAI');
+            logger.info('llm', '[LLM] Unknown API key format - defaulting to OpenAI');
         }
 
         localStorage.setItem('openai_api_key', key);
@@ -109,7 +109,7 @@ class LLMAdapter {
      * Clear all player memories
      */
     clearAllMemories() {
-        console.log('[LLM] Clearing all player memories');
+        logger.info('llm', '[LLM] Clearing all player memories');
         for (let i = 1; i <= 10; i++) {
             this.playerMemory[i] = '';
             this.playerThoughts[i] = '';
@@ -147,7 +147,7 @@ class LLMAdapter {
         const prompt = game.getLLMPrompt(gameState, playerId);
 
         try {
-            console.log(`[LLM P${playerId}] Requesting move from ${this.tacticalModel} (${this.apiProvider})`);
+            logger.debug('llm', () => `[LLM P${playerId}] Requesting move from ${this.tacticalModel} (${this.apiProvider})`);
 
             const requestBody = {
                 model: this.tacticalModel,
@@ -177,7 +177,7 @@ class LLMAdapter {
 
             if (!response.ok) {
                 const error = await response.text();
-                console.error(`[LLM P${playerId}] API error ${response.status}:`, error);
+                logger.error('llm', `[LLM P${playerId}] API error ${response.status}:`, error);
                 throw new Error(`API error: ${response.status}`);
             }
 
@@ -187,8 +187,17 @@ class LLMAdapter {
 
             // Validate move using game's validator
             const validation = game.validateMove(gameState, playerId, move);
+            if (typeof game.recordEvent === 'function') {
+                game.recordEvent('llm-response', {
+                    playerId,
+                    provider: this.apiProvider,
+                    model: this.tacticalModel,
+                    move,
+                    valid: validation.valid
+                });
+            }
             if (!validation.valid) {
-                console.warn(`[LLM P${playerId}] Invalid move from AI:`, validation.errors);
+                logger.warn('llm', `[LLM P${playerId}] Invalid move from AI:`, validation.errors);
                 return this.getRandomMove(gameState, playerId, game);
             }
 
@@ -197,11 +206,11 @@ class LLMAdapter {
                 this.playerThoughts[playerId] = move.thought;
             }
 
-            console.log(`[LLM P${playerId}] Move:`, move);
+            logger.debug('llm', `[LLM P${playerId}] Move:`, move);
             return move;
 
         } catch (error) {
-            console.error(`[LLM P${playerId}] Exception:`, error);
+            logger.error('llm', `[LLM P${playerId}] Exception:`, error);
             return this.getRandomMove(gameState, playerId, game);
         }
     }
@@ -217,7 +226,7 @@ class LLMAdapter {
             throw new Error('API key not set');
         }
 
-        console.log('[LLM] Requesting moves for all alive players in parallel');
+        logger.info('llm', '[LLM] Requesting moves for all alive players in parallel');
 
         // Create promises for all alive players
         const movePromises = gameState.players
@@ -238,7 +247,7 @@ class LLMAdapter {
             }
         });
 
-        console.log('[LLM] All moves received:', result);
+        logger.debug('llm', '[LLM] All moves received:', result);
         return result;
     }
 
@@ -250,7 +259,7 @@ class LLMAdapter {
      * @returns {Object} Random valid move
      */
     getRandomMove(gameState, playerId, game) {
-        console.log(`[LLM P${playerId}] Using random move fallback`);
+        logger.info('llm', () => `[LLM P${playerId}] Using random move fallback`);
 
         // Delegate to game to generate random valid move
         if (typeof game.getRandomMove === 'function') {
@@ -258,7 +267,7 @@ class LLMAdapter {
         }
 
         // Default fallback if game doesn't implement getRandomMove
-        console.warn(`[LLM P${playerId}] Game does not implement getRandomMove()`);
+        logger.warn('llm', () => `[LLM P${playerId}] Game does not implement getRandomMove()`);
         return { direction: 'stay', dropBomb: false };
     }
 
@@ -298,7 +307,7 @@ class LLMAdapter {
             });
 
             if (!response.ok) {
-                console.error(`[LLM Memory P${playerId}] API error ${response.status}`);
+                logger.error('llm', () => `[LLM Memory P${playerId}] API error ${response.status}`);
                 return;
             }
 
@@ -307,11 +316,11 @@ class LLMAdapter {
 
             if (content.memory) {
                 this.savePlayerMemory(playerId, content.memory);
-                console.log(`[LLM Memory P${playerId}] Updated: "${content.memory}"`);
+                logger.debug('llm', () => `[LLM Memory P${playerId}] Updated: "${content.memory}"`);
             }
 
         } catch (error) {
-            console.error(`[LLM Memory P${playerId}] Failed to update:`, error);
+            logger.error('llm', `[LLM Memory P${playerId}] Failed to update:`, error);
         }
     }
 }
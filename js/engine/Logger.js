@@ -0,0 +1,133 @@
+// Logger.js - Leveled, per-category debug logging
+// Disabled levels cost one integer compare: messages can be passed as
+// functions, which are only called (and their strings only built) when the
+// level is enabled.
+
+const LOG_LEVEL = Object.freeze({
+    off: 0,
+    error: 1,
+    warn: 2,
+    info: 3,
+    debug: 4
+});
+
+/**
+ * Logger - Console logger with a global level and per-category overrides
+ *
+ * Usage:
+ *   logger.debug('explode', () => `[EXPLODE] ${bomb.id} at (${bomb.x},${bomb.y})`);
+ *   if (logger.isEnabled('loot', 'debug')) { ...expensive diagnostics... }
+ *
+ * Categories used by the game: 'game', 'explode', 'loot', 'render', 'llm', 'engine'.
+ */
+class Logger {
+    /**
+     * @param {Object} options - See configure()
+     */
+    constructor(options = {}) {
+        this.level = LOG_LEVEL.info;
+        this.categories = {}; // category -> numeric level
+        this.sink = null; // Optional (level, category, text, args) -> void; default: console
+        this.configure(options);
+    }
+
+    /**
+     * Set levels
+     * @param {Object} options
+     * @param {string} options.level - Default level ('off', 'error', 'warn', 'info', 'debug')
+     * @param {Object} options.categories - {category: level} overrides
+     * @param {Function} options.sink - Replace console output
+     */
+    configure(options = {}) {
+        if (options.level !== undefined) {
+            this.level = Logger.parseLevel(options.level);
+        }
+        for (const [category, level] of Object.entries(options.categories || {})) {
+            this.categories[category] = Logger.parseLevel(level);
+        }
+        if (options.sink !== undefined) {
+            this.sink = options.sink;
+        }
+        return this;
+    }
+
+    /**
+     * Configure from a spec string: "debug" or "info,explode:debug,render:off"
+     * @param {string} spec
+     */
+    configureFromString(spec) {
+        const categories = {};
+        let level;
+        for (const part of String(spec).split(',').map(p => p.trim()).filter(Boolean)) {
+            const [name, value] = part.split(':');
+            if (value === undefined) {
+                level = name;
+            } else {
+                categories[name] = value;
+            }
+        }
+        return this.configure({ level, categories });
+    }
+
+    /**
+     * Numeric level for a name (unknown names fall back to info)
+     */
+    static parseLevel(level) {
+        if (typeof level === 'number') return level;
+        const value = LOG_LEVEL[String(level).toLowerCase()];
+        return value === undefined ? LOG_LEVEL.info : value;
+    }
+
+    /**
+     * Check if a level is enabled for a category
+     * @param {string} category
+     * @param {string} level
+     * @returns {boolean}
+     */
+    isEnabled(category, level) {
+        const threshold = this.categories[category];
+        return LOG_LEVEL[level] <= (threshold === undefined ? this.level : threshold);
+    }
+
+    /**
+     * Log a message (string, or function returning one) with extra console args
+     */
+    write(level, category, message, args) {
+        if (!this.isEnabled(category, level)) return;
+
+        const text = typeof message === 'function' ? message() : message;
+        if (this.sink) {
+            this.sink(level, category, text, args);
+        } else if (level === 'error') {
+            console.error(text, ...args);
+        } else if (level === 'warn') {
+            console.warn(text, ...args);
+        } else {
+            console.log(text, ...args);
+        }
+    }
+
+    error(category, message, ...args) {
+        this.write('error', category, message, args);
+    }
+
+    warn(category, message, ...args) {
+        this.write('warn', category, message, args);
+    }
+
+    info(category, message, ...args) {
+        this.write('info', category, message, args);
+    }
+
+    debug(category, message, ...args) {
+        this.write('debug', category, message, args);
+    }
+}
+
+// Shared instance used by the engine and games
+const logger = new Logger();
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { Logger, logger, LOG_LEVEL };
+}
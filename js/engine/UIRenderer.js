@@ -92,6 +92,12 @@ class BaseUIRenderer extends IUIRenderer {
      * @param {string} type - 'info', 'error', 'success'
      */
     log(message, type = 'info') {
+        // Pages with a LogStore (ui-init.js) keep a bounded, virtualized log
+        if (typeof logStore !== 'undefined') {
+            logStore.add(message, type);
+            return;
+        }
+
         const logContent = document.getElementById('logContent');
         if (!logContent) return;
 
@@ -90,13 +90,20 @@ class BombEntity {
     }
 
     /**
-     * Get all cells affected by explosion (without collision detection)
-     * Returns raw cross pattern - collision detection happens in engine
+     * Get all cells affected by explosion
+     * Without a board this is the raw cross pattern (collision detection
+     * happens in engine); with one it is the engine's blast footprint
+     * (stopped by hard and soft blocks, memoized by BlastFootprints)
      * @param {number} gridWidth
      * @param {number} gridHeight
+     * @param {BombervibeGrid} board - Optional terrain to collide with
      * @returns {Array<{x, y, direction, distance}>}
      */
-    getExplosionPattern(gridWidth, gridHeight) {
+    getExplosionPattern(gridWidth, gridHeight, board = null) {
+        if (board) {
+            return BlastFootprints.toCells(board.getBlastFootprint(this.x, this.y, this.range), board.width);
+        }
+
         const cells = [];
 
         // Center
@@ -231,12 +238,13 @@ class BombHelpers {
      * @param {number} range
      * @param {number} gridWidth
      * @param {number} gridHeight
+     * @param {BombervibeGrid} board - Optional terrain (blocks stop the blast)
      * @returns {Array<BombEntity>}
      */
-    static getBombsInExplosionRange(bombs, x, y, range, gridWidth, gridHeight) {
+    static getBombsInExplosionRange(bombs, x, y, range, gridWidth, gridHeight, board = null) {
         // Create a temporary bomb to get explosion pattern
         const tempBomb = new BombEntity('temp', 0, x, y, 1, range, 0);
-        const pattern = tempBomb.getExplosionPattern(gridWidth, gridHeight);
+        const pattern = tempBomb.getExplosionPattern(gridWidth, gridHeight, board);
 
         // Find bombs at any of these positions
         return bombs.filter(bomb =>
@@ -287,9 +295,10 @@ class BombHelpers {
      * @param {number} currentTurn
      * @param {number} gridWidth
      * @param {number} gridHeight
+     * @param {BombervibeGrid} board - Optional terrain (blocks stop the blast)
      * @returns {Array<{bomb: BombEntity, turn: number}>}
      */
-    static calculateChainReaction(bombs, triggerBomb, currentTurn, gridWidth, gridHeight) {
+    static calculateChainReaction(bombs, triggerBomb, currentTurn, gridWidth, gridHeight, board = null) {
         const explosionSchedule = [];
         const exploded = new Set();
         const queue = [{bomb: triggerBomb, turn: currentTurn}];
@@ -308,7 +317,8 @@ class BombHelpers {
                 bomb.y,
                 bomb.range,
                 gridWidth,
-                gridHeight
+                gridHeight,
+                board
             ).filter(b => !exploded.has(b.id));
 
             // Chain bombs explode on next turn
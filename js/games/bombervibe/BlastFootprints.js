@@ -0,0 +1,147 @@
+// BlastFootprints.js - Shared, memoized blast propagation
+// One implementation of the cross-shaped blast walk for explosions, danger
+// analysis and helpers; footprints are cached per (cell, range) and only
+// dropped when the terrain they depend on changes.
+
+// Ray order: up, down, left, right (same as resolveExplosions)
+const BLAST_DIRECTIONS = Object.freeze([
+    Object.freeze({ dx: 0, dy: -1, name: 'up' }),
+    Object.freeze({ dx: 0, dy: 1, name: 'down' }),
+    Object.freeze({ dx: -1, dy: 0, name: 'left' }),
+    Object.freeze({ dx: 1, dy: 0, name: 'right' })
+]);
+
+/**
+ * BlastFootprints - Footprint cache over a BombervibeGrid's terrain
+ *
+ * A footprint is {x, y, range, center, rays, stops}: `rays[d]` lists the
+ * cell indexes (y * width + x) a blast reaches in direction d, nearest
+ * first, and `stops[d]` is the soft block that ends the ray (-1 if the ray
+ * ran out of range or hit a hard block / the edge). Hard blocks and soft
+ * blocks are never part of a ray; bombs are, and callers that chain
+ * explosions stop at the first bomb themselves since bombs move every turn.
+ *
+ * The grid calls softBlockDestroyed() when a soft block is cleared, which
+ * drops just the footprints stopped by it. Any other terrain edit (world
+ * generation, editors) bumps the grid's terrainVersion and the whole cache
+ * is discarded on the next lookup.
+ */
+class BlastFootprints {
+    /**
+     * @param {BombervibeGrid} board - Terrain source
+     */
+    constructor(board) {
+        this.board = board;
+        this.cache = new Map(); // (cell, range) key -> footprint
+        this.dependents = new Map(); // soft block cell -> Set of keys stopped by it
+        this.terrainVersion = board.terrainVersion;
+        this.maxReach = Math.max(board.width, board.height); // Longer ranges reach no further
+    }
+
+    /**
+     * Blast footprint of a bomb at (x, y) with the given range
+     * @returns {Object} Footprint (shared - do not modify)
+     */
+    get(x, y, range) {
+        if (this.terrainVersion !== this.board.terrainVersion) {
+            this.clear();
+        }
+
+        const reach = Math.min(range, this.maxReach);
+        const key = (y * this.board.width + x) * (this.maxReach + 1) + reach;
+        let footprint = this.cache.get(key);
+        if (!footprint) {
+            footprint = BlastFootprints.walk(this.board, x, y, reach);
+            this.cache.set(key, footprint);
+            for (const stop of footprint.stops) {
+                if (stop < 0) continue;
+                if (!this.dependents.has(stop)) {
+                    this.dependents.set(stop, new Set());
+                }
+                this.dependents.get(stop).add(key);
+            }
+        }
+        return footprint;
+    }
+
+    /**
+     * Drop footprints whose rays ended at a soft block that is now gone
+     * @param {number} cell - Flat index of the cleared block
+     */
+    softBlockDestroyed(cell) {
+        const keys = this.dependents.get(cell);
+        if (!keys) return;
+
+        for (const key of keys) {
+            this.cache.delete(key);
+        }
+        this.dependents.delete(cell);
+    }
+
+    /**
+     * Forget every footprint
+     */
+    clear() {
+        this.cache.clear();
+        this.dependents.clear();
+        this.terrainVersion = this.board.terrainVersion;
+    }
+
+    /**
+     * Walk the four rays from (x, y) (uncached)
+     * @param {BombervibeGrid} board
+     * @param {number} x
+     * @param {number} y
+     * @param {number} range
+     * @param {Uint8Array} cleared - Optional per-cell flags: soft blocks to treat as already destroyed
+     * @returns {Object} Footprint
+     */
+    static walk(board, x, y, range, cleared = null) {
+        const { width, height, terrain } = board;
+        const rays = [];
+        const stops = [];
+
+        for (const { dx, dy } of BLAST_DIRECTIONS) {
+            const ray = [];
+            let stop = -1;
+            for (let i = 1; i <= range; i++) {
+                const cx = x + dx * i;
+                const cy = y + dy * i;
+                if (cx < 0 || cx >= width || cy < 0 || cy >= height) break;
+
+                const cell = cy * width + cx;
+                if (terrain[cell] === BombervibeConfig.CELL_TYPES.HARD) break;
+                if (terrain[cell] === BombervibeConfig.CELL_TYPES.SOFT && !(cleared && cleared[cell])) {
+                    stop = cell;
+                    break;
+                }
+                ray.push(cell);
+            }
+            rays.push(ray);
+            stops.push(stop);
+        }
+
+        return { x, y, range, center: y * width + x, rays, stops };
+    }
+
+    /**
+     * Cells of a footprint as {x, y, direction, distance}, center first
+     * @param {Object} footprint
+     * @param {number} width - Grid width (to decode cell indexes)
+     * @returns {Array<{x, y, direction, distance}>}
+     */
+    static toCells(footprint, width) {
+        const cells = [{ x: footprint.x, y: footprint.y, direction: 'center', distance: 0 }];
+        footprint.rays.forEach((ray, d) => {
+            ray.forEach((cell, i) => {
+                cells.push({ x: cell % width, y: Math.floor(cell / width), direction: BLAST_DIRECTIONS[d].name, distance: i + 1 });
+            });
+        });
+        return cells;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { BlastFootprints, BLAST_DIRECTIONS };
+}
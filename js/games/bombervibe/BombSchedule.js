@@ -0,0 +1,178 @@
+// BombSchedule.js - Turn-indexed timer wheel for bomb fuses
+// Bombs are bucketed by the turn they go off, so a turn with nothing due is
+// one Map lookup instead of a scan over every bomb on the board.
+
+/**
+ * BombSchedule - Bombs bucketed by explode turn
+ *
+ * A bomb goes off on turn `placedOnTurn + turnsUntilExplode`. takeDue(turn)
+ * removes and returns the bombs of every bucket up to `turn`, advancing a
+ * cursor one bucket per turn (or jumping straight over the occupied buckets
+ * after a long gap). Bombs scheduled for a turn the cursor has already
+ * passed are due at the next takeDue().
+ *
+ * The fuse keeps burning while a bomb is carried or thrown; the game calls
+ * reschedule() when it moves one and remove() when a chain reaction sets it
+ * off early.
+ */
+class BombSchedule {
+    /**
+     * @param {number} fromTurn - First turn takeDue() will be asked about
+     */
+    constructor(fromTurn = 0) {
+        this.clear(fromTurn);
+    }
+
+    /**
+     * Turn a bomb goes off by its own timer
+     * @param {Object} bomb - {placedOnTurn, turnsUntilExplode}
+     * @returns {number}
+     */
+    static explodeTurn(bomb) {
+        return (bomb.placedOnTurn || 0) + bomb.turnsUntilExplode;
+    }
+
+    /**
+     * Number of scheduled bombs
+     */
+    get size() {
+        return this.turnOf.size;
+    }
+
+    /**
+     * Check if a bomb is scheduled (not yet taken or removed)
+     */
+    has(bomb) {
+        return this.turnOf.has(bomb);
+    }
+
+    /**
+     * Schedule a bomb (moves it if it is already scheduled)
+     * @param {Object} bomb
+     * @param {number} turn - Explode turn (default: from the bomb's timer)
+     */
+    add(bomb, turn = BombSchedule.explodeTurn(bomb)) {
+        this.remove(bomb);
+
+        const at = Math.max(turn, this.cursor);
+        let bucket = this.buckets.get(at);
+        if (!bucket) {
+            bucket = new Set();
+            this.buckets.set(at, bucket);
+        }
+        bucket.add(bomb);
+        this.turnOf.set(bomb, at);
+    }
+
+    /**
+     * Move a bomb to a new explode turn (default: recomputed from its timer)
+     */
+    reschedule(bomb, turn = BombSchedule.explodeTurn(bomb)) {
+        if (this.turnOf.get(bomb) !== Math.max(turn, this.cursor)) {
+            this.add(bomb, turn);
+        }
+    }
+
+    /**
+     * Unschedule a bomb
+     * @returns {boolean} True if it was scheduled
+     */
+    remove(bomb) {
+        const turn = this.turnOf.get(bomb);
+        if (turn === undefined) return false;
+
+        const bucket = this.buckets.get(turn);
+        bucket.delete(bomb);
+        if (bucket.size === 0) {
+            this.buckets.delete(turn);
+        }
+        this.turnOf.delete(bomb);
+        return true;
+    }
+
+    /**
+     * Take every bomb due on or before a turn, earliest turn first
+     * @param {number} turn
+     * @returns {Array<Object>} Bombs, in scheduling order within a turn
+     */
+    takeDue(turn) {
+        const due = [];
+        if (turn < this.cursor) return due;
+
+        const take = (t) => {
+            const bucket = this.buckets.get(t);
+            if (!bucket) return;
+            for (const bomb of bucket) {
+                due.push(bomb);
+                this.turnOf.delete(bomb);
+            }
+            this.buckets.delete(t);
+        };
+
+        if (turn - this.cursor < this.buckets.size) {
+            for (let t = this.cursor; t <= turn; t++) take(t);
+        } else {
+            // Long gap: visit only the occupied buckets
+            const turns = [...this.buckets.keys()].filter(t => t <= turn).sort((a, b) => a - b);
+            turns.forEach(take);
+        }
+
+        this.cursor = turn + 1;
+        return due;
+    }
+
+    /**
+     * Bombs going off within k turns of a turn (not removed)
+     * @param {number} turn - Current turn
+     * @param {number} k - 0 = due this turn
+     * @returns {Array<Object>}
+     */
+    dueWithin(turn, k) {
+        const last = turn + k;
+        const turns = last - this.cursor < this.buckets.size ?
+            Array.from({ length: Math.max(0, last - this.cursor + 1) }, (_, i) => this.cursor + i) :
+            [...this.buckets.keys()].filter(t => t <= last).sort((a, b) => a - b);
+
+        const result = [];
+        for (const t of turns) {
+            const bucket = this.buckets.get(t);
+            if (bucket) result.push(...bucket);
+        }
+        return result;
+    }
+
+    /**
+     * Turns until a scheduled bomb goes off (0 = due now, null = not scheduled)
+     */
+    turnsLeft(bomb, turn) {
+        const at = this.turnOf.get(bomb);
+        return at === undefined ? null : Math.max(0, at - turn);
+    }
+
+    /**
+     * Reschedule from scratch (bombs edited behind the game's back)
+     * @param {Array<Object>} bombs
+     * @param {number} fromTurn - Earliest turn still to be taken
+     */
+    rebuild(bombs, fromTurn) {
+        this.clear(fromTurn);
+        for (const bomb of bombs) {
+            this.add(bomb);
+        }
+    }
+
+    /**
+     * Drop every bomb
+     * @param {number} fromTurn - Earliest turn still to be taken
+     */
+    clear(fromTurn = 0) {
+        this.buckets = new Map(); // explode turn -> Set of bombs
+        this.turnOf = new Map(); // bomb -> explode turn
+        this.cursor = fromTurn; // every turn before this has been taken
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { BombSchedule };
+}
@@ -0,0 +1,300 @@
+// BombervibeCanvasRenderer.js - Canvas rendering backend for Bombervibe
+// Draws the board onto one <canvas> instead of 143 cell divs, so large boards
+// and fast replays render without DOM layout. Scores, info panels and
+// thought bubbles are shared with BombervibeRenderer.
+
+// Player glow colors by id (NPCs use their own player.color)
+const CANVAS_PLAYER_COLORS = {
+    1: '#00ffff',
+    2: '#ff00ff',
+    3: '#ffff00',
+    4: '#00ff00'
+};
+
+const CANVAS_EXPLOSION_COLOR = '#ff6600';
+
+// Danger overlay outlines (same colors as .cell.danger / .cell.danger-soon)
+const CANVAS_DANGER_COLOR = 'rgba(255, 40, 40, 0.85)';
+const CANVAS_DANGER_SOON_COLOR = 'rgba(255, 160, 0, 0.5)';
+
+class BombervibeCanvasRenderer extends BombervibeRenderer {
+    constructor() {
+        super();
+        this.canvas = null;
+        this.ctx = null;
+        this.staticLayer = null; // Cached hard blocks + empty ground
+        this.staticLayerKey = null; // "cols x rows @ cellSize" the layer was drawn for
+        this.lastCells = null; // SpatialIndex of the last frame (click hit-testing)
+    }
+
+    /**
+     * Initialize renderer (IUIRenderer interface)
+     */
+    initialize(game, config = {}) {
+        super.initialize(game, config);
+        this.config = {
+            pixelRatio: config.pixelRatio || (typeof window !== 'undefined' && window.devicePixelRatio) || 1,
+            ...this.config
+        };
+    }
+
+    /**
+     * Create (or re-attach) the board canvas inside the grid element
+     * @returns {HTMLCanvasElement|null}
+     */
+    ensureCanvas(gridElement) {
+        if (this.canvas && this.canvas.parentNode === gridElement) {
+            return this.canvas;
+        }
+
+        // Drop DOM cells/players left by the DOM renderer
+        gridElement.querySelectorAll('.cell, .player-entity').forEach(el => el.remove());
+        this.cellNodes = null;
+
+        this.canvas = document.createElement('canvas');
+        this.canvas.className = 'board-canvas';
+        this.canvas.style.position = 'absolute';
+        this.canvas.style.left = '0';
+        this.canvas.style.top = '0';
+        this.canvas.style.width = '100%';
+        this.canvas.style.height = '100%';
+        this.canvas.style.cursor = 'pointer';
+        this.canvas.addEventListener('click', (e) => this.handleCanvasClick(e));
+        gridElement.insertBefore(this.canvas, gridElement.firstChild);
+
+        this.ctx = this.canvas.getContext('2d');
+        return this.canvas;
+    }
+
+    /**
+     * Render the board (replaces BombervibeRenderer's DOM cells)
+     */
+    renderGrid(gameState) {
+        const gridElement = this.getElement(this.config.gridId);
+        if (!gridElement) return;
+
+        this.lastGameState = gameState;
+
+        const canvas = this.ensureCanvas(gridElement);
+        const rows = gameState.grid.length;
+        const cols = rows > 0 ? gameState.grid[0].length : 0;
+        if (!canvas || !this.ctx || rows === 0) return;
+
+        // Match the backing store to the element size (sharp on HiDPI)
+        const ratio = this.config.pixelRatio;
+        const width = Math.max(1, Math.round(gridElement.clientWidth * ratio));
+        const height = Math.max(1, Math.round(gridElement.clientHeight * ratio));
+        if (canvas.width !== width || canvas.height !== height) {
+            canvas.width = width;
+            canvas.height = height;
+        }
+
+        const cellWidth = width / cols;
+        const cellHeight = height / rows;
+        const cells = SpatialIndex.fromGameState(gameState);
+        this.lastCells = cells;
+
+        const ctx = this.ctx;
+        const danger = this.getDangerMap();
+        ctx.drawImage(this.getStaticLayer(cols, rows, width, height), 0, 0);
+
+        for (let y = 0; y < rows; y++) {
+            for (let x = 0; x < cols; x++) {
+                const px = x * cellWidth;
+                const py = y * cellHeight;
+                const cellType = typeof gameState.grid[y][x] === 'number' ? gameState.grid[y][x] : BombervibeConfig.CELL_TYPES.EMPTY;
+
+                // Terrain that differs from the cached pattern (soft blocks, edited maps)
+                if (cellType !== this.patternTerrain(x, y)) {
+                    this.drawTerrain(ctx, cellType, px, py, cellWidth, cellHeight);
+                }
+
+                // Priority: Explosion > Bomb > Loot
+                if (cells.isExploding(x, y)) {
+                    ctx.fillStyle = CANVAS_EXPLOSION_COLOR;
+                    ctx.fillRect(px, py, cellWidth, cellHeight);
+                    this.drawEmoji(ctx, BombervibeConfig.RENDER.EXPLOSION_EMOJI, px, py, cellWidth, cellHeight, 0.7);
+                } else if (cells.bombAt(x, y)) {
+                    this.drawEmoji(ctx, BombervibeConfig.RENDER.BOMB_EMOJI, px, py, cellWidth, cellHeight, 0.7);
+                } else {
+                    const loot = cells.lootAt(x, y);
+                    if (loot && cellType === BombervibeConfig.CELL_TYPES.EMPTY) {
+                        this.drawEmoji(ctx, BombervibeConfig.RENDER.LOOT_EMOJIS[loot.type] || '?', px, py, cellWidth, cellHeight, 0.55);
+                    }
+                }
+
+                const blastTurn = danger ? danger.blastTurnAt(x, y) : Infinity;
+                if (blastTurn !== Infinity) {
+                    const inset = Math.max(1, Math.round(cellWidth * 0.04));
+                    ctx.strokeStyle = blastTurn <= 1 ? CANVAS_DANGER_COLOR : CANVAS_DANGER_SOON_COLOR;
+                    ctx.lineWidth = inset;
+                    ctx.strokeRect(px + inset / 2, py + inset / 2, cellWidth - inset, cellHeight - inset);
+                }
+            }
+        }
+
+        for (const player of gameState.players) {
+            if (player.alive) {
+                this.drawPlayer(ctx, player, cellWidth, cellHeight);
+            }
+        }
+
+        // Thought bubbles stay DOM overlays (positioned over the canvas)
+        if (this.llm) {
+            this.renderFloatingThoughts(gameState);
+        }
+    }
+
+    /**
+     * Grid element resized: redraw the canvas at the new size (players are
+     * drawn on it, so no DOM player entities are created)
+     */
+    handleGridResize() {
+        this.cellGeometry = null;
+        if (this.lastGameState) {
+            this.renderGrid(this.lastGameState);
+        }
+    }
+
+    /**
+     * Players are drawn by renderGrid (no DOM player entities over the canvas)
+     */
+    renderPlayers() {}
+
+    /**
+     * Terrain the static layer shows at a cell
+     */
+    patternTerrain(x, y) {
+        return BombervibeConfig.HARD_BLOCK_PATTERN(x, y) ? BombervibeConfig.CELL_TYPES.HARD : BombervibeConfig.CELL_TYPES.EMPTY;
+    }
+
+    /**
+     * Cached layer with the ground and the fixed hard-block pattern
+     * (OffscreenCanvas when available, else a detached canvas)
+     */
+    getStaticLayer(cols, rows, width, height) {
+        const key = `${cols}x${rows}@${width}x${height}`;
+        if (this.staticLayer && this.staticLayerKey === key) {
+            return this.staticLayer;
+        }
+
+        const layer = typeof OffscreenCanvas !== 'undefined'
+            ? new OffscreenCanvas(width, height)
+            : Object.assign(document.createElement('canvas'), { width, height });
+        const ctx = layer.getContext('2d');
+        const cellWidth = width / cols;
+        const cellHeight = height / rows;
+
+        for (let y = 0; y < rows; y++) {
+            for (let x = 0; x < cols; x++) {
+                this.drawTerrain(ctx, this.patternTerrain(x, y), x * cellWidth, y * cellHeight, cellWidth, cellHeight);
+            }
+        }
+
+        this.staticLayer = layer;
+        this.staticLayerKey = key;
+        return layer;
+    }
+
+    /**
+     * Draw one terrain tile (colors from BLOCK_TYPES)
+     */
+    drawTerrain(ctx, cellType, px, py, w, h) {
+        if (cellType === BombervibeConfig.CELL_TYPES.HARD) {
+            const hard = BLOCK_TYPES.HARD;
+            const border = Math.max(1, Math.round(Math.min(w, h) * 0.06));
+            ctx.fillStyle = hard.color;
+            ctx.fillRect(px, py, w, h);
+            ctx.fillStyle = hard.border.light;
+            ctx.fillRect(px, py, w, border);
+            ctx.fillRect(px, py, border, h);
+            ctx.fillStyle = hard.border.dark;
+            ctx.fillRect(px, py + h - border, w, border);
+            ctx.fillRect(px + w - border, py, border, h);
+        } else if (cellType === BombervibeConfig.CELL_TYPES.SOFT) {
+            const soft = BLOCK_TYPES.SOFT;
+            const mortar = Math.max(1, Math.round(h * 0.02));
+            ctx.fillStyle = soft.brickColor;
+            ctx.fillRect(px, py, w, h);
+
+            // Three brick courses with staggered joints
+            ctx.fillStyle = soft.mortarColor;
+            for (let row = 1; row < 3; row++) {
+                ctx.fillRect(px, py + (h * row) / 3, w, mortar);
+            }
+            for (let row = 0; row < 3; row++) {
+                const offset = row % 2 === 0 ? w / 2 : w / 4;
+                for (let jx = offset; jx < w; jx += w / 2) {
+                    ctx.fillRect(px + jx, py + (h * row) / 3, mortar, h / 3);
+                }
+            }
+        } else {
+            ctx.fillStyle = BLOCK_TYPES.EMPTY.color;
+            ctx.fillRect(px, py, w, h);
+        }
+    }
+
+    /**
+     * Draw an emoji centered in a cell
+     * @param {number} scale - Font size as a fraction of the cell height
+     */
+    drawEmoji(ctx, emoji, px, py, w, h, scale) {
+        ctx.font = `${Math.floor(h * scale)}px sans-serif`;
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'middle';
+        ctx.fillText(emoji, px + w / 2, py + h / 2);
+    }
+
+    /**
+     * Draw a player with its glow color and carried-bomb badge
+     */
+    drawPlayer(ctx, player, cellWidth, cellHeight) {
+        const px = player.x * cellWidth;
+        const py = player.y * cellHeight;
+        const color = (player.isNPC && player.color) || CANVAS_PLAYER_COLORS[player.id] || player.color || '#ffffff';
+        const emoji = player.npcEmoji || BombervibeConfig.RENDER.PLAYER_EMOJIS[player.id - 1] || '🙂';
+
+        ctx.save();
+        ctx.shadowColor = color;
+        ctx.shadowBlur = Math.min(cellWidth, cellHeight) * 0.3;
+        this.drawEmoji(ctx, emoji, px, py, cellWidth, cellHeight, 0.75);
+        ctx.restore();
+
+        if (player.carriedBomb) {
+            this.drawEmoji(ctx, BombervibeConfig.RENDER.BOMB_EMOJI, px + cellWidth * 0.3, py - cellHeight * 0.3, cellWidth, cellHeight, 0.35);
+        }
+    }
+
+    /**
+     * Open the prompt window of the player under the cursor
+     */
+    handleCanvasClick(e) {
+        if (!this.lastCells || typeof showPromptWindow !== 'function') return;
+
+        const rect = this.canvas.getBoundingClientRect();
+        const x = Math.floor(((e.clientX - rect.left) / rect.width) * this.lastCells.width);
+        const y = Math.floor(((e.clientY - rect.top) / rect.height) * this.lastCells.height);
+        if (x < 0 || x >= this.lastCells.width || y < 0 || y >= this.lastCells.height) return;
+
+        const player = this.lastCells.playerAt(x, y);
+        if (player) {
+            e.stopPropagation();
+            showPromptWindow(player.id);
+        }
+    }
+
+    /**
+     * Clear renderer (IUIRenderer interface)
+     */
+    clear() {
+        super.clear();
+        this.canvas = null;
+        this.ctx = null;
+        this.lastCells = null;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { BombervibeCanvasRenderer };
+}
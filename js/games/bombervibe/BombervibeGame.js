@@ -6,9 +6,8 @@ class BombervibeGame {
         // Store prompts manager
         this.prompts = prompts;
 
-        // Initialize RNG with seed (null = random)
-        this.rng = new SeededRNG(seed !== null ? seed : Date.now());
-        this.seed = this.rng.getSeed();
+        // Initialize RNG streams with seed (null = random)
+        this.seedRandom(seed !== null ? seed : Date.now());
 
         // Game options (merge with config defaults)
         this.options = {
@@ -19,10 +18,17 @@ class BombervibeGame {
             ...options
         };
 
-        // Game state
-        this.grid = [];
+        // Game state (terrain + bomb layer; `grid` is a legacy view of it)
+        // Per-game integer handles for bombs (shared with the board) and loot
+        this.bombRegistry = new HandleRegistry();
+        this.lootRegistry = new HandleRegistry();
+        this.board = new BombervibeGrid(BombervibeConfig.GRID_WIDTH, BombervibeConfig.GRID_HEIGHT, this.bombRegistry);
+        // Cell lookup of players and loot (bomb objects are looked up via board.getBomb)
+        this.spatial = new SpatialIndex(BombervibeConfig.GRID_WIDTH, BombervibeConfig.GRID_HEIGHT);
         this.players = [];
         this.bombs = [];
+        // Bombs bucketed by explode turn (see BombSchedule.js); mirrors this.bombs
+        this.bombSchedule = new BombSchedule();
         this.explosions = [];
         this.loot = [];
         this.turnCount = 0;
@@ -30,6 +36,24 @@ class BombervibeGame {
         this.currentPlayerIndex = 0;
         this.running = false;
         this.paused = false;
+        this.gameOverAnnounced = false;
+
+        // Bumped on every state change so renderers can skip unchanged frames
+        this.stateVersion = 0;
+
+        // Blast timing per cell, rebuilt lazily once per state version
+        this.dangerMap = null;
+        this.dangerMapVersion = -1;
+
+        // Readiness signals (initialized, turn, round, explosions-settled, game-over)
+        this.signals = new GameSignals();
+
+        // Structured gameplay events for tests/tools (see GameEvents.js);
+        // full prompt text is kept only in testing mode unless options.events says otherwise
+        this.events = new GameEvents({ promptText: this.options.testingMode === true, ...this.options.events });
+
+        // Time source for explosion lifetimes (shared with GameEngine via setClock)
+        this.clock = new GameClock();
 
         // Grid dimensions from config
         this.GRID_WIDTH = BombervibeConfig.GRID_WIDTH;
@@ -45,14 +69,78 @@ class BombervibeGame {
      * Initialize game (IGame interface)
      */
     initialize(config = {}) {
-        // Merge any runtime config
-        if (config.seed !== undefined) {
-            this.rng = new SeededRNG(config.seed);
-            this.seed = config.seed;
-        }
+        // Merge any runtime config; every stream restarts so the seed alone fixes the game
+        this.seedRandom(config.seed !== undefined ? config.seed : this.seed);
 
         this.createGrid();
         this.createPlayers();
+        this.markDirty();
+
+        this.signals.emit('initialized', { seed: this.seed });
+    }
+
+    /**
+     * Legacy grid view: rows of 0/1/2 with bomb ID strings on bomb cells
+     * Builds a fresh snapshot on every access - game code reads this.board
+     */
+    get grid() {
+        return this.board.toRows(this.bombs);
+    }
+
+    /**
+     * Record a state change (see getStateVersion)
+     */
+    markDirty() {
+        this.stateVersion++;
+    }
+
+    /**
+     * Danger map for the current state (built on first use after a change)
+     * @returns {DangerMap}
+     */
+    getDangerMap() {
+        if (!this.dangerMap) {
+            this.dangerMap = new DangerMap(this.GRID_WIDTH, this.GRID_HEIGHT);
+        }
+        if (this.dangerMapVersion !== this.stateVersion) {
+            this.dangerMap.build(this);
+            this.dangerMapVersion = this.stateVersion;
+        }
+        return this.dangerMap;
+    }
+
+    /**
+     * Record a gameplay event stamped with the current turn/round
+     * @param {string} type - One of GAME_EVENT_TYPES
+     * @param {Object} data - Event payload
+     */
+    recordEvent(type, data) {
+        this.events.record(type, data, { turn: this.turnCount, round: this.roundCount });
+    }
+
+    /**
+     * State version: changes whenever anything visible may have changed
+     * @returns {number}
+     */
+    getStateVersion() {
+        return this.stateVersion;
+    }
+
+    /**
+     * Check if an explosion is still within its animation time
+     * @returns {boolean}
+     */
+    isAnimating() {
+        const now = this.clock.now();
+        return this.explosions.some(exp => now - exp.timestamp < exp.duration);
+    }
+
+    /**
+     * Set time source (called by GameEngine)
+     * @param {GameClock} clock
+     */
+    setClock(clock) {
+        this.clock = clock;
     }
 
     /**
@@ -60,19 +148,15 @@ class BombervibeGame {
      */
     createGrid() {
         // Initialize empty grid
-        this.grid = [];
-        for (let y = 0; y < this.GRID_HEIGHT; y++) {
-            this.grid[y] = [];
-            for (let x = 0; x < this.GRID_WIDTH; x++) {
-                this.grid[y][x] = BombervibeConfig.CELL_TYPES.EMPTY;
-            }
-        }
+        this.board.clear();
+        this.lootRegistry.clear();
+        this.spatial.clear();
 
         // Place hard blocks using pattern from config
         for (let y = 0; y < this.GRID_HEIGHT; y++) {
             for (let x = 0; x < this.GRID_WIDTH; x++) {
                 if (BombervibeConfig.HARD_BLOCK_PATTERN(x, y)) {
-                    this.grid[y][x] = BombervibeConfig.CELL_TYPES.HARD;
+                    this.board.setTerrain(x, y, BombervibeConfig.CELL_TYPES.HARD);
                 }
             }
         }
@@ -80,10 +164,10 @@ class BombervibeGame {
         // Place random soft blocks (avoid safe zones)
         for (let y = 0; y < this.GRID_HEIGHT; y++) {
             for (let x = 0; x < this.GRID_WIDTH; x++) {
-                if (this.grid[y][x] === BombervibeConfig.CELL_TYPES.EMPTY) {
+                if (this.board.getTerrain(x, y) === BombervibeConfig.CELL_TYPES.EMPTY) {
                     const isSafe = BombervibeConfig.SAFE_ZONES.some(([sx, sy]) => sx === x && sy === y);
                     if (!isSafe && this.rng.random() < this.options.softBlockDensity) {
-                        this.grid[y][x] = BombervibeConfig.CELL_TYPES.SOFT;
+                        this.board.setTerrain(x, y, BombervibeConfig.CELL_TYPES.SOFT);
                     }
                 }
             }
@@ -91,13 +175,16 @@ class BombervibeGame {
 
         // Place initial loot if specified (for testing)
         for (const lootSpec of this.options.initialLoot) {
-            this.loot.push({
+            const loot = {
                 type: lootSpec.type || 'flash_radius',
                 x: lootSpec.x,
                 y: lootSpec.y,
                 spawnedRound: 0
-            });
+            };
+            this.lootRegistry.add(loot);
+            this.loot.push(loot);
         }
+        this.spatial.syncLoot(this.loot);
 
         // Place initial bombs if specified (for testing)
         for (const bombSpec of this.options.initialBombs) {
@@ -111,7 +198,8 @@ class BombervibeGame {
                 placedOnTurn: this.turnCount
             };
             this.bombs.push(bomb);
-            this.grid[bombSpec.y][bombSpec.x] = bomb.id;
+            this.board.placeBomb(bomb);
+            this.bombSchedule.add(bomb);
         }
     }
 
@@ -122,6 +210,19 @@ class BombervibeGame {
         this.players = BombervibeConfig.PLAYER_POSITIONS.map(pos => {
             return new Player(pos.id, pos.x, pos.y, pos.color, pos.name);
         });
+        for (const player of this.players) {
+            this.spatial.placePlayer(player);
+        }
+    }
+
+    /**
+     * Add a player mid-game (e.g. a spawned NPC)
+     * @param {Player} player
+     */
+    addPlayer(player) {
+        this.players.push(player);
+        this.spatial.placePlayer(player);
+        this.markDirty();
     }
 
     /**
@@ -149,16 +250,39 @@ class BombervibeGame {
         this.roundCount = 0;
         this.currentPlayerIndex = 0;
         this.bombs = [];
+        this.bombSchedule.clear();
         this.explosions = [];
         this.loot = [];
+        this.gameOverAnnounced = false;
+
+        // Don't hand the previous game's events to the next drain
+        this.events.clear();
 
         // Generate new random seed for variety (add random component to avoid same-millisecond resets)
-        this.rng = new SeededRNG(Date.now() + Math.floor(Math.random() * 1000000));
-        this.seed = this.rng.getSeed();
+        this.seedRandom(Date.now() + Math.floor(Math.random() * 1000000));
 
         this.initialize();
     }
 
+    /**
+     * Seed every random decision of the game from one seed
+     *
+     * Each system draws from its own named stream (see SeededRNG.fork), so
+     * a game is reproducible from the seed and the moves played, and extra
+     * draws in one system never shift another:
+     * - rng:     terrain generation
+     * - lootRng: loot drops, loot types and loot spread from dead players
+     * - moveRng: random fallback moves (getRandomMove)
+     * @param {number} seed
+     */
+    seedRandom(seed) {
+        this.seed = seed;
+        const root = new SeededRNG(seed);
+        this.rng = root.fork('terrain');
+        this.lootRng = root.fork('loot');
+        this.moveRng = root.fork('moves');
+    }
+
     /**
      * Get current player (IGame interface)
      */
@@ -191,9 +315,6 @@ class BombervibeGame {
         const previousPlayerIndex = this.currentPlayerIndex;
         this.currentPlayerIndex = (this.currentPlayerIndex + 1) % playerCount;
 
-        // Check if we wrapped around BEFORE skipping dead players
-        const wrappedAround = this.currentPlayerIndex <= previousPlayerIndex;
-
         // Skip dead players
         let attempts = 0;
         while (!this.getCurrentPlayer().alive && attempts < playerCount) {
@@ -201,17 +322,87 @@ class BombervibeGame {
             attempts++;
         }
 
+        // Check if we wrapped around, including while skipping dead players
+        // (otherwise rounds stop counting once the last player slot is dead)
+        const wrappedAround = this.currentPlayerIndex <= previousPlayerIndex;
+
         // Increment round count when we cycle back to player 1
         if (wrappedAround) {
             this.roundCount++;
         }
 
         this.turnCount++;
+        this.markDirty();
 
         // Update bombs every turn (not just every round)
         this.updateBombs();
         // Clean up old explosions
         this.updateExplosions();
+
+        this.signals.emit('turn', { turn: this.turnCount, round: this.roundCount });
+        if (wrappedAround) {
+            this.signals.emit('round', { round: this.roundCount });
+        }
+        if (!this.gameOverAnnounced && this.isGameOver()) {
+            this.gameOverAnnounced = true;
+            this.signals.emit('game-over', { winner: this.getWinner().getState() });
+        }
+    }
+
+    /**
+     * Resolve once turnCount reaches n
+     * @param {number} n - Turn number
+     * @returns {Promise<Object>}
+     */
+    whenTurn(n) {
+        return this.signals.waitFor('turn', e => e.turn >= n, () => this.turnCount >= n);
+    }
+
+    /**
+     * Resolve once roundCount reaches n
+     * @param {number} n - Round number
+     * @returns {Promise<Object>}
+     */
+    whenRound(n) {
+        return this.signals.waitFor('round', e => e.round >= n, () => this.roundCount >= n);
+    }
+
+    /**
+     * Resolve once no explosions are active
+     * Schedules a cleanup pass for when the longest-lived explosion expires,
+     * so this settles even while no turns are being played.
+     * @returns {Promise<Object>}
+     */
+    whenExplosionsSettled() {
+        if (this.explosions.length === 0) {
+            return Promise.resolve({ alreadyMet: true });
+        }
+
+        const settled = this.signals.waitFor('explosions-settled');
+        this.scheduleExplosionCleanup();
+        return settled;
+    }
+
+    /**
+     * Run updateExplosions() when the longest-lived explosion expires
+     */
+    scheduleExplosionCleanup() {
+        const now = this.clock.now();
+        const remaining = Math.max(...this.explosions.map(exp => exp.timestamp + exp.duration - now));
+        this.clock.setTimeout(() => {
+            this.updateExplosions();
+            if (this.explosions.length > 0) {
+                this.scheduleExplosionCleanup();
+            }
+        }, Math.max(0, remaining) + 1);
+    }
+
+    /**
+     * Resolve once the game is over
+     * @returns {Promise<Object>}
+     */
+    whenGameOver() {
+        return this.signals.waitFor('game-over', () => true, () => this.isGameOver());
     }
 
     /**
@@ -239,7 +430,7 @@ class BombervibeGame {
             if (move.dropBomb) {
                 const bombPlaced = this.playerPlaceBomb(playerId);
                 if (bombPlaced) {
-                    console.log(`[R${this.roundCount}] P${playerId} 💣 BOMB at (${player.x},${player.y})`);
+                    logger.info('game', () => `[R${this.roundCount}] P${playerId} 💣 BOMB at (${player.x},${player.y})`);
                 }
             }
 
@@ -247,6 +438,7 @@ class BombervibeGame {
             success = this.movePlayer(playerId, move.direction);
         }
 
+        this.markDirty();
         return success;
     }
 
@@ -274,11 +466,13 @@ class BombervibeGame {
                 return false;
         }
 
-        const moved = player.move(newX, newY, this.grid);
+        const moved = player.move(newX, newY, this.board);
 
         // Check for loot pickup after successful move
         if (moved) {
+            this.spatial.placePlayer(player);
             this.checkLootPickup(player);
+            this.markDirty();
         }
 
         return moved;
@@ -288,14 +482,43 @@ class BombervibeGame {
      * Check and process loot pickup
      */
     checkLootPickup(player) {
-        const lootIndex = this.loot.findIndex(l => l.x === player.x && l.y === player.y);
-        if (lootIndex !== -1) {
-            const loot = this.loot[lootIndex];
+        this.spatial.syncLoot(this.loot);
+        const loot = this.spatial.lootAt(player.x, player.y);
+        if (loot) {
             player.pickupLoot(loot.type);
-            this.loot.splice(lootIndex, 1);
+            this.removeLoot(loot);
+            this.recordEvent('loot-picked', { playerId: player.id, lootType: loot.type, lootId: loot.handle || null, x: loot.x, y: loot.y });
         }
     }
 
+    /**
+     * Remove a loot item from the board
+     */
+    removeLoot(loot) {
+        this.spatial.removeLoot(loot);
+        this.lootRegistry.remove(loot);
+        const index = this.loot.indexOf(loot);
+        if (index !== -1) {
+            this.loot.splice(index, 1);
+        }
+    }
+
+    /**
+     * Live bomb for a handle (placed or carried; null once it has exploded)
+     * @param {number} handle
+     */
+    getBomb(handle) {
+        return this.bombRegistry.get(handle);
+    }
+
+    /**
+     * Loot item for a handle (null once picked up or destroyed)
+     * @param {number} handle
+     */
+    getLoot(handle) {
+        return this.lootRegistry.get(handle);
+    }
+
     /**
      * Player places a bomb
      */
@@ -303,10 +526,13 @@ class BombervibeGame {
         const player = this.players.find(p => p.id === playerId);
         if (!player || !player.alive) return false;
 
-        const success = player.placeBomb(this.grid, this.bombs);
+        const success = player.placeBomb(this.board, this.bombs);
         if (success) {
             const bomb = this.bombs[this.bombs.length - 1];
             bomb.placedOnTurn = this.turnCount; // Use turns instead of rounds
+            this.bombSchedule.add(bomb);
+            this.recordEvent('bomb-placed', { playerId, bombId: bomb.id, x: bomb.x, y: bomb.y, range: bomb.range });
+            this.markDirty();
         }
         return success;
     }
@@ -327,11 +553,11 @@ class BombervibeGame {
         bomb.isBeingCarried = true;
         bomb.carriedByPlayerId = playerId;
 
-        if (this.grid[bomb.y][bomb.x] === bomb.id) {
-            this.grid[bomb.y][bomb.x] = 0;
-        }
+        this.board.removeBomb(bomb);
+        this.bombSchedule.reschedule(bomb); // The fuse keeps burning while carried
 
-        console.log(`[P${playerId}] Picked up bomb`);
+        logger.info('game', () => `[P${playerId}] Picked up bomb`);
+        this.markDirty();
         return true;
     }
 
@@ -358,8 +584,10 @@ class BombervibeGame {
         // Calculate throw trajectory with wrap-around
         let x = player.x;
         let y = player.y;
+        let steps = 0;
 
         while (true) {
+            steps++;
             x += dx;
             y += dy;
 
@@ -370,8 +598,7 @@ class BombervibeGame {
             else if (y >= this.GRID_HEIGHT) y = 0;
 
             // Check for obstacle
-            const cell = this.grid[y][x];
-            if (cell === BombervibeConfig.CELL_TYPES.SOFT || cell === BombervibeConfig.CELL_TYPES.HARD) {
+            if (!this.board.isPassable(x, y)) {
                 x -= dx;
                 y -= dy;
                 if (x < 0) x = this.GRID_WIDTH - 1;
@@ -381,9 +608,8 @@ class BombervibeGame {
                 break;
             }
 
-            // Safety check
-            const traveled = Math.abs(x - player.x) + Math.abs(y - player.y);
-            if (traveled > this.GRID_WIDTH + this.GRID_HEIGHT) break;
+            // Safety check - an obstacle-free line wraps forever, so stop after one lap
+            if (steps >= this.GRID_WIDTH + this.GRID_HEIGHT) break;
         }
 
         // Place bomb at final position
@@ -391,10 +617,12 @@ class BombervibeGame {
         bomb.y = y;
         bomb.isBeingCarried = false;
         bomb.carriedByPlayerId = null;
-        this.grid[y][x] = bomb.id;
+        this.board.placeBomb(bomb);
+        this.bombSchedule.reschedule(bomb);
         player.carriedBomb = null;
 
-        console.log(`[P${playerId}] Threw bomb to (${x}, ${y})`);
+        logger.info('game', () => `[P${playerId}] Threw bomb to (${x}, ${y})`);
+        this.markDirty();
         return true;
     }
 
@@ -402,201 +630,263 @@ class BombervibeGame {
      * Update bombs and trigger explosions
      */
     updateBombs() {
-        const bombsToExplode = [];
-
-        for (let i = this.bombs.length - 1; i >= 0; i--) {
-            const bomb = this.bombs[i];
-            const turnsSincePlaced = this.turnCount - bomb.placedOnTurn;
-
-            if (turnsSincePlaced >= bomb.turnsUntilExplode) {
-                // Handle carried bombs
-                if (bomb.isBeingCarried && bomb.carriedByPlayerId) {
-                    const carrier = this.players.find(p => p.id === bomb.carriedByPlayerId);
-                    if (carrier) {
-                        bomb.x = carrier.x;
-                        bomb.y = carrier.y;
-                        bomb.isBeingCarried = false;
-                        carrier.carriedBomb = null;
-                    }
-                }
+        // Bombs added to or dropped from this.bombs directly (tests, tools)
+        if (this.bombSchedule.size !== this.bombs.length) {
+            this.bombSchedule.rebuild(this.bombs, Math.min(this.bombSchedule.cursor, this.turnCount));
+        }
 
-                bombsToExplode.push(bomb);
-                this.bombs.splice(i, 1);
+        const due = this.bombSchedule.takeDue(this.turnCount);
+        if (due.length === 0) return;
+
+        for (const bomb of due) {
+            // Handle carried bombs
+            if (bomb.isBeingCarried && bomb.carriedByPlayerId) {
+                const carrier = this.players.find(p => p.id === bomb.carriedByPlayerId);
+                if (carrier) {
+                    bomb.x = carrier.x;
+                    bomb.y = carrier.y;
+                    bomb.isBeingCarried = false;
+                    carrier.carriedBomb = null;
+                }
             }
         }
 
-        for (const bomb of bombsToExplode) {
-            this.explodeBomb(bomb);
-        }
+        this.resolveExplosions(due);
+        this.markDirty();
     }
 
     /**
-     * Explode a bomb
+     * Turns until a bomb goes off (0 = this turn)
+     * @param {Object} bomb
+     * @returns {number}
      */
-    explodeBomb(bomb) {
-        console.log(`[EXPLODE] 💥 ${bomb.id} at (${bomb.x},${bomb.y}), range=${bomb.range}, owner=P${bomb.playerId}`);
+    getBombTurnsLeft(bomb) {
+        const turnsLeft = this.bombSchedule.turnsLeft(bomb, this.turnCount);
+        return turnsLeft !== null ? turnsLeft :
+            Math.max(0, bomb.turnsUntilExplode - (this.turnCount - bomb.placedOnTurn));
+    }
 
-        const explosionCells = [];
+    /**
+     * Bombs going off within k turns (0 = this turn), without scanning every bomb
+     * @param {number} k
+     * @returns {Array<Object>}
+     */
+    getBombsExplodingWithin(k) {
+        return this.bombSchedule.dueWithin(this.turnCount, k);
+    }
 
-        // Remove bomb from grid
-        if (this.grid[bomb.y][bomb.x] === bomb.id) {
-            this.grid[bomb.y][bomb.x] = 0;
-            console.log(`[EXPLODE] Removed ${bomb.id} from grid at (${bomb.x},${bomb.y})`);
-        } else {
-            console.log(`[EXPLODE] WARNING: ${bomb.id} not found in grid at (${bomb.x},${bomb.y}), found: ${this.grid[bomb.y][bomb.x]}`);
-        }
-
-        // Decrement player's active bomb count
-        const player = this.players.find(p => p.id === bomb.playerId);
-        if (player) {
-            const oldCount = player.activeBombs;
-            player.activeBombs = Math.max(0, player.activeBombs - 1);
-            console.log(`[EXPLODE] P${bomb.playerId} activeBombs: ${oldCount} → ${player.activeBombs}`);
-            if (player.activeBombs === 0) {
-                player.hasBomb = false; // Keep for backward compatibility
-                player.bombX = null;
-                player.bombY = null;
-            }
+    /**
+     * Explode every bomb due this turn, plus the chain reactions they set off
+     *
+     * All blasts of a turn are simultaneous: every ray is cast against the
+     * terrain and bombs as they were at the start of the turn (a soft block
+     * stops each blast that reaches it, even if another blast breaks it this
+     * turn). The chain is expanded with a worklist, the blast cells of all
+     * bombs are unioned into one per-cell map (which bomb reached the cell
+     * first, for credit), and blocks, loot and players are then resolved in
+     * a single pass each.
+     * @param {Array<Object>} due - Bombs whose timer ran out (already off the schedule)
+     */
+    resolveExplosions(due) {
+        const width = this.GRID_WIDTH;
+        const size = width * this.GRID_HEIGHT;
+        if (!this.blastOwners || this.blastOwners.length !== size) {
+            this.blastOwners = new Int32Array(size); // cell -> 1 + worklist index of the first bomb to reach it (0 = no blast)
         }
+        const blastOwners = this.blastOwners;
+
+        const worklist = due.slice();
+        const chainedFrom = new Map(); // bomb -> bomb whose blast set it off
+        const affected = []; // blast cells in first-reached order
+        const brokenBlocks = new Map(); // soft block cell -> worklist index of the first bomb to reach it
+        const blastSizes = []; // cells per bomb, by worklist index
+
+        for (let i = 0; i < worklist.length; i++) {
+            const bomb = worklist[i];
+            const footprint = this.board.getBlastFootprint(bomb.x, bomb.y, bomb.range);
+            let cells = 1;
+
+            if (blastOwners[footprint.center] === 0) {
+                blastOwners[footprint.center] = i + 1;
+                affected.push(footprint.center);
+            }
 
-        // Center explosion
-        explosionCells.push({ x: bomb.x, y: bomb.y });
-
-        // Explosion in 4 directions
-        const directions = [
-            { dx: 0, dy: -1, name: 'up' }, // Up
-            { dx: 0, dy: 1, name: 'down' },  // Down
-            { dx: -1, dy: 0, name: 'left' }, // Left
-            { dx: 1, dy: 0, name: 'right' }   // Right
-        ];
+            for (let d = 0; d < footprint.rays.length; d++) {
+                let hitBomb = false;
 
-        let blocksDestroyed = 0;
-        let lootSpawned = 0;
-
-        for (const dir of directions) {
-            for (let i = 1; i <= bomb.range; i++) {
-                const x = bomb.x + dir.dx * i;
-                const y = bomb.y + dir.dy * i;
+                for (const cell of footprint.rays[d]) {
+                    cells++;
+                    if (blastOwners[cell] === 0) {
+                        blastOwners[cell] = i + 1;
+                        affected.push(cell);
+                    }
 
-                if (x < 0 || x >= this.GRID_WIDTH || y < 0 || y >= this.GRID_HEIGHT) {
-                    break;
+                    // Chain reaction: bombs stop the ray whether or not they are already going off
+                    const x = cell % width;
+                    const y = (cell - x) / width;
+                    if (this.board.hasBomb(x, y)) {
+                        const chainBomb = this.board.getBomb(x, y);
+                        // Still scheduled = not already going off; it goes off now instead
+                        if (chainBomb && this.bombSchedule.remove(chainBomb)) {
+                            logger.debug('explode', () => `[EXPLODE] ⚡ Chain reaction: ${bomb.id} → ${chainBomb.id}`);
+                            worklist.push(chainBomb);
+                            chainedFrom.set(chainBomb, bomb);
+                        }
+                        hitBomb = true;
+                        break;
+                    }
                 }
 
-                const cell = this.grid[y][x];
-
-                // Hard block stops explosion
-                if (cell === BombervibeConfig.CELL_TYPES.HARD) {
-                    break;
+                // Soft block stops the ray and breaks (not a blast cell, so loot spawned there is safe)
+                const stop = footprint.stops[d];
+                if (!hitBomb && stop >= 0 && !brokenBlocks.has(stop)) {
+                    brokenBlocks.set(stop, i);
                 }
+            }
 
-                // Soft block stops explosion and gets destroyed
-                if (cell === BombervibeConfig.CELL_TYPES.SOFT) {
-                    // Don't add soft block to explosion cells (it blocks the blast)
-                    this.grid[y][x] = BombervibeConfig.CELL_TYPES.EMPTY;
-                    blocksDestroyed++;
-                    if (player) {
-                        player.addScore(BombervibeConfig.POINTS_PER_BLOCK);
-                    }
+            blastSizes.push(cells);
+        }
 
-                    // Spawn loot (safe from explosion since not in explosionCells)
-                    // Use Math.random() instead of seeded RNG (seeded RNG is biased)
-                    if (Math.random() < BombervibeConfig.LOOT_DROP_CHANCE) {
-                        this.spawnLootAt(x, y);
-                        lootSpawned++;
-                    }
-                    break;
+        // Take the bombs off the board and give their owners the bombs back
+        const owners = worklist.map(bomb => this.players.find(p => p.id === bomb.playerId) || null);
+        worklist.forEach((bomb, i) => {
+            logger.debug('explode', () => `[EXPLODE] 💥 ${bomb.id} at (${bomb.x},${bomb.y}), range=${bomb.range}, owner=P${bomb.playerId}`);
+            if (!this.board.removeBomb(bomb)) {
+                logger.warn('explode', () => `[EXPLODE] WARNING: ${bomb.id} not found in grid at (${bomb.x},${bomb.y}), found handle: ${this.board.bombAt(bomb.x, bomb.y)}`);
+            }
+            this.bombRegistry.remove(bomb);
+
+            const player = owners[i];
+            if (player) {
+                const oldCount = player.activeBombs;
+                player.activeBombs = Math.max(0, player.activeBombs - 1);
+                logger.debug('explode', () => `[EXPLODE] P${bomb.playerId} activeBombs: ${oldCount} → ${player.activeBombs}`);
+                if (player.activeBombs === 0) {
+                    player.hasBomb = false; // Keep for backward compatibility
+                    player.bombX = null;
+                    player.bombY = null;
                 }
+            }
+        });
+        const detonated = new Set(worklist);
+        this.bombs = this.bombs.filter(bomb => !detonated.has(bomb));
 
-                // Add to explosion cells (empty spaces, bombs, players)
-                explosionCells.push({ x, y });
+        // Break soft blocks (credited to the first bomb that reached them)
+        let lootSpawned = 0;
+        for (const [cell, i] of brokenBlocks) {
+            const x = cell % width;
+            const y = (cell - x) / width;
+            this.board.setTerrain(x, y, BombervibeConfig.CELL_TYPES.EMPTY);
+            if (owners[i]) {
+                owners[i].addScore(BombervibeConfig.POINTS_PER_BLOCK);
+            }
 
-                // Chain reaction
-                if (typeof cell === 'string' && cell.startsWith('bomb')) {
-                    const chainBomb = this.bombs.find(b => b.id === cell);
-                    if (chainBomb) {
-                        console.log(`[EXPLODE] ⚡ Chain reaction: ${bomb.id} → ${chainBomb.id}`);
-                        this.bombs = this.bombs.filter(b => b.id !== cell);
-                        this.explodeBomb(chainBomb);
-                    }
-                    break;
-                }
+            if (this.lootRng.random() < BombervibeConfig.LOOT_DROP_CHANCE) {
+                this.spawnLootAt(x, y);
+                lootSpawned++;
             }
         }
 
-        console.log(`[EXPLODE] Destroyed ${blocksDestroyed} blocks, spawned ${lootSpawned} loot items`);
-
-        // Check for player hits
-        let playersHit = 0;
-        for (const cell of explosionCells) {
-            for (const p of this.players) {
-                if (p.alive && p.x === cell.x && p.y === cell.y) {
-                    console.log(`[EXPLODE] ☠️  P${p.id} killed at (${p.x},${p.y})`);
-                    p.die();
-                    playersHit++;
-                    if (player && player.id !== p.id) {
-                        player.addScore(BombervibeConfig.POINTS_PER_KILL);
-                    }
-                    this.spreadLoot(p.bombRange);
-                }
+        // Destroy loot caught in the blast
+        const lootBefore = this.loot.length;
+        this.loot = this.loot.filter(loot => {
+            if (blastOwners[loot.y * width + loot.x] === 0 ||
+                this.board.getTerrain(loot.x, loot.y) === BombervibeConfig.CELL_TYPES.SOFT) {
+                return true;
             }
+            this.lootRegistry.remove(loot);
+            return false;
+        });
+        if (this.loot.length !== lootBefore) {
+            this.spatial.syncLoot(this.loot);
         }
 
-        // Destroy loot in explosion
-        let lootDestroyed = 0;
-        for (const cell of explosionCells) {
-            const lootIndex = this.loot.findIndex(l => l.x === cell.x && l.y === cell.y);
-            if (lootIndex !== -1 && this.grid[cell.y][cell.x] !== BombervibeConfig.CELL_TYPES.SOFT) {
-                this.loot.splice(lootIndex, 1);
-                lootDestroyed++;
+        // Kill players caught in the blast (credited to the first bomb that reached them)
+        let playersHit = 0;
+        let lootToSpread = 0;
+        for (const p of this.players) {
+            if (!p.alive) continue;
+            const owner = blastOwners[p.y * width + p.x];
+            if (owner === 0) continue;
+
+            const bomb = worklist[owner - 1];
+            logger.info('explode', () => `[EXPLODE] ☠️  P${p.id} killed at (${p.x},${p.y})`);
+            p.die();
+            this.spatial.removePlayer(p);
+            this.recordEvent('player-killed', { playerId: p.id, x: p.x, y: p.y, bombId: bomb.id, ownerId: bomb.playerId });
+            playersHit++;
+            if (owners[owner - 1] && owners[owner - 1].id !== p.id) {
+                owners[owner - 1].addScore(BombervibeConfig.POINTS_PER_KILL);
             }
+            lootToSpread += p.bombRange;
+        }
+        if (lootToSpread > 0) {
+            this.spreadLoot(lootToSpread);
         }
 
-        console.log(`[EXPLODE] Blast radius: ${explosionCells.length} cells, ${playersHit} players killed, ${lootDestroyed} loot destroyed`);
+        logger.debug('explode', () => `[EXPLODE] ${worklist.length} bombs: ${affected.length} cells, ${brokenBlocks.size} blocks destroyed, ${lootSpawned} loot spawned, ${lootBefore - this.loot.length} loot destroyed, ${playersHit} players killed`);
 
-        // Store explosion for visual
-        const explosion = {
-            cells: explosionCells,
-            timestamp: Date.now(),
+        // One visual for the whole turn's blast
+        this.explosions.push({
+            cells: affected.map(cell => ({ x: cell % width, y: Math.floor(cell / width) })),
+            timestamp: this.clock.now(),
             duration: BombervibeConfig.EXPLOSION_DURATION
-        };
-        this.explosions.push(explosion);
-        console.log(`[EXPLODE] Added explosion to array, now ${this.explosions.length} explosions active`);
+        });
+        worklist.forEach((bomb, i) => {
+            const parent = chainedFrom.get(bomb);
+            this.recordEvent('bomb-exploded', {
+                playerId: bomb.playerId,
+                bombId: bomb.id,
+                x: bomb.x,
+                y: bomb.y,
+                range: bomb.range,
+                cells: blastSizes[i],
+                chainedFrom: parent ? parent.id : null
+            });
+        });
+
+        for (const cell of affected) {
+            blastOwners[cell] = 0;
+        }
     }
 
     /**
      * Spawn loot at position
      */
     spawnLootAt(x, y) {
-        const hasLoot = this.loot.some(l => l.x === x && l.y === y);
-        if (hasLoot) return;
+        this.spatial.syncLoot(this.loot);
+        if (this.spatial.lootAt(x, y)) return;
 
-        // Use Math.random() for loot selection (seeded RNG is biased)
         const types = BombervibeConfig.LOOT_TYPES;
         const totalWeight = types.reduce((sum, item) => sum + item.weight, 0);
-        const roll = Math.random() * totalWeight;
+        const roll = this.lootRng.random() * totalWeight;
 
-        console.log(`[LOOT DEBUG] types=${JSON.stringify(types)}, totalWeight=${totalWeight}, roll=${roll}`);
+        logger.debug('loot', () => `[LOOT DEBUG] types=${JSON.stringify(types)}, totalWeight=${totalWeight}, roll=${roll}`);
 
         let cumulative = 0;
         let selectedType = types[types.length - 1].type;
 
         for (const item of types) {
             cumulative += item.weight;
-            console.log(`[LOOT DEBUG] checking ${item.type}: cumulative=${cumulative}, roll=${roll}, selected=${roll < cumulative}`);
+            logger.debug('loot', () => `[LOOT DEBUG] checking ${item.type}: cumulative=${cumulative}, roll=${roll}, selected=${roll < cumulative}`);
             if (roll < cumulative) {
                 selectedType = item.type;
                 break;
             }
         }
 
-        console.log(`[LOOT] Spawned ${selectedType} at (${x},${y})`);
+        logger.debug('loot', () => `[LOOT] Spawned ${selectedType} at (${x},${y})`);
 
-        this.loot.push({
+        const loot = {
             type: selectedType,
             x: x,
             y: y,
             spawnedRound: this.roundCount
-        });
+        };
+        this.lootRegistry.add(loot);
+        this.loot.push(loot);
+        this.spatial.addLoot(loot);
+        this.recordEvent('loot-spawned', { lootType: selectedType, lootId: loot.handle, x, y });
     }
 
     /**
@@ -604,12 +894,12 @@ class BombervibeGame {
      */
     spreadLoot(count) {
         const clearedPositions = [];
+        this.spatial.syncLoot(this.loot);
+        this.spatial.syncPlayers(this.players);
         for (let y = 0; y < this.GRID_HEIGHT; y++) {
             for (let x = 0; x < this.GRID_WIDTH; x++) {
-                if (this.grid[y][x] === 0) {
-                    const hasLoot = this.loot.some(l => l.x === x && l.y === y);
-                    const hasPlayer = this.players.some(p => p.alive && p.x === x && p.y === y);
-                    if (!hasLoot && !hasPlayer) {
+                if (this.board.isPassable(x, y) && !this.board.hasBomb(x, y)) {
+                    if (!this.spatial.lootAt(x, y) && !this.spatial.hasPlayerAt(x, y)) {
                         clearedPositions.push({ x, y });
                     }
                 }
@@ -618,7 +908,7 @@ class BombervibeGame {
 
         const itemsToSpawn = Math.min(count, clearedPositions.length);
         for (let i = 0; i < itemsToSpawn; i++) {
-            const pos = this.rng.choice(clearedPositions);
+            const pos = this.lootRng.choice(clearedPositions);
             this.spawnLootAt(pos.x, pos.y);
             const index = clearedPositions.findIndex(p => p.x === pos.x && p.y === pos.y);
             if (index !== -1) {
@@ -631,18 +921,22 @@ class BombervibeGame {
      * Clean up old explosions
      */
     updateExplosions() {
-        const now = Date.now();
+        const now = this.clock.now();
         const before = this.explosions.length;
         this.explosions = this.explosions.filter(exp => {
             const age = now - exp.timestamp;
             const keep = age < exp.duration;
             if (!keep) {
-                console.log(`[UPDATE EXP] Removing explosion age=${age}ms, duration=${exp.duration}ms`);
+                logger.debug('explode', () => `[UPDATE EXP] Removing explosion age=${age}ms, duration=${exp.duration}ms`);
             }
             return keep;
         });
         if (this.explosions.length !== before) {
-            console.log(`[UPDATE EXP] Cleaned explosions: ${before} → ${this.explosions.length}`);
+            this.markDirty();
+            logger.debug('explode', () => `[UPDATE EXP] Cleaned explosions: ${before} → ${this.explosions.length}`);
+            if (this.explosions.length === 0) {
+                this.signals.emit('explosions-settled', { turn: this.turnCount });
+            }
         }
     }
 
@@ -673,11 +967,10 @@ class BombervibeGame {
      */
     getGameState() {
         return {
-            grid: this.grid.map(row => [...row]),
+            grid: this.board.toRows(this.bombs),
             players: this.players.map(p => p.getState()),
             bombs: this.bombs.map(b => {
-                const turnsSincePlaced = this.turnCount - b.placedOnTurn;
-                const turnsRemaining = Math.max(0, b.turnsUntilExplode - turnsSincePlaced);
+                const turnsRemaining = this.getBombTurnsLeft(b);
                 return {
                     id: b.id,
                     x: b.x,
@@ -736,11 +1029,32 @@ STRATEGY: ${playerStrategy}
 
 Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,"thought":"why (50 words max)"}`;
 
-        return {
+        const prompt = {
             system: this.prompts.getSystemPrompt(),
             user: userPrompt,
             responseFormat: this.prompts.getTacticalResponseFormat()
         };
+        this.recordPrompt(playerId, prompt);
+        return prompt;
+    }
+
+    /**
+     * Record a 'prompt-built' event (prompt text only when events.promptText
+     * is on, e.g. testing mode; otherwise lengths and hashes)
+     */
+    recordPrompt(playerId, prompt) {
+        const event = {
+            playerId,
+            systemLength: prompt.system.length,
+            userLength: prompt.user.length,
+            systemHash: GameEvents.hashText(prompt.system),
+            userHash: GameEvents.hashText(prompt.user)
+        };
+        if (this.events.promptText) {
+            event.system = prompt.system;
+            event.user = prompt.user;
+        }
+        this.recordEvent('prompt-built', event);
     }
 
     /**
@@ -768,6 +1082,9 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
         }
         gridStr += '\n|------|---|---|---|---|---|---|---|\n';
 
+        // One pass over the snapshot's entities, then O(1) per cell
+        const cells = SpatialIndex.fromGameState(gameState);
+
         for (let dy = -VISION_RADIUS; dy <= VISION_RADIUS; dy++) {
             const y = player.y + dy;
             const rank = (y >= 0 && y < this.GRID_HEIGHT) ? (11 - y) : '❌';
@@ -780,14 +1097,15 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
                     continue;
                 }
 
-                const cell = gameState.grid[y][x];
+                const cell = this.board.getTerrain(x, y);
+                const playerHere = cells.playerAt(x, y);
                 let cellContent = (x === player.x && y === player.y) ? '🎯' :
-                    gameState.players.find(p => p.alive && p.x === x && p.y === y) ? `P${gameState.players.find(p => p.alive && p.x === x && p.y === y).id}` : '';
+                    playerHere ? `P${playerHere.id}` : '';
 
-                const bombHere = gameState.bombs.find(b => b.x === x && b.y === y);
+                const bombHere = cells.bombAt(x, y);
                 if (bombHere) cellContent = cellContent ? `${cellContent}💣${bombHere.turnsUntilExplode}` : `💣${bombHere.turnsUntilExplode}`;
 
-                const lootHere = gameState.loot && gameState.loot.find(l => l.x === x && l.y === y);
+                const lootHere = cells.lootAt(x, y);
                 if (lootHere && !cellContent) cellContent = cell === 1 ? '🟫⚡' : '⚡';
                 else if (!cellContent) cellContent = cell === 0 ? '·' : cell === 1 ? '🟫' : cell === 2 ? '⬛' : '?';
 
@@ -813,7 +1131,7 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
 
         for (const {dir, dx, dy} of directions) {
             const x = player.x + dx, y = player.y + dy;
-            if (x >= 0 && x < this.GRID_WIDTH && y >= 0 && y < this.GRID_HEIGHT && gameState.grid[y][x] === BombervibeConfig.CELL_TYPES.SOFT) {
+            if (this.board.inBounds(x, y) && this.board.getTerrain(x, y) === BombervibeConfig.CELL_TYPES.SOFT) {
                 adjacentBlocks.push(dir);
             }
         }
@@ -844,8 +1162,8 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
             if (dir === 'stay') { validMoves.push(`stay@${this.coordsToChess(x,y)}`); continue; }
             if (x < 0 || x >= this.GRID_WIDTH || y < 0 || y >= this.GRID_HEIGHT) { blockedMoves.push(`${dir}:OOB`); continue; }
 
-            const cell = gameState.grid[y][x];
-            if (cell === 0 || (typeof cell === 'string' && cell.startsWith('bomb'))) validMoves.push(`${dir}→${this.coordsToChess(x,y)}`);
+            const cell = this.board.getTerrain(x, y);
+            if (cell === BombervibeConfig.CELL_TYPES.EMPTY) validMoves.push(`${dir}→${this.coordsToChess(x,y)}`);
             else blockedMoves.push(`${dir}:${cell===1?'soft':cell===2?'hard':'?'}`);
         }
 
@@ -862,25 +1180,17 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
     }
 
     /**
-     * Check if position will be lethal
+     * Check if a cell is a hard block (out of bounds is not)
+     */
+    isHardBlock(x, y) {
+        return this.board.inBounds(x, y) && this.board.getTerrain(x, y) === BombervibeConfig.CELL_TYPES.HARD;
+    }
+
+    /**
+     * Check if position will be lethal (blast within afterTurns, chain reactions included)
      */
     isPositionLethal(x, y, afterTurns = 1) {
-        for (const bomb of this.bombs) {
-            const turnsLeft = Math.max(0, bomb.turnsUntilExplode - (this.turnCount - bomb.placedOnTurn));
-            if (bomb.x === x && bomb.y === y && turnsLeft <= 3) return true;
-            if (turnsLeft <= afterTurns) {
-                for (const dir of [{dx:0,dy:-1},{dx:0,dy:1},{dx:-1,dy:0},{dx:1,dy:0}]) {
-                    for (let i = 1; i <= bomb.range; i++) {
-                        const bx = bomb.x + dir.dx * i, by = bomb.y + dir.dy * i;
-                        const blockX = bomb.x + dir.dx * (i-1), blockY = bomb.y + dir.dy * (i-1);
-                        if (i > 1 && this.grid[blockY]?.[blockX] === BombervibeConfig.CELL_TYPES.HARD) break;
-                        if (bx === x && by === y) return true;
-                        if (this.grid[by]?.[bx] === BombervibeConfig.CELL_TYPES.HARD) break;
-                    }
-                }
-            }
-        }
-        return false;
+        return this.getDangerMap().isLethal(x, y, afterTurns);
     }
 
     /**
@@ -890,16 +1200,14 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
         const player = this.players.find(p => p.id === playerId);
         if (!player || !player.alive) return [];
 
+        const danger = this.getDangerMap();
         const safeMoves = [];
         for (const dir of ['up','down','left','right','stay']) {
             let x = player.x, y = player.y;
             if (dir === 'up') y--; else if (dir === 'down') y++; else if (dir === 'left') x--; else if (dir === 'right') x++;
             if (dir !== 'stay' && (x < 0 || x >= this.GRID_WIDTH || y < 0 || y >= this.GRID_HEIGHT)) continue;
-            if (dir !== 'stay') {
-                const cell = this.grid[y][x];
-                if (cell === BombervibeConfig.CELL_TYPES.SOFT || cell === BombervibeConfig.CELL_TYPES.HARD) continue;
-            }
-            if (!this.isPositionLethal(x, y, 1)) safeMoves.push({direction:dir,x,y,safe:true});
+            if (dir !== 'stay' && !this.board.isPassable(x, y)) continue;
+            if (!danger.isLethal(x, y, 1)) safeMoves.push({direction:dir,x,y,safe:true});
         }
         return safeMoves;
     }
@@ -911,16 +1219,14 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
         const player = this.players.find(p => p.id === playerId);
         if (!player || !player.alive) return [];
 
+        const danger = this.getDangerMap();
         const dangerousMoves = [];
         for (const dir of ['up','down','left','right','stay']) {
             let x = player.x, y = player.y;
             if (dir === 'up') y--; else if (dir === 'down') y++; else if (dir === 'left') x--; else if (dir === 'right') x++;
             if (dir !== 'stay' && (x < 0 || x >= this.GRID_WIDTH || y < 0 || y >= this.GRID_HEIGHT)) continue;
-            if (dir !== 'stay') {
-                const cell = this.grid[y][x];
-                if (cell === BombervibeConfig.CELL_TYPES.SOFT || cell === BombervibeConfig.CELL_TYPES.HARD) continue;
-            }
-            if (this.isPositionLethal(x, y, 1)) dangerousMoves.push({direction:dir,x,y,lethal:true});
+            if (dir !== 'stay' && !this.board.isPassable(x, y)) continue;
+            if (danger.isLethal(x, y, 1)) dangerousMoves.push({direction:dir,x,y,lethal:true});
         }
         return dangerousMoves;
     }
@@ -946,20 +1252,19 @@ Respond with JSON: {"direction":"up|down|left|right|stay","dropBomb":true|false,
             else if (dir === 'left') x--;
             else if (dir === 'right') x++;
 
-            if (dir === 'stay' || (x >= 0 && x < this.GRID_WIDTH && y >= 0 && y < this.GRID_HEIGHT)) {
-                const cell = dir === 'stay' ? 0 : gameState.grid[y][x];
-                if (cell === 0 || (typeof cell === 'string' && cell.startsWith('bomb'))) {
+            if (dir === 'stay' || this.board.inBounds(x, y)) {
+                if (dir === 'stay' || this.board.isPassable(x, y)) {
                     validMoves.push({
                         action: 'move',
                         direction: dir,
-                        dropBomb: !player.hasBomb && Math.random() > 0.7
+                        dropBomb: !player.hasBomb && this.moveRng.random() > 0.7
                     });
                 }
             }
         }
 
         if (validMoves.length > 0) {
-            return validMoves[Math.floor(Math.random() * validMoves.length)];
+            return this.moveRng.choice(validMoves);
         }
 
         return { action: 'move', direction: 'stay', dropBomb: false };
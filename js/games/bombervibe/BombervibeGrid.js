@@ -0,0 +1,164 @@
+// BombervibeGrid.js - Flat typed-array board storage
+// Terrain (empty/soft/hard) lives in a Uint8Array and bombs in a parallel
+// Int32Array of bomb handles, both indexed by y * width + x
+
+/**
+ * BombervibeGrid - Terrain plus bomb layer
+ *
+ * Bombs never change the terrain under them: a cell with a bomb is still
+ * EMPTY terrain, so movement and blast checks are plain integer compares.
+ * The legacy grid (rows mixing 0/1/2 with bomb ID strings) is only built on
+ * demand by toRows() for getGameState() and older callers.
+ */
+class BombervibeGrid {
+    /**
+     * @param {number} width - Grid width
+     * @param {number} height - Grid height
+     * @param {HandleRegistry} bombRegistry - Bomb handles (shared with the game, which also tracks carried bombs)
+     */
+    constructor(width, height, bombRegistry = new HandleRegistry()) {
+        this.width = width;
+        this.height = height;
+        this.terrain = new Uint8Array(width * height);
+        this.bombLayer = new Int32Array(width * height); // 0 = no bomb
+        this.bombRegistry = bombRegistry; // handle -> bomb object
+
+        // Bumped on terrain edits other than soft blocks being blown up
+        this.terrainVersion = 0;
+        this.footprints = new BlastFootprints(this);
+    }
+
+    /**
+     * Flat index of a cell
+     */
+    index(x, y) {
+        return y * this.width + x;
+    }
+
+    /**
+     * Check if coordinates are on the board
+     */
+    inBounds(x, y) {
+        return x >= 0 && x < this.width && y >= 0 && y < this.height;
+    }
+
+    /**
+     * Terrain type at a cell (BombervibeConfig.CELL_TYPES)
+     */
+    getTerrain(x, y) {
+        return this.terrain[y * this.width + x];
+    }
+
+    /**
+     * Set terrain type at a cell
+     */
+    setTerrain(x, y, type) {
+        const i = y * this.width + x;
+        const previous = this.terrain[i];
+        if (previous === type) return;
+
+        this.terrain[i] = type;
+        if (previous === BombervibeConfig.CELL_TYPES.SOFT && type === BombervibeConfig.CELL_TYPES.EMPTY) {
+            this.footprints.softBlockDestroyed(i);
+        } else {
+            this.terrainVersion++;
+        }
+    }
+
+    /**
+     * Memoized blast footprint of a bomb at (x, y) (see BlastFootprints)
+     */
+    getBlastFootprint(x, y, range) {
+        return this.footprints.get(x, y, range);
+    }
+
+    /**
+     * Check if a player can walk onto a cell (bombs don't block movement)
+     */
+    isPassable(x, y) {
+        return this.terrain[y * this.width + x] === BombervibeConfig.CELL_TYPES.EMPTY;
+    }
+
+    /**
+     * Bomb handle at a cell (0 = none)
+     */
+    bombAt(x, y) {
+        return this.bombLayer[y * this.width + x];
+    }
+
+    /**
+     * Bomb object at a cell (null = none)
+     */
+    getBomb(x, y) {
+        const handle = this.bombLayer[y * this.width + x];
+        return handle === 0 ? null : this.bombRegistry.get(handle);
+    }
+
+    /**
+     * Check if a bomb sits on a cell
+     */
+    hasBomb(x, y) {
+        return this.bombLayer[y * this.width + x] !== 0;
+    }
+
+    /**
+     * Put a bomb on the layer at (bomb.x, bomb.y), assigning its handle if needed
+     * @param {Object} bomb - Bomb object
+     * @returns {number} Bomb handle
+     */
+    placeBomb(bomb) {
+        const handle = this.bombRegistry.add(bomb);
+        this.bombLayer[bomb.y * this.width + bomb.x] = handle;
+        return handle;
+    }
+
+    /**
+     * Take a bomb off the layer if it is still the one at (bomb.x, bomb.y)
+     * (it stays registered: a picked-up bomb is still live)
+     * @param {Object} bomb - Bomb object
+     * @returns {boolean} True if the bomb was on the layer
+     */
+    removeBomb(bomb) {
+        const i = bomb.y * this.width + bomb.x;
+        if (bomb.handle && this.bombLayer[i] === bomb.handle) {
+            this.bombLayer[i] = 0;
+            return true;
+        }
+        return false;
+    }
+
+    /**
+     * Clear terrain and bombs (bomb handles restart at 1)
+     */
+    clear() {
+        this.terrain.fill(BombervibeConfig.CELL_TYPES.EMPTY);
+        this.terrainVersion++;
+        this.bombLayer.fill(0);
+        this.bombRegistry.clear();
+    }
+
+    /**
+     * Build the legacy grid: rows of 0/1/2 with bomb ID strings on bomb cells
+     * @param {Array} bombs - Bombs to resolve handles to IDs
+     * @returns {Array<Array<number|string>>}
+     */
+    toRows(bombs = []) {
+        const rows = [];
+        for (let y = 0; y < this.height; y++) {
+            rows.push(Array.from(this.terrain.subarray(y * this.width, (y + 1) * this.width)));
+        }
+
+        for (const bomb of bombs) {
+            if (bomb.handle && !bomb.isBeingCarried && this.bombAt(bomb.x, bomb.y) === bomb.handle) {
+                rows[bomb.y][bomb.x] = bomb.id;
+            }
+        }
+
+        return rows;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { BombervibeGrid };
+}
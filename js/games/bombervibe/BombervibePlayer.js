@@ -21,17 +21,15 @@ class Player {
         this.carriedBomb = null; // Reference to bomb being carried
     }
 
-    move(newX, newY, grid) {
+    move(newX, newY, board) {
         // Check boundaries
-        if (newX < 0 || newX >= 13 || newY < 0 || newY >= 11) {
+        if (!board.inBounds(newX, newY)) {
             return false;
         }
 
-        // Check if cell is passable
-        const cell = grid[newY][newX];
-        // Can move through: empty cells (0), bombs
+        // Can move through: empty cells (with or without bombs)
         // Cannot move through: soft blocks (1), hard blocks (2)
-        if (cell === 0 || (typeof cell === 'string' && cell.startsWith('bomb'))) {
+        if (board.isPassable(newX, newY)) {
             this.x = newX;
             this.y = newY;
             return true;
@@ -40,15 +38,14 @@ class Player {
         return false;
     }
 
-    placeBomb(grid, bombs) {
+    placeBomb(board, bombs) {
         // Check if player has reached max bombs limit
         if (this.activeBombs >= this.maxBombs) {
             return false;
         }
 
         // Check if there's already a bomb at this position
-        const cellContent = grid[this.y][this.x];
-        if (typeof cellContent === 'string' && cellContent.startsWith('bomb')) {
+        if (board.hasBomb(this.x, this.y)) {
             return false;
         }
 
@@ -61,8 +58,11 @@ class Player {
             this.bombY = this.y;
         }
 
+        // Per-game handle: unique and deterministic, even for several bombs in one millisecond
+        const handle = board.bombRegistry.allocate();
         const bomb = {
-            id: 'bomb' + this.id + '_' + Date.now(), // Unique ID for multiple bombs
+            id: 'bomb' + this.id + '_' + handle,
+            handle,
             playerId: this.id,
             x: this.x,
             y: this.y,
@@ -72,7 +72,7 @@ class Player {
         };
 
         bombs.push(bomb);
-        grid[this.y][this.x] = bomb.id;
+        board.placeBomb(bomb);
 
         return true;
     }
@@ -97,13 +97,13 @@ class Player {
     pickupLoot(lootType) {
         if (lootType === 'flash_radius') {
             this.bombRange += 1;
-            console.log(`[P${this.id}] Picked up Flash Radius! Bomb range now: ${this.bombRange}`);
+            logger.info('game', () => `[P${this.id}] Picked up Flash Radius! Bomb range now: ${this.bombRange}`);
         } else if (lootType === 'bomb_pickup') {
             this.canPickupBombs = true;
-            console.log(`[P${this.id}] Picked up Bomb Pickup! Can now pickup and throw bombs`);
+            logger.info('game', () => `[P${this.id}] Picked up Bomb Pickup! Can now pickup and throw bombs`);
         } else if (lootType === 'extra_bomb') {
             this.maxBombs += 1;
-            console.log(`[P${this.id}] Picked up Extra Bomb! Max bombs now: ${this.maxBombs}`);
+            logger.info('game', () => `[P${this.id}] Picked up Extra Bomb! Max bombs now: ${this.maxBombs}`);
         }
     }
 
@@ -125,3 +125,8 @@ class Player {
         };
     }
 }
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { Player };
+}
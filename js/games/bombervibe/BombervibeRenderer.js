@@ -1,12 +1,37 @@
 // BombervibeRenderer.js - Bomberman-specific rendering implementation
 // Extends BaseUIRenderer to provide Bombervibe visual rendering
 
+// Prompt header of each human player slot (loot display)
+const PROMPT_HEADER_SELECTORS = {
+    1: '.prompt-editor.top-left .prompt-header',
+    2: '.prompt-editor.top-right .prompt-header',
+    3: '.prompt-editor.bottom-left .prompt-header',
+    4: '.prompt-editor.bottom-right .prompt-header'
+};
+
 class BombervibeRenderer extends BaseUIRenderer {
     constructor() {
         super();
         this.game = null;
         this.llm = null; // Reference to LLM adapter for thoughts
         this.animationFrameId = null;
+
+        // Incremental grid: persistent cell nodes and the state each one shows
+        this.cellNodes = null;
+        this.cellKeys = null;
+
+        // Persistent player/bubble elements: id -> {element, x, y, geometry, ...}
+        this.playerEntities = new Map();
+        this.thoughtBubbles = new Map();
+        this.cellGeometry = null; // Cached cell size, recomputed on resize
+        this.lastGameState = null;
+        this.resizeObserver = null;
+        this.resizeHandler = null; // Grid resize callback (see watchGridSize)
+
+        // Sidebar panels: cached element refs and last written values (see patchPanel)
+        this.panelElements = new Map();
+        this.panelValues = new Map();
+        this.panelPlayerKey = null;
     }
 
     /**
@@ -19,10 +44,80 @@ class BombervibeRenderer extends BaseUIRenderer {
             containerId: config.containerId || 'gameContainer',
             gridId: config.gridId || 'grid',
             infoId: config.infoId || 'gameInfo',
+            incrementalGrid: config.incrementalGrid !== false, // Patch changed cells instead of rebuilding
+            showDanger: config.showDanger === true, // Tint cells a pending blast will reach
             ...config
         };
 
         this.initializeCoordinateLabels();
+        this.watchGridSize();
+    }
+
+    /**
+     * Drop cached cell geometry when the grid is resized and reposition
+     * players/bubbles (the engine may not render again until the next turn)
+     *
+     * Safe to call on every initialize(): the previous observer/listener is
+     * removed first, so re-initialized pages keep exactly one.
+     */
+    watchGridSize() {
+        this.unwatchGridSize();
+
+        this.resizeHandler = () => this.handleGridResize();
+
+        const gridElement = document.getElementById(this.config.gridId);
+        if (typeof ResizeObserver !== 'undefined' && gridElement) {
+            this.resizeObserver = new ResizeObserver(this.resizeHandler);
+            this.resizeObserver.observe(gridElement);
+        } else if (typeof window !== 'undefined') {
+            window.addEventListener('resize', this.resizeHandler);
+        }
+    }
+
+    /**
+     * Grid element resized (also fires once when observing starts)
+     */
+    handleGridResize() {
+        this.cellGeometry = null;
+        if (this.lastGameState) {
+            this.renderPlayers(this.lastGameState);
+            if (this.llm) {
+                this.renderFloatingThoughts(this.lastGameState);
+            }
+        }
+    }
+
+    /**
+     * Stop watching the grid size (see watchGridSize)
+     */
+    unwatchGridSize() {
+        if (this.resizeObserver) {
+            this.resizeObserver.disconnect();
+            this.resizeObserver = null;
+        } else if (this.resizeHandler && typeof window !== 'undefined') {
+            window.removeEventListener('resize', this.resizeHandler);
+        }
+        this.resizeHandler = null;
+    }
+
+    /**
+     * Cell size in px, measured once per grid size (layout read only after resize)
+     * @returns {Object} {cols, rows, cellWidth, cellHeight}
+     */
+    getCellGeometry(gridElement, cols, rows) {
+        const cached = this.cellGeometry;
+        if (cached && cached.cols === cols && cached.rows === rows) {
+            return cached;
+        }
+
+        const gridRect = gridElement.getBoundingClientRect();
+        this.cellGeometry = {
+            cols,
+            rows,
+            cellWidth: gridRect.width / cols,
+            cellHeight: gridRect.height / rows
+        };
+        return this.cellGeometry;
     }
 
     /**
@@ -73,162 +168,269 @@ class BombervibeRenderer extends BaseUIRenderer {
         const gridElement = this.getElement(this.config.gridId);
         if (!gridElement) return;
 
+        this.lastGameState = gameState;
+
+        // Index bombs, explosions and loot by cell once instead of scanning per cell
+        const cells = SpatialIndex.fromGameState(gameState);
+
+        if (this.config.incrementalGrid) {
+            this.patchCells(gridElement, gameState, cells);
+        } else {
+            this.rebuildCells(gridElement, gameState, cells);
+        }
+
+        // Render players as absolutely positioned entities
+        this.renderPlayers(gameState);
+
+        // Render floating thought bubbles
+        if (this.llm) {
+            this.renderFloatingThoughts(gameState);
+        }
+    }
+
+    /**
+     * Full rebuild: replace every cell node (incrementalGrid: false)
+     */
+    rebuildCells(gridElement, gameState, cells) {
         // Clear only non-player elements
         const existingCells = gridElement.querySelectorAll('.cell');
         existingCells.forEach(cell => cell.remove());
-        const existingThoughts = gridElement.querySelectorAll('.floating-thought');
-        existingThoughts.forEach(thought => thought.remove());
+        this.cellNodes = null;
 
         // Render cells (terrain, bombs, explosions)
+        const danger = this.getDangerMap();
         for (let y = 0; y < gameState.grid.length; y++) {
             for (let x = 0; x < gameState.grid[y].length; x++) {
                 const cell = this.createElement('div', 'cell');
+                this.paintCell(cell, gameState.grid[y][x], cells.isExploding(x, y), cells.bombAt(x, y), cells.lootAt(x, y));
+                this.paintDanger(cell, danger ? danger.blastTurnAt(x, y) : Infinity);
+                gridElement.appendChild(cell);
+            }
+        }
 
-                const bomb = gameState.bombs.find(b => b.x === x && b.y === y);
-                const explosion = gameState.explosions ? gameState.explosions.find(exp =>
-                    exp.cells.some(c => c.x === x && c.y === y)
-                ) : null;
-
-                // Priority: Explosion > Bomb > Terrain
-                if (explosion) {
-                    cell.classList.add('explosion');
-                    gridElement.appendChild(cell);
-                    continue;
-                }
+        // Debug: Count explosion cells after rendering
+        if (gameState.explosions && gameState.explosions.length > 0) {
+            logger.debug('render', () => `[RENDER] Added ${gridElement.querySelectorAll('.cell.explosion').length} explosion cells to DOM`);
+        }
+    }
 
-                if (bomb) {
-                    cell.classList.add('bomb');
-                    gridElement.appendChild(cell);
-                    continue;
-                }
+    /**
+     * Incremental render: cell nodes are created once and only cells whose
+     * terrain, bomb, explosion or loot changed since the last frame are touched
+     */
+    patchCells(gridElement, gameState, cells) {
+        const height = gameState.grid.length;
+        const width = height > 0 ? gameState.grid[0].length : 0;
+
+        // (Re)create nodes on first render, resize, or after the grid was cleared
+        if (!this.cellNodes || this.cellNodes.length !== width * height ||
+            this.cellNodes[0].parentNode !== gridElement) {
+            this.createCellNodes(gridElement, width * height);
+        }
 
-                // Terrain - use block configuration
+        const danger = this.getDangerMap();
+        let patched = 0;
+        for (let y = 0; y < height; y++) {
+            for (let x = 0; x < width; x++) {
+                const i = y * width + x;
                 const cellType = gameState.grid[y][x];
-                const blockConfig = BlockUtils.getBlockConfig(cellType);
-                cell.classList.add(blockConfig.className);
-                cell.setAttribute('data-block-type', blockConfig.name);
-
-                // Check for loot
-                const loot = gameState.loot ? gameState.loot.find(l => l.x === x && l.y === y) : null;
-                if (loot) {
-                    const lootIcon = this.createElement('div', 'loot-icon');
-                    if (loot.type === 'flash_radius') {
-                        lootIcon.innerHTML = '⚡';
-                        lootIcon.classList.add('flash-radius');
-                    } else if (loot.type === 'bomb_pickup') {
-                        lootIcon.innerHTML = '🧤';
-                        lootIcon.classList.add('bomb-pickup');
-                    } else if (loot.type === 'extra_bomb') {
-                        lootIcon.innerHTML = '💣';
-                        lootIcon.classList.add('extra-bomb');
-                    }
-                    cell.appendChild(lootIcon);
-                }
-
-                gridElement.appendChild(cell);
+                const exploding = cells.isExploding(x, y);
+                const bomb = cells.bombAt(x, y);
+                const loot = cells.lootAt(x, y);
+                const blastTurn = danger ? danger.blastTurnAt(x, y) : Infinity;
+
+                // Same priority as paintCell: Explosion > Bomb > Terrain (+ loot)
+                const key = (exploding ? 'explosion' : bomb ? 'bomb' : `${cellType}:${loot ? loot.type : ''}`) + `|${blastTurn}`;
+                if (key === this.cellKeys[i]) continue;
+
+                this.cellKeys[i] = key;
+                this.paintCell(this.cellNodes[i], cellType, exploding, bomb, loot);
+                this.paintDanger(this.cellNodes[i], blastTurn);
+                patched++;
             }
         }
 
-        // Debug: Count explosion cells after rendering
-        if (gameState.explosions && gameState.explosions.length > 0) {
-            const explosionCellsAdded = gridElement.querySelectorAll('.cell.explosion').length;
-            console.log(`[RENDER] Added ${explosionCellsAdded} explosion cells to DOM`);
+        if (patched > 0 && gameState.explosions && gameState.explosions.length > 0) {
+            logger.debug('render', () => `[RENDER] Patched ${patched} cells (${gameState.explosions.length} explosions active)`);
         }
+    }
 
-        // Render players as absolutely positioned entities
-        this.renderPlayers(gameState);
+    /**
+     * Replace any existing cells with `count` empty cell nodes in grid order
+     */
+    createCellNodes(gridElement, count) {
+        gridElement.querySelectorAll('.cell').forEach(cell => cell.remove());
+
+        const fragment = document.createDocumentFragment();
+        this.cellNodes = [];
+        for (let i = 0; i < count; i++) {
+            const cell = this.createElement('div', 'cell');
+            this.cellNodes.push(cell);
+            fragment.appendChild(cell);
+        }
+        this.cellKeys = new Array(count).fill(null);
 
-        // Render floating thought bubbles
-        if (this.llm) {
-            this.renderFloatingThoughts(gameState);
+        // Cells go before player entities and thought bubbles, like a full rebuild
+        gridElement.insertBefore(fragment, gridElement.firstChild);
+    }
+
+    /**
+     * Set a cell node's classes and loot icon
+     * Priority: Explosion > Bomb > Terrain
+     */
+    paintCell(cell, cellType, exploding, bomb, loot) {
+        cell.className = 'cell';
+        cell.removeAttribute('data-block-type');
+        cell.textContent = '';
+
+        if (exploding) {
+            cell.classList.add('explosion');
+            return;
         }
 
-        // Debug: Final count
-        if (gameState.explosions && gameState.explosions.length > 0) {
-            const finalExplosionCells = gridElement.querySelectorAll('.cell.explosion').length;
-            console.log(`[RENDER] FINAL: ${finalExplosionCells} explosion cells in DOM after full render`);
+        if (bomb) {
+            cell.classList.add('bomb');
+            return;
+        }
+
+        // Terrain - use block configuration
+        const blockConfig = BlockUtils.getBlockConfig(cellType);
+        cell.classList.add(blockConfig.className);
+        cell.setAttribute('data-block-type', blockConfig.name);
+
+        // Loot
+        if (loot) {
+            const lootIcon = this.createElement('div', 'loot-icon');
+            if (loot.type === 'flash_radius') {
+                lootIcon.innerHTML = '⚡';
+                lootIcon.classList.add('flash-radius');
+            } else if (loot.type === 'bomb_pickup') {
+                lootIcon.innerHTML = '🧤';
+                lootIcon.classList.add('bomb-pickup');
+            } else if (loot.type === 'extra_bomb') {
+                lootIcon.innerHTML = '💣';
+                lootIcon.classList.add('extra-bomb');
+            }
+            cell.appendChild(lootIcon);
+        }
+    }
+
+    /**
+     * Game danger map when the showDanger overlay is on (else null)
+     * @returns {DangerMap|null}
+     */
+    getDangerMap() {
+        if (!this.config.showDanger || !this.game || typeof this.game.getDangerMap !== 'function') {
+            return null;
+        }
+        return this.game.getDangerMap();
+    }
+
+    /**
+     * Danger overlay class: 'danger' for blasts due within a turn, 'danger-soon' for later ones
+     */
+    paintDanger(cell, blastTurn) {
+        if (blastTurn <= 1) {
+            cell.classList.add('danger');
+        } else if (blastTurn !== Infinity) {
+            cell.classList.add('danger-soon');
         }
     }
 
     /**
-     * Render players as absolutely positioned entities
+     * Render players as persistent entities positioned with `translate`
+     * (compositor-only movement; geometry comes from the resize cache)
      */
     renderPlayers(gameState) {
         const gridElement = this.getElement(this.config.gridId);
         if (!gridElement) return;
 
-        const gridRect = gridElement.getBoundingClientRect();
-        const gapSize = 0;
-        const cellWidth = gridRect.width / gameState.grid[0].length;
-        const cellHeight = gridRect.height / gameState.grid.length;
+        const geometry = this.getCellGeometry(gridElement, gameState.grid[0].length, gameState.grid.length);
+        const alive = new Set();
 
         for (const player of gameState.players) {
             if (!player.alive) continue;
+            alive.add(player.id);
 
-            let playerEntity = gridElement.querySelector(`.player-entity.player${player.id}`);
+            let entry = this.playerEntities.get(player.id);
 
-            // Create player entity if doesn't exist
-            if (!playerEntity) {
-                playerEntity = this.createElement('div', `player-entity player${player.id}`);
+            // Create player entity if doesn't exist (or the grid was cleared)
+            if (!entry || entry.element.parentNode !== gridElement) {
+                entry = { element: this.createPlayerEntity(player), x: null, y: null, geometry: null, carrying: false };
+                gridElement.appendChild(entry.element);
+                this.playerEntities.set(player.id, entry);
+            }
 
-                // NPC customization
-                if (player.isNPC && player.color) {
-                    playerEntity.style.filter = `drop-shadow(0 0 10px ${player.color})`;
-                }
-                if (player.isNPC && player.npcEmoji) {
-                    playerEntity.setAttribute('data-emoji', player.npcEmoji);
-                    playerEntity.style.setProperty('--emoji', `"${player.npcEmoji}"`);
-                }
+            const playerEntity = entry.element;
 
-                // Click handler for prompt window
-                playerEntity.style.cursor = 'pointer';
-                playerEntity.style.pointerEvents = 'auto';
-                playerEntity.addEventListener('click', (e) => {
-                    e.stopPropagation();
-                    if (typeof showPromptWindow === 'function') {
-                        showPromptWindow(player.id);
-                    }
-                });
-
-                gridElement.appendChild(playerEntity);
+            // Size only changes with the grid
+            if (entry.geometry !== geometry) {
+                playerEntity.style.width = `${geometry.cellWidth}px`;
+                playerEntity.style.height = `${geometry.cellHeight}px`;
+                entry.geometry = geometry;
+                entry.x = null;
             }
 
             // Position player
-            const left = player.x * (cellWidth + gapSize);
-            const top = player.y * (cellHeight + gapSize);
-            playerEntity.style.left = `${left}px`;
-            playerEntity.style.top = `${top}px`;
-            playerEntity.style.width = `${cellWidth}px`;
-            playerEntity.style.height = `${cellHeight}px`;
+            if (entry.x !== player.x || entry.y !== player.y) {
+                playerEntity.style.translate = `${player.x * geometry.cellWidth}px ${player.y * geometry.cellHeight}px`;
+                entry.x = player.x;
+                entry.y = player.y;
+            }
 
             // Carried bomb indicator
-            let carriedBombIcon = playerEntity.querySelector('.carried-bomb-icon');
-            if (player.carriedBomb) {
-                if (!carriedBombIcon) {
-                    carriedBombIcon = this.createElement('div', 'carried-bomb-icon', '💣');
-                    playerEntity.appendChild(carriedBombIcon);
+            const carrying = Boolean(player.carriedBomb);
+            if (carrying !== entry.carrying) {
+                if (carrying) {
+                    playerEntity.appendChild(this.createElement('div', 'carried-bomb-icon', '💣'));
+                } else {
+                    const carriedBombIcon = playerEntity.querySelector('.carried-bomb-icon');
+                    if (carriedBombIcon) carriedBombIcon.remove();
                 }
-            } else if (carriedBombIcon) {
-                carriedBombIcon.remove();
+                entry.carrying = carrying;
             }
         }
 
         // Remove dead players
-        const allPlayerEntities = gridElement.querySelectorAll('.player-entity');
-        allPlayerEntities.forEach(entity => {
-            const match = entity.className.match(/player(\d+)/);
-            if (match) {
-                const playerId = parseInt(match[1]);
-                const player = gameState.players.find(p => p.id === playerId);
-                if (!player || !player.alive) {
-                    entity.remove();
-                }
+        for (const [playerId, entry] of this.playerEntities) {
+            if (!alive.has(playerId)) {
+                entry.element.remove();
+                this.playerEntities.delete(playerId);
+            }
+        }
+    }
+
+    /**
+     * Create a player entity element
+     */
+    createPlayerEntity(player) {
+        const playerEntity = this.createElement('div', `player-entity player${player.id}`);
+
+        // NPC customization
+        if (player.isNPC && player.color) {
+            playerEntity.style.filter = `drop-shadow(0 0 10px ${player.color})`;
+        }
+        if (player.isNPC && player.npcEmoji) {
+            playerEntity.setAttribute('data-emoji', player.npcEmoji);
+            playerEntity.style.setProperty('--emoji', `"${player.npcEmoji}"`);
+        }
+
+        // Click handler for prompt window
+        playerEntity.style.cursor = 'pointer';
+        playerEntity.style.pointerEvents = 'auto';
+        playerEntity.addEventListener('click', (e) => {
+            e.stopPropagation();
+            if (typeof showPromptWindow === 'function') {
+                showPromptWindow(player.id);
             }
         });
+
+        return playerEntity;
     }
 
     /**
      * Render floating thought bubbles above players
+     * Bubbles persist between frames; text is only rewritten when the thought changes
      */
     renderFloatingThoughts(gameState) {
         if (!this.llm) return;
@@ -236,44 +438,104 @@ class BombervibeRenderer extends BaseUIRenderer {
         const gridElement = this.getElement(this.config.gridId);
         if (!gridElement) return;
 
-        const gridRect = gridElement.getBoundingClientRect();
-        const gapSize = 0;
-        const cellWidth = gridRect.width / gameState.grid[0].length;
-        const cellHeight = gridRect.height / gameState.grid.length;
+        const geometry = this.getCellGeometry(gridElement, gameState.grid[0].length, gameState.grid.length);
+        const shown = new Set();
 
         for (const player of gameState.players) {
             if (!player.alive) continue;
 
             const thought = this.llm.getPlayerThought(player.id);
             if (!thought || thought.trim() === '') continue;
+            shown.add(player.id);
 
-            const bubble = this.createElement('div', `floating-thought player${player.id}-thought`, thought);
+            let entry = this.thoughtBubbles.get(player.id);
+            if (!entry || entry.element.parentNode !== gridElement) {
+                entry = { element: this.createThoughtBubble(player), text: null, x: null, y: null, geometry: null };
+                gridElement.appendChild(entry.element);
+                this.thoughtBubbles.set(player.id, entry);
+            }
 
-            // NPC color customization
-            if (player.isNPC && player.color) {
-                bubble.style.color = player.color;
-                bubble.style.borderColor = player.color;
-                bubble.style.boxShadow = `0 0 15px ${player.color}`;
+            if (entry.text !== thought) {
+                entry.element.textContent = thought;
+                entry.text = thought;
             }
 
-            // Click handler
-            bubble.style.cursor = 'pointer';
-            bubble.style.pointerEvents = 'auto';
-            bubble.addEventListener('click', (e) => {
-                e.stopPropagation();
-                if (typeof showPromptWindow === 'function') {
-                    showPromptWindow(player.id);
-                }
-            });
+            // Position bubble above player (CSS anchors its bottom to the grid top)
+            if (entry.geometry !== geometry || entry.x !== player.x || entry.y !== player.y) {
+                entry.element.style.translate = `${player.x * geometry.cellWidth}px ${player.y * geometry.cellHeight}px`;
+                entry.geometry = geometry;
+                entry.x = player.x;
+                entry.y = player.y;
+            }
+        }
 
-            // Position bubble above player
-            const playerX = player.x * (cellWidth + gapSize);
-            const playerY = player.y * (cellHeight + gapSize);
-            bubble.style.left = `${playerX}px`;
-            bubble.style.bottom = `${gridRect.height - playerY}px`;
-            bubble.style.top = 'auto';
+        for (const [playerId, entry] of this.thoughtBubbles) {
+            if (!shown.has(playerId)) {
+                entry.element.remove();
+                this.thoughtBubbles.delete(playerId);
+            }
+        }
+    }
 
-            gridElement.appendChild(bubble);
+    /**
+     * Create a thought bubble element
+     */
+    createThoughtBubble(player) {
+        const bubble = this.createElement('div', `floating-thought player${player.id}-thought`);
+
+        // NPC color customization
+        if (player.isNPC && player.color) {
+            bubble.style.color = player.color;
+            bubble.style.borderColor = player.color;
+            bubble.style.boxShadow = `0 0 15px ${player.color}`;
+        }
+
+        // Click handler
+        bubble.style.cursor = 'pointer';
+        bubble.style.pointerEvents = 'auto';
+        bubble.addEventListener('click', (e) => {
+            e.stopPropagation();
+            if (typeof showPromptWindow === 'function') {
+                showPromptWindow(player.id);
+            }
+        });
+
+        return bubble;
+    }
+
+    /**
+     * Write `value` to element[prop] only if it differs from the last write
+     * Element lookups are cached per id (missing elements too, so absent
+     * panels cost nothing) until the player list changes or clear()
+     * @param {string} id - Cache key for the element (usually its DOM id)
+     * @param {string} prop - Property to set ('textContent', 'className', ...)
+     * @param {*} value - New value
+     * @param {Function} lookup - Finds the element (default: getElementById(id))
+     */
+    patchPanel(id, prop, value, lookup = () => document.getElementById(id)) {
+        const key = `${id}.${prop}`;
+        if (this.panelValues.get(key) === value) return;
+
+        if (!this.panelElements.has(id)) {
+            this.panelElements.set(id, lookup());
+        }
+        const element = this.panelElements.get(id);
+        if (!element) return;
+
+        element[prop] = value;
+        this.panelValues.set(key, value);
+    }
+
+    /**
+     * Forget cached panel elements/values when the player list changes
+     * (NPC spawns add scoreboard entries, resets remove them)
+     */
+    syncPanelPlayers(gameState) {
+        const playerKey = gameState.players.map(p => p.id).join(',');
+        if (playerKey !== this.panelPlayerKey) {
+            this.panelElements.clear();
+            this.panelValues.clear();
+            this.panelPlayerKey = playerKey;
         }
     }
 
@@ -281,12 +543,17 @@ class BombervibeRenderer extends BaseUIRenderer {
      * Update score display (IUIRenderer interface)
      */
     updateScores(gameState) {
-        for (let i = 0; i < gameState.players.length; i++) {
-            const player = gameState.players[i];
-            const scoreElement = this.getElement(`score${player.id}`);
-            if (scoreElement) {
-                scoreElement.textContent = player.score;
-            }
+        this.syncPanelPlayers(gameState);
+
+        for (const player of gameState.players) {
+            this.patchPanel(`score${player.id}`, 'textContent', String(player.score));
+
+            // Dim the scoreboard entry of dead players
+            const scoreId = `score${player.id}`;
+            this.patchPanel(`score-entry${player.id}`, 'className', player.alive ? 'score' : 'score dead', () => {
+                const scoreElement = document.getElementById(scoreId);
+                return scoreElement ? scoreElement.closest('.score') : null;
+            });
         }
     }
 
@@ -294,40 +561,27 @@ class BombervibeRenderer extends BaseUIRenderer {
      * Update game info display (IUIRenderer interface)
      */
     updateInfo(gameState) {
-        // Turn counter
-        const turnElement = this.getElement('turnCounter');
-        if (turnElement) {
-            turnElement.textContent = gameState.turnCount || 0;
-        }
+        this.syncPanelPlayers(gameState);
 
-        // Round counter
-        const roundElement = this.getElement('roundCounter');
-        if (roundElement) {
-            roundElement.textContent = gameState.roundCount || 0;
-        }
+        this.patchPanel('turnCounter', 'textContent', String(gameState.turnCount || 0));
+        this.patchPanel('roundCounter', 'textContent', String(gameState.roundCount || 0));
 
         // Current player
-        const currentPlayerElement = this.getElement('currentPlayer');
-        if (currentPlayerElement) {
-            const currentPlayer = gameState.players.find(p => p.id === gameState.currentPlayerId);
-            if (currentPlayer) {
-                currentPlayerElement.textContent = currentPlayer.name;
-                currentPlayerElement.className = `player${currentPlayer.id}`;
-            }
+        const currentPlayer = gameState.players.find(p => p.id === gameState.currentPlayerId);
+        if (currentPlayer) {
+            this.patchPanel('currentPlayer', 'textContent', currentPlayer.name);
+            this.patchPanel('currentPlayer', 'className', `player${currentPlayer.id}`);
         }
 
         // Alive count
-        const aliveElement = this.getElement('aliveCount');
-        if (aliveElement) {
-            const aliveCount = gameState.players.filter(p => p.alive).length;
-            aliveElement.textContent = aliveCount;
+        let aliveCount = 0;
+        for (const player of gameState.players) {
+            if (player.alive) aliveCount++;
         }
+        this.patchPanel('aliveCount', 'textContent', String(aliveCount));
 
         // Bomb count
-        const bombElement = this.getElement('bombCount');
-        if (bombElement) {
-            bombElement.textContent = gameState.bombs.length;
-        }
+        this.patchPanel('bombCount', 'textContent', String(gameState.bombs.length));
 
         // Update player loot in prompt headers
         this.updatePlayerLoot(gameState);
@@ -337,17 +591,8 @@ class BombervibeRenderer extends BaseUIRenderer {
      * Update player loot display in prompt headers
      */
     updatePlayerLoot(gameState) {
-        const headerMapping = {
-            1: '.prompt-editor.top-left .prompt-header',
-            2: '.prompt-editor.top-right .prompt-header',
-            3: '.prompt-editor.bottom-left .prompt-header',
-            4: '.prompt-editor.bottom-right .prompt-header'
-        };
-
         for (const player of gameState.players) {
-            const headerSelector = headerMapping[player.id];
-            const headerElement = document.querySelector(headerSelector);
-            if (!headerElement) continue;
+            if (!PROMPT_HEADER_SELECTORS[player.id]) continue;
 
             // Build loot display
             const lootItems = [];
@@ -367,20 +612,38 @@ class BombervibeRenderer extends BaseUIRenderer {
                 lootItems.push(`💣×${player.maxBombs}`);
             }
 
-            // Get base text (remove old loot display if exists)
-            const playerNames = ['PLAYER 1 [CYAN]', 'PLAYER 2 [MAGENTA]', 'PLAYER 3 [YELLOW]', 'PLAYER 4 [GREEN]'];
-            const baseName = playerNames[player.id - 1];
+            // Bomb in hand
+            if (player.carriedBomb) {
+                lootItems.push('✋💣');
+            }
 
-            // Update header text
             const lootDisplay = lootItems.length > 0 ? ` ${lootItems.join(' ')}` : '';
+            this.patchPanel(`prompt-loot${player.id}`, 'textContent', lootDisplay, () => this.getPromptLootElement(player.id));
+        }
+    }
+
+    /**
+     * Loot <span> in a player's prompt header, created on first use
+     * Header becomes: "PLAYER N [COLOR]" + <span class="prompt-loot"> + reset button
+     */
+    getPromptLootElement(playerId) {
+        const headerElement = document.querySelector(PROMPT_HEADER_SELECTORS[playerId]);
+        if (!headerElement) return null;
+
+        let lootElement = headerElement.querySelector('.prompt-loot');
+        if (!lootElement) {
+            const playerNames = ['PLAYER 1 [CYAN]', 'PLAYER 2 [MAGENTA]', 'PLAYER 3 [YELLOW]', 'PLAYER 4 [GREEN]'];
             const resetButton = headerElement.querySelector('.reset-prompt');
 
             // Preserve reset button
-            headerElement.innerHTML = `${baseName}${lootDisplay}`;
+            headerElement.textContent = playerNames[playerId - 1];
+            lootElement = this.createElement('span', 'prompt-loot');
+            headerElement.appendChild(lootElement);
             if (resetButton) {
                 headerElement.appendChild(resetButton);
             }
         }
+        return lootElement;
     }
 
     /**
@@ -448,6 +711,12 @@ class BombervibeRenderer extends BaseUIRenderer {
      */
     clear() {
         super.clear();
+        this.cellNodes = null;
+        this.cellKeys = null;
+        this.playerEntities.clear();
+        this.thoughtBubbles.clear();
+        this.panelElements.clear();
+        this.panelValues.clear();
 
         // Clear player entities
         const gridElement = this.getElement(this.config.gridId);
@@ -0,0 +1,170 @@
+// DangerMap.js - Per-cell "turns until a blast" map, chain reactions included
+// Built once per state change so move safety checks are O(1) lookups
+// instead of walking every bomb's blast rays per query.
+
+const DANGER_NONE = 0x7fff; // No bomb will reach the cell
+
+/**
+ * DangerMap - Earliest blast turn per cell (index = y * width + x)
+ *
+ * build() replays the pending detonations in order: each bomb's blast uses
+ * the board's cached footprint (the same rays as resolveExplosions, stopped
+ * by hard blocks, soft blocks and bombs), detonates any bomb it reaches at
+ * the same turn, and clears the soft blocks it breaks so blasts on later
+ * turns pass through (blasts on the same turn are simultaneous and all stop
+ * at the block).
+ */
+class DangerMap {
+    /**
+     * @param {number} width - Grid width
+     * @param {number} height - Grid height
+     */
+    constructor(width, height) {
+        this.width = width;
+        this.height = height;
+        this.size = width * height;
+
+        this.blastTurn = new Int16Array(this.size).fill(DANGER_NONE); // turns until the first blast
+        this.bombTurn = new Int16Array(this.size).fill(DANGER_NONE); // detonation turn of a bomb on the cell
+        this.cleared = new Uint8Array(this.size); // soft blocks broken on an earlier turn (scratch)
+    }
+
+    /**
+     * Build a map for a game's current bombs and terrain
+     * @param {BombervibeGame} game
+     * @returns {DangerMap}
+     */
+    static fromGame(game) {
+        return new DangerMap(game.GRID_WIDTH, game.GRID_HEIGHT).build(game);
+    }
+
+    /**
+     * Recompute from a game's bombs, terrain and turn counter
+     * @param {BombervibeGame} game
+     * @returns {DangerMap} this
+     */
+    build(game) {
+        this.blastTurn.fill(DANGER_NONE);
+        this.bombTurn.fill(DANGER_NONE);
+        this.cleared.fill(0);
+
+        // Pending detonations; carried bombs go off where their carrier stands
+        const pending = [];
+        const bombCells = new Map(); // cell -> pending entry (bombs on the board)
+        for (const bomb of game.bombs) {
+            let x = bomb.x;
+            let y = bomb.y;
+            if (bomb.isBeingCarried) {
+                const carrier = game.players.find(p => p.id === bomb.carriedByPlayerId);
+                if (!carrier) continue;
+                x = carrier.x;
+                y = carrier.y;
+            }
+            if (x < 0 || x >= this.width || y < 0 || y >= this.height) continue;
+
+            const turnsLeft = Math.max(0, bomb.turnsUntilExplode - (game.turnCount - (bomb.placedOnTurn || 0)));
+            const entry = { x, y, range: bomb.range || 1, turn: turnsLeft, done: false };
+            pending.push(entry);
+            if (!bomb.isBeingCarried && !bombCells.has(y * this.width + x)) {
+                bombCells.set(y * this.width + x, entry);
+            }
+        }
+
+        const broken = []; // soft blocks broken on the turn being replayed
+        let currentTurn = -1;
+        for (let remaining = pending.length; remaining > 0; remaining--) {
+            // Next detonation (few bombs: a linear scan beats a heap)
+            let next = null;
+            for (const entry of pending) {
+                if (!entry.done && (!next || entry.turn < next.turn)) {
+                    next = entry;
+                }
+            }
+
+            // Blocks broken on an earlier turn are gone by now
+            if (next.turn !== currentTurn) {
+                for (const cell of broken) {
+                    this.cleared[cell] = 1;
+                }
+                broken.length = 0;
+                currentTurn = next.turn;
+            }
+
+            next.done = true;
+            this.detonate(next, game.board, bombCells, broken);
+        }
+
+        return this;
+    }
+
+    /**
+     * Mark one bomb's blast and pull forward any bombs it reaches
+     * @param {Array<number>} broken - Collects the soft blocks the blast breaks
+     */
+    detonate(entry, board, bombCells, broken) {
+        const turn = entry.turn;
+
+        // Cached footprint, unless a blast on an earlier turn broke one of its soft blocks
+        let footprint = board.getBlastFootprint(entry.x, entry.y, entry.range);
+        if (footprint.stops.some(stop => stop >= 0 && this.cleared[stop])) {
+            footprint = BlastFootprints.walk(board, entry.x, entry.y, entry.range, this.cleared);
+        }
+
+        this.bombTurn[footprint.center] = Math.min(this.bombTurn[footprint.center], turn);
+        this.mark(footprint.center, turn);
+
+        for (let d = 0; d < footprint.rays.length; d++) {
+            let hitBomb = false;
+            for (const cell of footprint.rays[d]) {
+                this.mark(cell, turn);
+
+                // Bombs going off this same turn still stop the ray
+                const other = bombCells.get(cell);
+                if (other && (!other.done || other.turn === turn)) {
+                    other.turn = Math.min(other.turn, turn);
+                    hitBomb = true;
+                    break;
+                }
+            }
+
+            if (!hitBomb && footprint.stops[d] >= 0) {
+                broken.push(footprint.stops[d]);
+            }
+        }
+    }
+
+    /**
+     * Keep the earliest blast turn for a cell
+     */
+    mark(cell, turn) {
+        if (turn < this.blastTurn[cell]) {
+            this.blastTurn[cell] = turn;
+        }
+    }
+
+    /**
+     * Turns until a blast reaches (x, y) (0 = this turn, Infinity = never)
+     */
+    blastTurnAt(x, y) {
+        if (x < 0 || x >= this.width || y < 0 || y >= this.height) return Infinity;
+        const turn = this.blastTurn[y * this.width + x];
+        return turn === DANGER_NONE ? Infinity : turn;
+    }
+
+    /**
+     * Check if standing on (x, y) is lethal
+     * @param {number} afterTurns - Blasts within this many turns count
+     * @returns {boolean} True if a blast arrives in time, or a bomb sits
+     *   on the cell and goes off within 3 turns
+     */
+    isLethal(x, y, afterTurns = 1) {
+        if (x < 0 || x >= this.width || y < 0 || y >= this.height) return false;
+        const cell = y * this.width + x;
+        return this.blastTurn[cell] <= afterTurns || this.bombTurn[cell] <= 3;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { DangerMap, DANGER_NONE };
+}
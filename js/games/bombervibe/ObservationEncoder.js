@@ -0,0 +1,176 @@
+// ObservationEncoder.js - Fixed-layout numeric observations for bots and training
+// Writes the grid and entities into one contiguous Uint8Array so consumers
+// (NumPy via np.frombuffer) can view it without parsing getGameState()
+
+/**
+ * Plane order in the observation buffer. Each plane is GRID_HEIGHT x GRID_WIDTH,
+ * row-major (index = y * width + x); the buffer is [plane][y][x].
+ *
+ * - hard, soft:   1 where the block is
+ * - bomb_timer:   turns until the bomb on this cell explodes (0 = no bomb)
+ * - blast_range:  range of the bomb on this cell (0 = no bomb)
+ * - loot_type:    1 + index into BombervibeConfig.LOOT_TYPES (0 = no loot)
+ * - player_N:     1 where player N stands (alive only)
+ * - danger:       fewest turns until a blast reaches this cell, chain reactions
+ *                 included (0 = safe, blasts due now count as 1)
+ */
+const OBSERVATION_PLANES = Object.freeze([
+    'hard',
+    'soft',
+    'bomb_timer',
+    'blast_range',
+    'loot_type',
+    'player_1',
+    'player_2',
+    'player_3',
+    'player_4',
+    'danger'
+]);
+
+const OBSERVATION_PLANE_INDEX = Object.freeze(
+    OBSERVATION_PLANES.reduce((index, name, i) => ({ ...index, [name]: i }), {})
+);
+
+// Per-player feature columns for encodePlayers() (players 1-4, Float32Array)
+const OBSERVATION_PLAYER_FEATURES = Object.freeze([
+    'x', 'y', 'alive', 'score', 'bombRange', 'maxBombs', 'activeBombs', 'canPickupBombs'
+]);
+const OBSERVATION_PLAYERS = 4;
+
+class ObservationEncoder {
+    /**
+     * @param {number} width - Grid width
+     * @param {number} height - Grid height
+     */
+    constructor(width = BombervibeConfig.GRID_WIDTH, height = BombervibeConfig.GRID_HEIGHT) {
+        this.width = width;
+        this.height = height;
+        this.planeSize = width * height;
+        this.size = OBSERVATION_PLANES.length * this.planeSize;
+        this.lootCodes = {};
+        BombervibeConfig.LOOT_TYPES.forEach((loot, i) => {
+            this.lootCodes[loot.type] = i + 1;
+        });
+    }
+
+    /**
+     * Allocate a buffer for `count` observations
+     * @param {number} count - Number of games
+     * @returns {Uint8Array}
+     */
+    allocate(count = 1) {
+        return new Uint8Array(count * this.size);
+    }
+
+    /**
+     * Encode one game into `out` starting at `offset`
+     * @param {BombervibeGame} game
+     * @param {Uint8Array} out - Destination (default: a new buffer)
+     * @param {number} offset - Start index in `out`
+     * @returns {Uint8Array} out
+     */
+    encode(game, out = this.allocate(), offset = 0) {
+        const { width, planeSize } = this;
+        const at = (plane, x, y) => offset + plane * planeSize + y * width + x;
+
+        out.fill(0, offset, offset + this.size);
+
+        // Terrain (board.terrain uses the same y * width + x layout as a plane)
+        const terrain = game.board.terrain;
+        const hardBase = offset + OBSERVATION_PLANE_INDEX.hard * planeSize;
+        const softBase = offset + OBSERVATION_PLANE_INDEX.soft * planeSize;
+        for (let i = 0; i < planeSize; i++) {
+            if (terrain[i] === BombervibeConfig.CELL_TYPES.HARD) {
+                out[hardBase + i] = 1;
+            } else if (terrain[i] === BombervibeConfig.CELL_TYPES.SOFT) {
+                out[softBase + i] = 1;
+            }
+        }
+
+        // Bombs (carried bombs are on no cell)
+        for (const bomb of game.bombs) {
+            if (bomb.isBeingCarried) continue;
+            const turnsLeft = Math.max(1, bomb.turnsUntilExplode - (game.turnCount - bomb.placedOnTurn));
+            out[at(OBSERVATION_PLANE_INDEX.bomb_timer, bomb.x, bomb.y)] = turnsLeft;
+            out[at(OBSERVATION_PLANE_INDEX.blast_range, bomb.x, bomb.y)] = bomb.range;
+        }
+
+        // Danger (the game's per-state danger map)
+        const blastTurn = game.getDangerMap().blastTurn;
+        const dangerBase = offset + OBSERVATION_PLANE_INDEX.danger * planeSize;
+        for (let i = 0; i < planeSize; i++) {
+            if (blastTurn[i] !== DANGER_NONE) {
+                out[dangerBase + i] = Math.max(1, blastTurn[i]);
+            }
+        }
+
+        // Loot
+        for (const loot of game.loot) {
+            out[at(OBSERVATION_PLANE_INDEX.loot_type, loot.x, loot.y)] = this.lootCodes[loot.type] || 0;
+        }
+
+        // Players (ids 1-4; spawned NPCs have no plane)
+        for (const player of game.players) {
+            const plane = OBSERVATION_PLANE_INDEX[`player_${player.id}`];
+            if (plane !== undefined && player.alive) {
+                out[at(plane, player.x, player.y)] = 1;
+            }
+        }
+
+        return out;
+    }
+
+    /**
+     * Encode several games into one contiguous buffer ([game][plane][y][x])
+     * @param {BombervibeGame[]} games
+     * @param {Uint8Array} out - Optional destination of at least games.length * size
+     * @returns {Uint8Array}
+     */
+    encodeBatch(games, out = this.allocate(games.length)) {
+        games.forEach((game, i) => this.encode(game, out, i * this.size));
+        return out;
+    }
+
+    /**
+     * Encode per-player features for players 1-4 ([player][feature], dead or
+     * missing players keep their last values with alive = 0)
+     * @param {BombervibeGame[]} games
+     * @returns {Float32Array} games.length * 4 * OBSERVATION_PLAYER_FEATURES.length
+     */
+    encodePlayers(games) {
+        const featureCount = OBSERVATION_PLAYER_FEATURES.length;
+        const out = new Float32Array(games.length * OBSERVATION_PLAYERS * featureCount);
+
+        games.forEach((game, g) => {
+            for (const player of game.players) {
+                if (player.id < 1 || player.id > OBSERVATION_PLAYERS) continue;
+                const base = (g * OBSERVATION_PLAYERS + player.id - 1) * featureCount;
+                OBSERVATION_PLAYER_FEATURES.forEach((feature, f) => {
+                    out[base + f] = Number(player[feature]) || 0;
+                });
+            }
+        });
+
+        return out;
+    }
+
+    /**
+     * Shape metadata for consumers
+     * @returns {Object} {planes, height, width, dtype, playerFeatures, players}
+     */
+    describe() {
+        return {
+            planes: [...OBSERVATION_PLANES],
+            height: this.height,
+            width: this.width,
+            dtype: 'uint8',
+            playerFeatures: [...OBSERVATION_PLAYER_FEATURES],
+            players: OBSERVATION_PLAYERS
+        };
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { ObservationEncoder, OBSERVATION_PLANES, OBSERVATION_PLAYER_FEATURES };
+}
@@ -0,0 +1,250 @@
+// SpatialIndex.js - Per-cell lookup of players, loot, bombs and explosions
+// Answers "what is on (x, y)" in O(1) instead of scanning entity lists
+
+const MAX_INDEXED_PLAYER_ID = 15; // Players are bits in a Uint16Array cell mask
+
+/**
+ * SpatialIndex - Cell-indexed entity layers (index = y * width + x)
+ *
+ * The game keeps a live index updated as players move and die and as loot
+ * spawns and is picked up. Players and loot are still plain objects that
+ * tests and tools sometimes edit directly, so syncPlayers()/syncLoot()
+ * re-index anything changed behind the game's back (O(players), O(1) when
+ * the loot list is untouched) before a batch of lookups.
+ *
+ * fromGameState() builds a read-only index of a getGameState() snapshot
+ * (bombs and explosions included) for renderers.
+ */
+class SpatialIndex {
+    /**
+     * @param {number} width - Grid width
+     * @param {number} height - Grid height
+     */
+    constructor(width, height) {
+        this.width = width;
+        this.height = height;
+        this.size = width * height;
+
+        this.playerMask = new Uint16Array(this.size); // bit (1 << id) per player on the cell
+        this.playerCells = new Int32Array(MAX_INDEXED_PLAYER_ID + 1).fill(-1); // id -> cell
+        this.playerRefs = new Array(MAX_INDEXED_PLAYER_ID + 1).fill(null); // id -> player
+
+        this.lootCells = new Array(this.size).fill(null);
+        this.lootSource = null; // Loot array the index was built from
+        this.lootCount = 0;
+
+        // Snapshot-only layers (fromGameState)
+        this.bombCells = null;
+        this.explosionMask = null;
+    }
+
+    /**
+     * Flat index of a cell
+     */
+    index(x, y) {
+        return y * this.width + x;
+    }
+
+    /**
+     * Forget all entities
+     */
+    clear() {
+        this.playerMask.fill(0);
+        this.playerCells.fill(-1);
+        this.playerRefs.fill(null);
+        this.lootCells.fill(null);
+        this.lootSource = null;
+        this.lootCount = 0;
+    }
+
+    // ===== PLAYERS =====
+
+    /**
+     * Index a player at its current position (or drop it if dead)
+     * @param {Player} player
+     */
+    placePlayer(player) {
+        if (player.id < 0 || player.id > MAX_INDEXED_PLAYER_ID) return;
+
+        const bit = 1 << player.id;
+        const previous = this.playerCells[player.id];
+        if (previous !== -1) {
+            this.playerMask[previous] &= ~bit;
+        }
+
+        const onBoard = player.alive && player.x >= 0 && player.x < this.width && player.y >= 0 && player.y < this.height;
+        const cell = onBoard ? this.index(player.x, player.y) : -1;
+        if (cell !== -1) {
+            this.playerMask[cell] |= bit;
+        }
+        this.playerCells[player.id] = cell;
+        this.playerRefs[player.id] = player;
+    }
+
+    /**
+     * Remove a player from the index (death)
+     * @param {Player} player
+     */
+    removePlayer(player) {
+        if (player.id < 0 || player.id > MAX_INDEXED_PLAYER_ID) return;
+
+        const previous = this.playerCells[player.id];
+        if (previous !== -1) {
+            this.playerMask[previous] &= ~(1 << player.id);
+        }
+        this.playerCells[player.id] = -1;
+    }
+
+    /**
+     * Re-index players whose position or alive flag changed outside the game API
+     * @param {Player[]} players
+     */
+    syncPlayers(players) {
+        for (const player of players) {
+            const expected = player.alive ? this.index(player.x, player.y) : -1;
+            if (this.playerCells[player.id] !== expected) {
+                this.placePlayer(player);
+            }
+        }
+    }
+
+    /**
+     * Check if any (alive) player stands on a cell
+     */
+    hasPlayerAt(x, y) {
+        return this.playerMask[this.index(x, y)] !== 0;
+    }
+
+    /**
+     * First (lowest id) alive player on a cell
+     * @returns {Player|null}
+     */
+    playerAt(x, y) {
+        const mask = this.playerMask[this.index(x, y)];
+        if (mask === 0) return null;
+        return this.playerRefs[31 - Math.clz32(mask & -mask)];
+    }
+
+    /**
+     * Alive players on a cell, in id order
+     * @returns {Player[]}
+     */
+    playersAt(x, y) {
+        const players = [];
+        let mask = this.playerMask[this.index(x, y)];
+        for (let id = 0; mask !== 0; id++, mask >>= 1) {
+            if (mask & 1) players.push(this.playerRefs[id]);
+        }
+        return players;
+    }
+
+    // ===== LOOT =====
+
+    /**
+     * Index a loot item (one item per cell)
+     * @param {Object} loot - {type, x, y}
+     */
+    addLoot(loot) {
+        this.lootCells[this.index(loot.x, loot.y)] = loot;
+        this.lootCount++;
+    }
+
+    /**
+     * Remove a loot item from the index
+     * @param {Object} loot
+     */
+    removeLoot(loot) {
+        const cell = this.index(loot.x, loot.y);
+        if (this.lootCells[cell] === loot) {
+            this.lootCells[cell] = null;
+            this.lootCount--;
+        }
+    }
+
+    /**
+     * Loot item on a cell (null = none)
+     */
+    lootAt(x, y) {
+        return this.lootCells[this.index(x, y)];
+    }
+
+    /**
+     * Rebuild the loot layer if the loot array was replaced or resized outside the game API
+     * @param {Array} loot - The game's loot array
+     */
+    syncLoot(loot) {
+        if (loot === this.lootSource && loot.length === this.lootCount) return;
+
+        this.lootCells.fill(null);
+        this.lootCount = 0;
+        this.lootSource = loot;
+        for (const item of loot) {
+            this.addLoot(item);
+        }
+    }
+
+    // ===== SNAPSHOTS =====
+
+    /**
+     * Bomb on a cell in a snapshot index (null = none)
+     */
+    bombAt(x, y) {
+        return this.bombCells ? this.bombCells[this.index(x, y)] : null;
+    }
+
+    /**
+     * Check if a cell is part of an active explosion in a snapshot index
+     */
+    isExploding(x, y) {
+        return this.explosionMask ? this.explosionMask[this.index(x, y)] === 1 : false;
+    }
+
+    /**
+     * Build an index of a getGameState() snapshot
+     * @param {Object} gameState - {grid, players, bombs, loot, explosions}
+     * @returns {SpatialIndex}
+     */
+    static fromGameState(gameState) {
+        const height = gameState.grid.length;
+        const width = height > 0 ? gameState.grid[0].length : 0;
+        const index = new SpatialIndex(width, height);
+
+        index.bombCells = new Array(index.size).fill(null);
+        index.explosionMask = new Uint8Array(index.size);
+
+        const inBounds = (x, y) => x >= 0 && x < width && y >= 0 && y < height;
+
+        for (const player of gameState.players || []) {
+            if (player.alive && inBounds(player.x, player.y)) {
+                index.placePlayer(player);
+            }
+        }
+        for (const loot of gameState.loot || []) {
+            // Keep the first item per cell, like the old loot.find() lookups
+            if (inBounds(loot.x, loot.y) && !index.lootAt(loot.x, loot.y)) {
+                index.addLoot(loot);
+            }
+        }
+        for (const bomb of gameState.bombs || []) {
+            const cell = index.index(bomb.x, bomb.y);
+            // Keep the first bomb per cell, like the old bombs.find() lookups
+            if (inBounds(bomb.x, bomb.y) && index.bombCells[cell] === null) {
+                index.bombCells[cell] = bomb;
+            }
+        }
+        for (const explosion of gameState.explosions || []) {
+            for (const c of explosion.cells) {
+                if (inBounds(c.x, c.y)) {
+                    index.explosionMask[index.index(c.x, c.y)] = 1;
+                }
+            }
+        }
+
+        return index;
+    }
+}
+
+// Export for use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { SpatialIndex };
+}
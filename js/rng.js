@@ -1,49 +1,107 @@
 // RNG.js - Seedable Pseudo-Random Number Generator
-// Uses xorshift128+ algorithm for deterministic, reproducible randomness
+// Uses xoshiro128** (seeded through splitmix32) for deterministic,
+// reproducible randomness, with independent named sub-streams per game
+// system (terrain, loot, fallback moves, MockLLM)
 
 class SeededRNG {
     /**
      * Create a new seeded RNG
-     * @param {number} seed - Initial seed value (default: timestamp)
+     * @param {number|string} seed - Initial seed value (default: timestamp)
      */
     constructor(seed = Date.now()) {
         this.setSeed(seed);
     }
 
     /**
-     * Set or reset the seed
-     * @param {number} seed - New seed value
+     * Fold a seed (any number or string) into a 32-bit value
+     * @param {number|string} seed
+     * @returns {number} Unsigned 32-bit integer
      */
-    setSeed(seed) {
-        this.originalSeed = seed;
+    static hashSeed(seed) {
+        if (typeof seed === 'number' && Number.isFinite(seed)) {
+            // Both halves of integers up to 2^53 (Date.now() seeds) count
+            const lo = seed >>> 0;
+            const hi = Math.floor(seed / 0x100000000) >>> 0;
+            return SeededRNG.mix32(lo ^ SeededRNG.mix32(hi + 0x9E3779B9)) >>> 0;
+        }
 
-        // Initialize xorshift128+ state using splitmix64 to avoid bad seeds
-        let state = seed;
+        // FNV-1a over the string form
+        let hash = 0x811C9DC5;
+        const text = String(seed);
+        for (let i = 0; i < text.length; i++) {
+            hash = Math.imul(hash ^ text.charCodeAt(i), 0x01000193);
+        }
+        return SeededRNG.mix32(hash) >>> 0;
+    }
 
-        // Splitmix64 to generate two 32-bit values
-        state = (state ^ (state >>> 30)) * 0xBF58476D1CE4E5B9;
-        state = (state ^ (state >>> 27)) * 0x94D049BB133111EB;
-        state = state ^ (state >>> 31);
+    /**
+     * 32-bit finalizer (murmur3 fmix32): spreads every input bit over the output
+     */
+    static mix32(x) {
+        x = Math.imul(x ^ (x >>> 16), 0x85EBCA6B);
+        x = Math.imul(x ^ (x >>> 13), 0xC2B2AE35);
+        return (x ^ (x >>> 16)) >>> 0;
+    }
+
+    /**
+     * Seed of a named sub-stream: depends only on the parent seed and the
+     * name, so streams never shift when another stream is used more or less
+     * @param {number|string} seed - Parent seed
+     * @param {string} name - Stream name ('terrain', 'loot', 'moves', 'mock-llm', ...)
+     * @returns {number} Unsigned 32-bit seed
+     */
+    static streamSeed(seed, name) {
+        return SeededRNG.mix32(SeededRNG.hashSeed(seed) ^ SeededRNG.hashSeed(`stream:${name}`)) >>> 0;
+    }
+
+    /**
+     * Independent generator for a named sub-stream of a seed
+     * @param {number|string} seed - Parent seed
+     * @param {string} name - Stream name
+     * @returns {SeededRNG}
+     */
+    static forStream(seed, name) {
+        return new SeededRNG(SeededRNG.streamSeed(seed, name));
+    }
 
-        this.state0 = state >>> 0;
+    /**
+     * Independent generator for a named sub-stream of this RNG's seed
+     * (unaffected by how far this RNG has advanced)
+     * @param {string} name - Stream name
+     * @returns {SeededRNG}
+     */
+    fork(name) {
+        return SeededRNG.forStream(this.originalSeed, name);
+    }
 
-        state = (state * 0x9E3779B97F4A7C15) >>> 0;
-        state = (state ^ (state >>> 30)) * 0xBF58476D1CE4E5B9;
-        state = (state ^ (state >>> 27)) * 0x94D049BB133111EB;
-        state = state ^ (state >>> 31);
+    /**
+     * Set or reset the seed
+     * @param {number|string} seed - New seed value
+     */
+    setSeed(seed) {
+        this.originalSeed = seed;
 
-        this.state1 = state >>> 0;
+        // Expand the seed into four state words with splitmix32
+        let state = SeededRNG.hashSeed(seed);
+        const words = [];
+        for (let i = 0; i < 4; i++) {
+            state = (state + 0x9E3779B9) | 0;
+            let z = state;
+            z = Math.imul(z ^ (z >>> 16), 0x21F0AAAD);
+            z = Math.imul(z ^ (z >>> 15), 0x735A2D97);
+            words.push((z ^ (z >>> 15)) >>> 0);
+        }
+        [this.state0, this.state1, this.state2, this.state3] = words;
 
         // Ensure we don't start with zero state
-        if (this.state0 === 0 && this.state1 === 0) {
+        if ((this.state0 | this.state1 | this.state2 | this.state3) === 0) {
             this.state0 = 1;
-            this.state1 = 1;
         }
     }
 
     /**
      * Get current seed (for serialization)
-     * @returns {number} Original seed
+     * @returns {number|string} Original seed
      */
     getSeed() {
         return this.originalSeed;
@@ -51,44 +109,64 @@ class SeededRNG {
 
     /**
      * Get current internal state (for save/restore)
-     * @returns {{seed: number, state0: number, state1: number}}
+     * @returns {{seed: number, state0: number, state1: number, state2: number, state3: number}}
      */
     getState() {
         return {
             seed: this.originalSeed,
             state0: this.state0,
-            state1: this.state1
+            state1: this.state1,
+            state2: this.state2,
+            state3: this.state3
         };
     }
 
     /**
      * Restore from saved state
-     * @param {{seed: number, state0: number, state1: number}} state
+     * @param {{seed: number, state0: number, state1: number, state2: number, state3: number}} state
      */
     setState(state) {
+        if (state.state2 === undefined || state.state3 === undefined) {
+            // Saved by the old two-word generator: restart the seed's sequence
+            this.setSeed(state.seed);
+            return;
+        }
         this.originalSeed = state.seed;
-        this.state0 = state.state0;
-        this.state1 = state.state1;
+        this.state0 = state.state0 >>> 0;
+        this.state1 = state.state1 >>> 0;
+        this.state2 = state.state2 >>> 0;
+        this.state3 = state.state3 >>> 0;
     }
 
     /**
-     * Generate next random 32-bit unsigned integer using xorshift128+
+     * Generate next random 32-bit unsigned integer using xoshiro128**
      * @returns {number} Random integer [0, 2^32-1]
      */
     nextInt32() {
-        let s1 = this.state0;
-        const s0 = this.state1;
+        const s1 = this.state1;
+        const result = Math.imul(SeededRNG.rotl(Math.imul(s1, 5), 7), 9) >>> 0;
+        const t = s1 << 9;
 
-        this.state0 = s0;
+        this.state2 ^= this.state0;
+        this.state3 ^= s1;
+        this.state1 ^= this.state2;
+        this.state0 ^= this.state3;
+        this.state2 ^= t;
+        this.state3 = SeededRNG.rotl(this.state3, 11);
 
-        s1 ^= s1 << 23;
-        s1 ^= s1 >>> 17;
-        s1 ^= s0;
-        s1 ^= s0 >>> 26;
+        this.state0 >>>= 0;
+        this.state1 >>>= 0;
+        this.state2 >>>= 0;
+        this.state3 >>>= 0;
 
-        this.state1 = s1 >>> 0;
+        return result;
+    }
 
-        return (this.state0 + this.state1) >>> 0;
+    /**
+     * Rotate a 32-bit value left
+     */
+    static rotl(x, k) {
+        return (x << k) | (x >>> (32 - k));
     }
 
     /**
@@ -213,8 +291,7 @@ class SeededRNG {
      */
     clone() {
         const cloned = new SeededRNG(this.originalSeed);
-        cloned.state0 = this.state0;
-        cloned.state1 = this.state1;
+        cloned.setState(this.getState());
         return cloned;
     }
 }
@@ -0,0 +1,165 @@
+#!/usr/bin/env node
+// headless-runner.js - Browser-free Bombervibe simulation
+// Plays N seeded games with MockLLM under Node and prints one NDJSON line per game
+//
+// Usage:
+//   node js/testing/headless-runner.js --games 1000 --seed 1 --strategy tactical
+//   node js/testing/headless-runner.js --games 10 --max-rounds 50 --verbose
+
+const { loadGameCore } = require('./node-loader.js');
+
+const DEFAULTS = {
+    games: 1,
+    seed: 1,
+    strategy: 'tactical',
+    maxRounds: 200,
+    turnDelay: 1000, // Virtual ms per turn (advances the ManualClock, never sleeps)
+    verbose: false
+};
+
+/**
+ * Create a headless game with a manual clock and mock LLM
+ * @param {Object} options - {seed, strategy, turnDelay, gameOptions, mockOptions}
+ * @returns {{game: BombervibeGame, llm: MockLLM, clock: ManualClock}}
+ */
+function createGame(options = {}) {
+    const { BombervibeGame, MockLLM, ManualClock, SeededRNG } = loadGameCore();
+    const seed = options.seed !== undefined ? options.seed : DEFAULTS.seed;
+
+    const clock = new ManualClock();
+    const game = new BombervibeGame(null, seed, { testingMode: true, ...(options.gameOptions || {}) });
+    game.setClock(clock);
+    game.initialize();
+
+    const llm = new MockLLM(options.strategy || DEFAULTS.strategy, SeededRNG.forStream(seed, 'mock-llm'), options.mockOptions || {});
+
+    return { game, llm, clock };
+}
+
+/**
+ * Play one turn the way GameEngine.executeParallelTurn does
+ * @param {BombervibeGame} game
+ * @param {MockLLM} llm
+ * @param {ManualClock} clock
+ * @param {number} turnDelay - Virtual ms to advance after the turn
+ * @param {Object} overrides - Optional {playerId: move}; other players ask the MockLLM
+ */
+async function playTurn(game, llm, clock, turnDelay = DEFAULTS.turnDelay, overrides = null) {
+    const gameState = game.getGameState();
+    const moves = { ...(overrides || {}) };
+    for (const player of gameState.players) {
+        if (player.alive && !moves[player.id]) {
+            moves[player.id] = await llm.getAIMove(gameState, player.id, game);
+        }
+    }
+
+    for (const [playerId, move] of Object.entries(moves)) {
+        if (move) {
+            const player = gameState.players.find(p => p.id === parseInt(playerId));
+            if (player && player.alive) {
+                game.processMove(parseInt(playerId), move);
+            }
+        }
+    }
+
+    game.nextTurn();
+    clock.advance(turnDelay);
+}
+
+/**
+ * Summarize a game for NDJSON output
+ * @param {BombervibeGame} game
+ * @returns {Object}
+ */
+function summarizeGame(game) {
+    const gameOver = game.isGameOver();
+    const scores = {};
+    for (const player of game.players) {
+        scores[player.id] = player.score;
+    }
+
+    return {
+        seed: game.seed,
+        rounds: game.roundCount,
+        turns: game.turnCount,
+        gameOver,
+        winner: gameOver ? game.getWinner().id : null,
+        alive: game.players.filter(p => p.alive).map(p => p.id),
+        scores
+    };
+}
+
+/**
+ * Play one seeded game to completion (or maxRounds)
+ * @param {Object} options - {seed, strategy, maxRounds, turnDelay, gameOptions, mockOptions}
+ * @returns {Promise<Object>} Game summary
+ */
+async function playGame(options = {}) {
+    const maxRounds = options.maxRounds || DEFAULTS.maxRounds;
+    const turnDelay = options.turnDelay !== undefined ? options.turnDelay : DEFAULTS.turnDelay;
+    const { game, llm, clock } = createGame(options);
+
+    const start = process.hrtime.bigint();
+    while (!game.isGameOver() && game.roundCount < maxRounds) {
+        await playTurn(game, llm, clock, turnDelay);
+    }
+    const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+    return {
+        ...summarizeGame(game),
+        strategy: llm.strategy,
+        elapsedMs: Math.round(elapsedMs * 1000) / 1000
+    };
+}
+
+/**
+ * Parse --flag value pairs
+ * @param {string[]} argv - process.argv.slice(2)
+ * @returns {Object} Options
+ */
+function parseArgs(argv) {
+    const options = { ...DEFAULTS };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        switch (arg) {
+            case '--games': options.games = parseInt(argv[++i]); break;
+            case '--seed': options.seed = parseInt(argv[++i]); break;
+            case '--strategy': options.strategy = argv[++i]; break;
+            case '--max-rounds': options.maxRounds = parseInt(argv[++i]); break;
+            case '--turn-delay': options.turnDelay = parseInt(argv[++i]); break;
+            case '--verbose': options.verbose = true; break;
+            case '--help':
+                console.error('Usage: headless-runner.js [--games N] [--seed S] [--strategy random|aggressive|defensive|tactical] [--max-rounds R] [--turn-delay MS] [--verbose]');
+                process.exit(0);
+                break;
+            default:
+                throw new Error(`Unknown argument: ${arg}`);
+        }
+    }
+    return options;
+}
+
+async function main() {
+    const options = parseArgs(process.argv.slice(2));
+
+    // stdout carries NDJSON only; game debug logs go to stderr (or nowhere)
+    const toStderr = (...args) => process.stderr.write(args.join(' ') + '\n');
+    console.log = options.verbose ? toStderr : () => {};
+    console.warn = options.verbose ? toStderr : () => {};
+    // Quiet runs skip building debug strings entirely, not just printing them
+    loadGameCore().logger.configure({ level: options.verbose ? 'debug' : 'error' });
+
+    for (let i = 0; i < options.games; i++) {
+        const result = await playGame({ ...options, seed: options.seed + i });
+        process.stdout.write(JSON.stringify({ game: i, ...result }) + '\n');
+    }
+}
+
+if (require.main === module) {
+    main().catch(error => {
+        process.stderr.write(`${error.stack || error}\n`);
+        process.exit(1);
+    });
+}
+
+module.exports = { createGame, playTurn, playGame, summarizeGame, parseArgs };
@@ -268,8 +268,7 @@ class MockLLM {
             }
 
             // Check if passable
-            const cell = gameState.grid[y][x];
-            if (cell === 0 || (typeof cell === 'string' && cell.startsWith('bomb'))) {
+            if (game.board.isPassable(x, y)) {
                 validMoves.push(dir);
             }
         }
@@ -301,7 +300,7 @@ class MockLLM {
             const y = player.y + dy;
 
             if (x >= 0 && x < game.GRID_WIDTH && y >= 0 && y < game.GRID_HEIGHT) {
-                if (gameState.grid[y][x] === 1) { // Soft block
+                if (game.board.getTerrain(x, y) === 1) { // Soft block
                     return true;
                 }
             }
@@ -0,0 +1,57 @@
+// node-loader.js - Load the browser game scripts under Node.js
+// In the browser, index.html shares classes between scripts as globals.
+// This installs the same globals in Node so the game core runs unchanged
+// without a DOM or localStorage.
+
+let loaded = null;
+
+/**
+ * Install game core classes as globals (idempotent)
+ * @returns {Object} The loaded classes
+ */
+function loadGameCore() {
+    if (loaded) return loaded;
+
+    // Same order as the <script> tags in index.html
+    Object.assign(globalThis, require('../config/blocks.js'));
+    globalThis.SeededRNG = require('../rng.js');
+    Object.assign(globalThis, require('../engine/Logger.js'));
+    Object.assign(globalThis, require('../engine/GameSignals.js'));
+    Object.assign(globalThis, require('../engine/GameEvents.js'));
+    Object.assign(globalThis, require('../engine/HandleRegistry.js'));
+    Object.assign(globalThis, require('../engine/GameClock.js'));
+    Object.assign(globalThis, require('../games/bombervibe/config.js'));
+    Object.assign(globalThis, require('../games/bombervibe/BombervibePlayer.js'));
+    Object.assign(globalThis, require('../games/bombervibe/BlastFootprints.js'));
+    Object.assign(globalThis, require('../games/bombervibe/BombervibeGrid.js'));
+    Object.assign(globalThis, require('../games/bombervibe/SpatialIndex.js'));
+    Object.assign(globalThis, require('../games/bombervibe/DangerMap.js'));
+    Object.assign(globalThis, require('../games/bombervibe/BombSchedule.js'));
+    Object.assign(globalThis, require('../games/bombervibe/BombervibeGame.js'));
+    Object.assign(globalThis, require('../games/bombervibe/ObservationEncoder.js'));
+    globalThis.MockLLM = require('./mock-llm.js');
+
+    loaded = {
+        SeededRNG: globalThis.SeededRNG,
+        Logger: globalThis.Logger,
+        logger: globalThis.logger,
+        GameSignals: globalThis.GameSignals,
+        GameEvents: globalThis.GameEvents,
+        HandleRegistry: globalThis.HandleRegistry,
+        GameClock: globalThis.GameClock,
+        ManualClock: globalThis.ManualClock,
+        BombervibeConfig: globalThis.BombervibeConfig,
+        Player: globalThis.Player,
+        BlastFootprints: globalThis.BlastFootprints,
+        BombervibeGrid: globalThis.BombervibeGrid,
+        SpatialIndex: globalThis.SpatialIndex,
+        DangerMap: globalThis.DangerMap,
+        BombSchedule: globalThis.BombSchedule,
+        BombervibeGame: globalThis.BombervibeGame,
+        ObservationEncoder: globalThis.ObservationEncoder,
+        MockLLM: globalThis.MockLLM
+    };
+    return loaded;
+}
+
+module.exports = { loadGameCore };
@@ -0,0 +1,219 @@
+#!/usr/bin/env node
+// rpc-server.js - Headless game engine over a stdio JSON-RPC protocol
+// One process hosts many concurrent games; drive it from tests/headless (Python)
+//
+// Protocol: one JSON-RPC 2.0 message per line on stdin, one response per line on stdout
+//   -> {"jsonrpc": "2.0", "id": 1, "method": "create-game", "params": {"seed": 42}}
+//   <- {"jsonrpc": "2.0", "id": 1, "result": {"gameId": 1, "seed": 42}}
+//
+// Methods:
+//   create-game     {seed, strategy, turnDelay, gameOptions, mockOptions} -> {gameId, seed}
+//   step            {gameId, turns = 1, moves = {playerId: move}}         -> summary
+//   get-state       {gameId}                                               -> getGameState()
+//   run-until-done  {gameId, maxRounds = 200}                              -> summary
+//   destroy-game    {gameId}                                               -> true
+//   step-batch      {steps: [{gameId, moves}], includeState, observations} -> {results, observations, players}
+//   observe         {gameIds}                                              -> {observations, players}
+//   observation-spec {}                                                    -> ObservationEncoder.describe()
+//
+// Observations are ObservationEncoder buffers for all requested games,
+// base64-encoded: `observations` is uint8 [game][plane][y][x] and `players`
+// is float32 [game][player][feature].
+
+const readline = require('readline');
+const { loadGameCore } = require('./node-loader.js');
+const { createGame, playTurn, summarizeGame } = require('./headless-runner.js');
+
+// JSON-RPC 2.0 error codes
+const PARSE_ERROR = -32700;
+const METHOD_NOT_FOUND = -32601;
+const INVALID_PARAMS = -32602;
+const SERVER_ERROR = -32000;
+
+class RpcError extends Error {
+    constructor(code, message) {
+        super(message);
+        this.code = code;
+    }
+}
+
+/**
+ * GameHost - Owns the games of one server process
+ *
+ * Requests for different games interleave freely; requests for the same
+ * game are queued so turns never overlap.
+ */
+class GameHost {
+    constructor() {
+        this.games = new Map(); // gameId -> {game, llm, clock, turnDelay, queue}
+        this.nextGameId = 1;
+
+        const { ObservationEncoder } = loadGameCore();
+        this.encoder = new ObservationEncoder();
+    }
+
+    getEntry(gameId) {
+        const entry = this.games.get(gameId);
+        if (!entry) {
+            throw new RpcError(INVALID_PARAMS, `Unknown gameId: ${gameId}`);
+        }
+        return entry;
+    }
+
+    /**
+     * Run a task after any pending work on the same game
+     */
+    enqueue(gameId, task) {
+        const entry = this.getEntry(gameId);
+        const result = entry.queue.then(() => task(entry));
+        entry.queue = result.catch(() => {});
+        return result;
+    }
+
+    createGame(params = {}) {
+        const seed = params.seed !== undefined ? params.seed : Date.now();
+        const { game, llm, clock } = createGame({ ...params, seed });
+        const gameId = this.nextGameId++;
+        this.games.set(gameId, {
+            game,
+            llm,
+            clock,
+            turnDelay: params.turnDelay !== undefined ? params.turnDelay : 1000,
+            queue: Promise.resolve()
+        });
+        return { gameId, seed };
+    }
+
+    step({ gameId, turns = 1, moves = null }) {
+        return this.enqueue(gameId, async ({ game, llm, clock, turnDelay }) => {
+            for (let i = 0; i < turns && !game.isGameOver(); i++) {
+                await playTurn(game, llm, clock, turnDelay, i === 0 ? moves : null);
+            }
+            return summarizeGame(game);
+        });
+    }
+
+    /**
+     * Play one turn in each of several games (vectorized environments)
+     * Finished games are not advanced; their summary is returned as-is.
+     */
+    async stepBatch({ steps, includeState = false, observations = false }) {
+        const results = await Promise.all(steps.map(({ gameId, moves = null }) =>
+            this.enqueue(gameId, async ({ game, llm, clock, turnDelay }) => {
+                if (!game.isGameOver()) {
+                    await playTurn(game, llm, clock, turnDelay, moves);
+                }
+                const result = summarizeGame(game);
+                if (includeState) {
+                    result.state = game.getGameState();
+                }
+                return result;
+            })
+        ));
+
+        const response = { results };
+        if (observations) {
+            Object.assign(response, this.observe({ gameIds: steps.map(step => step.gameId) }));
+        }
+        return response;
+    }
+
+    /**
+     * Encode the current observation of several games into one buffer
+     */
+    observe({ gameIds }) {
+        const games = gameIds.map(gameId => this.getEntry(gameId).game);
+        const planes = this.encoder.encodeBatch(games);
+        const players = this.encoder.encodePlayers(games);
+        return {
+            observations: Buffer.from(planes.buffer, planes.byteOffset, planes.byteLength).toString('base64'),
+            players: Buffer.from(players.buffer, players.byteOffset, players.byteLength).toString('base64')
+        };
+    }
+
+    getState({ gameId }) {
+        return this.enqueue(gameId, ({ game }) => game.getGameState());
+    }
+
+    runUntilDone({ gameId, maxRounds = 200 }) {
+        return this.enqueue(gameId, async ({ game, llm, clock, turnDelay }) => {
+            while (!game.isGameOver() && game.roundCount < maxRounds) {
+                await playTurn(game, llm, clock, turnDelay);
+                // Yield to the event loop so other games' requests keep flowing
+                await new Promise(resolve => setImmediate(resolve));
+            }
+            return summarizeGame(game);
+        });
+    }
+
+    destroyGame({ gameId }) {
+        return this.enqueue(gameId, () => {
+            this.games.delete(gameId);
+            return true;
+        });
+    }
+
+    /**
+     * Dispatch one JSON-RPC call
+     * @returns {Promise<*>} Result
+     */
+    async dispatch(method, params = {}) {
+        switch (method) {
+            case 'create-game': return this.createGame(params);
+            case 'step': return this.step(params);
+            case 'get-state': return this.getState(params);
+            case 'run-until-done': return this.runUntilDone(params);
+            case 'destroy-game': return this.destroyGame(params);
+            case 'step-batch': return this.stepBatch(params);
+            case 'observe': return this.observe(params);
+            case 'observation-spec': return this.encoder.describe();
+            default:
+                throw new RpcError(METHOD_NOT_FOUND, `Method not found: ${method}`);
+        }
+    }
+}
+
+function send(message) {
+    process.stdout.write(JSON.stringify({ jsonrpc: '2.0', ...message }) + '\n');
+}
+
+async function handleLine(host, line) {
+    if (!line.trim()) return;
+
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (error) {
+        send({ id: null, error: { code: PARSE_ERROR, message: error.message } });
+        return;
+    }
+
+    try {
+        const result = await host.dispatch(request.method, request.params);
+        send({ id: request.id, result });
+    } catch (error) {
+        send({
+            id: request.id,
+            error: { code: error.code || SERVER_ERROR, message: error.message }
+        });
+    }
+}
+
+function main() {
+    // stdout carries protocol messages only; game debug logs go to stderr (or nowhere)
+    const verbose = process.argv.includes('--verbose');
+    const toStderr = (...args) => process.stderr.write(args.join(' ') + '\n');
+    console.log = verbose ? toStderr : () => {};
+    console.warn = verbose ? toStderr : () => {};
+    loadGameCore().logger.configure({ level: verbose ? 'debug' : 'error' });
+
+    const host = new GameHost();
+    const input = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    input.on('line', line => handleLine(host, line));
+}
+
+if (require.main === module) {
+    main();
+}
+
+module.exports = { GameHost, RpcError };
@@ -76,7 +76,7 @@ class SeedFinder {
         if (constraints.hasOpenCenter) {
             const centerX = Math.floor(game.GRID_WIDTH / 2);
             const centerY = Math.floor(game.GRID_HEIGHT / 2);
-            if (game.grid[centerY][centerX] !== 0) {
+            if (game.board.getTerrain(centerX, centerY) !== 0) {
                 return false;
             }
         }
@@ -100,7 +100,7 @@ class SeedFinder {
         // Check specific positions
         if (constraints.emptyPositions) {
             for (const pos of constraints.emptyPositions) {
-                if (game.grid[pos.y][pos.x] !== 0) {
+                if (game.board.getTerrain(pos.x, pos.y) !== 0) {
                     return false;
                 }
             }
@@ -108,7 +108,7 @@ class SeedFinder {
 
         if (constraints.softBlockPositions) {
             for (const pos of constraints.softBlockPositions) {
-                if (game.grid[pos.y][pos.x] !== 1) {
+                if (game.board.getTerrain(pos.x, pos.y) !== 1) {
                     return false;
                 }
             }
@@ -136,7 +136,7 @@ class SeedFinder {
             emptySpaces,
             clusters: clusters.length,
             largestCluster,
-            centerOpen: game.grid[Math.floor(game.GRID_HEIGHT / 2)][Math.floor(game.GRID_WIDTH / 2)] === 0
+            centerOpen: game.board.getTerrain(Math.floor(game.GRID_WIDTH / 2), Math.floor(game.GRID_HEIGHT / 2)) === 0
         };
     }
 
@@ -150,7 +150,7 @@ class SeedFinder {
         let count = 0;
         for (let y = 0; y < game.GRID_HEIGHT; y++) {
             for (let x = 0; x < game.GRID_WIDTH; x++) {
-                if (game.grid[y][x] === cellType) {
+                if (game.board.getTerrain(x, y) === cellType) {
                     count++;
                 }
             }
@@ -175,7 +175,7 @@ class SeedFinder {
             if (x < 0 || x >= game.GRID_WIDTH || y < 0 || y >= game.GRID_HEIGHT) {
                 return;
             }
-            if (visited[y][x] || game.grid[y][x] !== cellType) {
+            if (visited[y][x] || game.board.getTerrain(x, y) !== cellType) {
                 return;
             }
 
@@ -191,7 +191,7 @@ class SeedFinder {
 
         for (let y = 0; y < game.GRID_HEIGHT; y++) {
             for (let x = 0; x < game.GRID_WIDTH; x++) {
-                if (!visited[y][x] && game.grid[y][x] === cellType) {
+                if (!visited[y][x] && game.board.getTerrain(x, y) === cellType) {
                     const cluster = [];
                     floodFill(x, y, cluster);
                     if (cluster.length > 0) {
@@ -276,7 +276,7 @@ class SeedFinder {
                     continue;
                 }
 
-                const cell = game.grid[ny][nx];
+                const cell = game.board.getTerrain(nx, ny);
                 // Can walk through empty spaces and soft blocks (soft blocks can be destroyed)
                 if (cell === 0 || cell === 1) {
                     visited.add(key);
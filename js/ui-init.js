@@ -12,22 +12,31 @@ let replayPlayer = null;
 let isReplayMode = false;
 let gameOverDetected = false;
 
+// Event log: ring buffer + virtualized panel (attached on DOMContentLoaded)
+const logStore = new LogStore({ capacity: 5000 });
+const logPanel = new LogPanel(logStore);
+
 // Helper functions from legacy ui.js that are still needed
 function log(message, type = 'info') {
-    const logContent = document.getElementById('logContent');
-    if (!logContent) return;
-
-    const timestamp = new Date().toLocaleTimeString();
-    const entry = document.createElement('div');
-    entry.textContent = `[${timestamp}] ${message}`;
+    logStore.add(message, type);
+}
 
-    if (type === 'error') entry.style.color = '#ff3300';
-    else if (type === 'success') entry.style.color = '#00ff00';
+// Wire log panel filters and export
+function initializeLogPanel() {
+    if (!logPanel.attach()) return;
 
-    logContent.insertBefore(entry, logContent.firstChild);
+    const levelFilter = document.getElementById('logLevelFilter');
+    const playerFilter = document.getElementById('logPlayerFilter');
+    const applyFilter = () => logPanel.setFilter({
+        level: levelFilter ? levelFilter.value : null,
+        playerId: playerFilter ? playerFilter.value : null
+    });
+    if (levelFilter) levelFilter.addEventListener('change', applyFilter);
+    if (playerFilter) playerFilter.addEventListener('change', applyFilter);
 
-    while (logContent.children.length > 20) {
-        logContent.removeChild(logContent.lastChild);
+    const exportButton = document.getElementById('exportLog');
+    if (exportButton) {
+        exportButton.addEventListener('click', () => logPanel.download('text'));
     }
 }
 
@@ -53,6 +62,13 @@ function closeErrorModal() {
 
 // Initialize on page load
 window.addEventListener('DOMContentLoaded', () => {
+    // ?log=debug or ?log=warn,explode:debug sets console debug levels (default: info)
+    const logParam = new URLSearchParams(window.location.search).get('log');
+    if (logParam) {
+        logger.configureFromString(logParam);
+    }
+
+    initializeLogPanel();
     log('Initializing game with new architecture...');
 
     try {
@@ -60,7 +76,10 @@ window.addEventListener('DOMContentLoaded', () => {
         prompts = new BombervibePrompts();
         game = new BombervibeGame(prompts, null, { testingMode: false });
         llm = new LLMAdapter();
-        renderer = new BombervibeRenderer();
+        // ?renderer=canvas draws the board on a <canvas> instead of DOM cells
+        const params = new URLSearchParams(window.location.search);
+        const rendererParam = params.get('renderer');
+        renderer = rendererParam === 'canvas' ? new BombervibeCanvasRenderer() : new BombervibeRenderer();
         engine = new GameEngine(game, llm, renderer);
         gameHistory = new GameHistory();
 
@@ -68,7 +87,8 @@ window.addEventListener('DOMContentLoaded', () => {
         engine.initialize({
             turnDelay: 1000,
             autoPlay: true,
-            parallelAI: true
+            parallelAI: true,
+            showDanger: params.has('danger') // ?danger outlines cells a pending blast will reach
         });
 
         // Set renderer's LLM reference
@@ -28,44 +28,6 @@ fi
 echo "✓ Environment ready"
 echo ""
 
-# Run each test suite
-TESTS=(
-    "test_seeded_world.py"
-    "test_mock_llm.py"
-    "test_game_mechanics.py"
-)
-
-PASSED=0
-FAILED=0
-
-for test in "${TESTS[@]}"; do
-    echo "═══════════════════════════════════════════════════════════"
-    echo "Running: $test"
-    echo "═══════════════════════════════════════════════════════════"
-
-    if python "tests/$test"; then
-        ((PASSED++))
-        echo "✓ PASSED: $test"
-    else
-        ((FAILED++))
-        echo "✗ FAILED: $test"
-    fi
-    echo ""
-done
-
-echo "╔══════════════════════════════════════════════════════════╗"
-echo "║                    TEST SUMMARY                          ║"
-echo "╠══════════════════════════════════════════════════════════╣"
-echo "║  Passed: $PASSED                                                ║"
-echo "║  Failed: $FAILED                                                ║"
-echo "╚══════════════════════════════════════════════════════════╝"
-
-if [ $FAILED -eq 0 ]; then
-    echo ""
-    echo "🎉 All tests passed!"
-    exit 0
-else
-    echo ""
-    echo "❌ Some tests failed"
-    exit 1
-fi
+# Run every test in tests/, sharded across worker processes
+# (pass -n N to set the worker count, -k NAME to filter, or test files)
+python tests/parallel_runner.py "$@"
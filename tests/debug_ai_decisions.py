@@ -3,7 +3,7 @@
 Debug AI Decision Making
 
 Watches AI behavior to see why they're not bombing breakable blocks.
-Extracts console logs showing:
+Drains structured game events (llm-response, bomb-placed) showing:
 - When players are adjacent to breakable blocks
 - Whether they drop bombs or just move
 - Their thought process
@@ -20,6 +20,12 @@ from playwright.sync_api import sync_playwright
 # Load API keys from tests/.env
 load_dotenv(Path(__file__).parent / '.env')
 
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import drain_events
+
+EVENT_TYPES = ['llm-response', 'bomb-placed']
+
 def test_gameplay():
     # Get API key from environment
     api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
@@ -45,16 +51,13 @@ def test_gameplay():
         context = browser.new_context()
         page = context.new_page()
 
-        # Store console logs with structured parsing
-        all_logs = []
+        # AI decisions and bomb placements, drained while the game runs
+        events = []
 
         def handle_console(msg):
-            text = msg.text
-            all_logs.append(text)
-
-            # Print important info
-            if any(keyword in text for keyword in ['[ROUND', 'GAME OVER', 'ERROR', 'Breakable', 'dropBomb', 'TEST MODE']):
-                print(text)
+            # Print progress info (analysis uses events, not console text)
+            if any(keyword in msg.text for keyword in ['[ROUND', 'GAME OVER', 'ERROR', 'TEST MODE']):
+                print(msg.text)
 
         page.on('console', handle_console)
 
@@ -82,6 +85,7 @@ def test_gameplay():
 
         while time.time() - start < timeout_seconds:
             time.sleep(0.5)  # Poll every 500ms
+            events.extend(drain_events(page, types=EVENT_TYPES))
 
             # Check if test completed
             completion = page.evaluate("window.testCompleteData")
@@ -99,16 +103,19 @@ def test_gameplay():
         if not test_complete:
             print(f'\n⚠ Test timed out after {timeout_seconds} seconds')
 
+        events.extend(drain_events(page, types=EVENT_TYPES))
+        decisions = [e for e in events if e['type'] == 'llm-response']
+
         # Analyze patterns
         print('\n=== ANALYSIS ===')
 
         # Find instances where AI mentioned blocks in their thoughts
         opportunity_logs = []
-        for i, log in enumerate(all_logs):
+        for event in decisions:
             # Look for AI thoughts mentioning adjacent blocks or "Summary shows"
-            if '"thought"' in log:
-                thought_match = re.search(r'"thought":\s*"([^"]+)"', log)
-                thought = thought_match.group(1) if thought_match else ""
+            move = event.get('move') or {}
+            thought = move.get('thought') or ''
+            if thought:
 
                 # Check for various patterns indicating adjacent blocks
                 patterns = [
@@ -132,11 +139,11 @@ def test_gameplay():
 
                 # Only count if they explicitly mention having blocks to bomb
                 if matched and any(keyword in thought.lower() for keyword in ['summary shows', 'blocks adjacent', 'soft block', 'adjacent']):
-                    decision_match = re.search(r'"dropBomb":\s*(true|false)', log)
-                    decision = decision_match.group(1) == 'true' if decision_match else None
+                    drop_bomb = move.get('dropBomb')
+                    decision = drop_bomb if isinstance(drop_bomb, bool) else None
 
                     opportunity_logs.append({
-                        'log': log,
+                        'event': event,
                         'block_count': block_count,
                         'dropped_bomb': decision,
                         'thought': thought
@@ -174,12 +181,13 @@ def test_gameplay():
                 print(f'Thought: "{opp["thought"]}"')
 
         # Count bomb drops vs moves
-        bomb_drops = len([log for log in all_logs if '"dropBomb": true' in log])
-        total_decisions = len([log for log in all_logs if '"dropBomb"' in log])
+        bomb_drops = len([e for e in decisions if (e.get('move') or {}).get('dropBomb') is True])
+        total_decisions = len(decisions)
+        bombs_placed = len([e for e in events if e['type'] == 'bomb-placed'])
 
         print(f'\n=== OVERALL STATS ===')
         print(f'Total AI decisions: {total_decisions}')
-        print(f'Bombs dropped: {bomb_drops}')
+        print(f'Bombs dropped: {bomb_drops} ({bombs_placed} actually placed)')
         print(f'Bomb rate: {bomb_drops/total_decisions*100:.1f}%' if total_decisions > 0 else 'N/A')
         print(f'Opportunities with adjacent blocks: {len(opportunity_logs)}')
         print(f'Conversion rate: {bombed_count/len(opportunity_logs)*100:.1f}%' if opportunity_logs else 'N/A')
@@ -0,0 +1,34 @@
+"""
+Headless Bombervibe engines driven over stdio JSON-RPC
+
+Runs BombervibeGame under Node (js/testing/rpc-server.js) without a browser,
+so analytics and bulk simulations skip the Playwright round-trip entirely.
+
+Example:
+    import asyncio
+    from headless import EnginePool
+
+    async def main():
+        async with EnginePool() as pool:
+            results = await pool.run_games(range(1, 1001), strategy='tactical')
+
+    asyncio.run(main())
+"""
+
+from .client import HeadlessEngine, HeadlessEngineError, RPC_SERVER_PATH
+from .pool import EnginePool, run_games
+from .env import BombervibeVecEnv, ACTIONS, NUM_ACTIONS, MOCK_ACTION, OBSERVATION_PLANES, decode_observations
+
+__all__ = [
+    'HeadlessEngine',
+    'HeadlessEngineError',
+    'RPC_SERVER_PATH',
+    'EnginePool',
+    'run_games',
+    'BombervibeVecEnv',
+    'ACTIONS',
+    'NUM_ACTIONS',
+    'MOCK_ACTION',
+    'OBSERVATION_PLANES',
+    'decode_observations',
+]
@@ -0,0 +1,234 @@
+"""
+Asyncio client for one headless engine process
+
+Each HeadlessEngine owns a `node js/testing/rpc-server.js` subprocess and
+multiplexes any number of concurrent calls over its stdin/stdout: requests
+carry ids and responses are matched back to their futures as they arrive.
+"""
+
+import asyncio
+import base64
+import itertools
+import json
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RPC_SERVER_PATH = PROJECT_ROOT / 'js' / 'testing' / 'rpc-server.js'
+
+# getGameState() lines can be long; raise asyncio's 64KB default line limit
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class HeadlessEngineError(RuntimeError):
+    """JSON-RPC error returned by the engine (or the engine exited)"""
+
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+
+class HeadlessEngine:
+    """
+    One Node engine process hosting many games
+
+    Usage:
+        async with HeadlessEngine() as engine:
+            game_id = await engine.create_game(seed=42, strategy='tactical')
+            summary = await engine.run_until_done(game_id)
+    """
+
+    def __init__(self, node='node', verbose=False):
+        """
+        Args:
+            node: Node.js executable
+            verbose: Forward game debug logs to this process's stderr
+        """
+        self.node = node
+        self.verbose = verbose
+        self.process = None
+        self._ids = itertools.count(1)
+        self._pending = {}  # request id -> Future
+        self._reader = None
+
+    async def start(self):
+        """Spawn the engine process"""
+        args = [str(RPC_SERVER_PATH)] + (['--verbose'] if self.verbose else [])
+        self.process = await asyncio.create_subprocess_exec(
+            self.node, *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=None if self.verbose else asyncio.subprocess.DEVNULL,
+            limit=STREAM_LIMIT
+        )
+        self._reader = asyncio.create_task(self._read_responses())
+        return self
+
+    async def _read_responses(self):
+        """Resolve pending futures as response lines arrive"""
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+
+                message = json.loads(line)
+                future = self._pending.pop(message.get('id'), None)
+                if future is None or future.done():
+                    continue
+
+                if 'error' in message:
+                    error = message['error']
+                    future.set_exception(HeadlessEngineError(error['message'], error.get('code')))
+                else:
+                    future.set_result(message.get('result'))
+        finally:
+            # Engine exited (or reader cancelled): fail anything still waiting
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(HeadlessEngineError('Engine process exited'))
+            self._pending.clear()
+
+    async def call(self, method, **params):
+        """
+        Send one JSON-RPC request and await its result
+
+        Args:
+            method: Method name (e.g. 'create-game')
+            **params: Method parameters
+
+        Returns:
+            The decoded result
+        """
+        if self.process is None or self.process.returncode is not None:
+            raise HeadlessEngineError('Engine process is not running')
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+        self.process.stdin.write((json.dumps(message) + '\n').encode())
+        await self.process.stdin.drain()
+
+        return await future
+
+    async def create_game(self, seed=None, strategy='tactical', turn_delay=1000,
+                          game_options=None, mock_options=None):
+        """
+        Create a game with a seeded MockLLM
+
+        Args:
+            seed: World seed (default: engine's Date.now())
+            strategy: MockLLM strategy for players without explicit moves
+            turn_delay: Virtual ms per turn (explosion lifetimes)
+            game_options: Extra BombervibeGame options
+            mock_options: Extra MockLLM options (e.g. scriptedMoves)
+
+        Returns:
+            int: Game id
+        """
+        params = {'strategy': strategy, 'turnDelay': turn_delay,
+                  'gameOptions': game_options or {}, 'mockOptions': mock_options or {}}
+        if seed is not None:
+            params['seed'] = seed
+
+        result = await self.call('create-game', **params)
+        return result['gameId']
+
+    async def step(self, game_id, moves=None, turns=1):
+        """
+        Play turns
+
+        Args:
+            game_id: Game id
+            moves: Optional {player_id: move} for the first turn; other players use MockLLM
+            turns: Number of turns to play (stops early on game over)
+
+        Returns:
+            dict: Game summary (rounds, turns, gameOver, winner, alive, scores)
+        """
+        params = {'gameId': game_id, 'turns': turns}
+        if moves:
+            params['moves'] = {str(player_id): move for player_id, move in moves.items()}
+        return await self.call('step', **params)
+
+    async def step_batch(self, steps, include_state=False, observations=False):
+        """
+        Play one turn in each of several games with a single round-trip
+
+        Args:
+            steps: List of (game_id, moves) pairs; moves may be None
+            include_state: Also return each game's getGameState() in its result
+            observations: Also return the encoded observation buffers (see observe())
+
+        Returns:
+            dict: 'results' (summaries in input order), plus 'observations' and
+                  'players' bytes when requested
+        """
+        payload = []
+        for game_id, moves in steps:
+            step = {'gameId': game_id}
+            if moves:
+                step['moves'] = {str(player_id): move for player_id, move in moves.items()}
+            payload.append(step)
+
+        response = await self.call('step-batch', steps=payload, includeState=include_state,
+                                   observations=observations)
+        return self._decode_observations(response)
+
+    async def observe(self, game_ids):
+        """
+        Encode the current observation of several games
+
+        Returns:
+            dict: 'observations' (uint8 bytes, [game][plane][y][x]) and
+                  'players' (float32 bytes, [game][player][feature])
+        """
+        response = await self.call('observe', gameIds=list(game_ids))
+        return self._decode_observations(response)
+
+    async def observation_spec(self):
+        """Return plane names, grid size and player feature names"""
+        return await self.call('observation-spec')
+
+    @staticmethod
+    def _decode_observations(response):
+        for key in ('observations', 'players'):
+            if key in response:
+                response[key] = base64.b64decode(response[key])
+        return response
+
+    async def get_state(self, game_id):
+        """Return the game's getGameState()"""
+        return await self.call('get-state', gameId=game_id)
+
+    async def run_until_done(self, game_id, max_rounds=200):
+        """Play until game over or max_rounds; returns the game summary"""
+        return await self.call('run-until-done', gameId=game_id, maxRounds=max_rounds)
+
+    async def destroy_game(self, game_id):
+        """Free a finished game"""
+        return await self.call('destroy-game', gameId=game_id)
+
+    async def close(self):
+        """Stop the engine process"""
+        if self.process is None:
+            return
+
+        if self.process.returncode is None:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+        if self._reader is not None:
+            await self._reader
+        self.process = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,212 @@
+"""
+Vectorized Gym-style environment over headless BombervibeGame instances
+
+BombervibeVecEnv steps K games in lockstep with one JSON-RPC round-trip per
+step() and returns NumPy arrays. Every game has the same 4 players, so
+actions, rewards and per-player observations are shaped (K, 4, ...).
+
+Observations come from js/games/bombervibe/ObservationEncoder.js as one
+contiguous buffer per step, viewed with np.frombuffer (no per-cell parsing):
+    'planes'  (K, C, H, W) uint8   - see OBSERVATION_PLANES
+    'players' (K, 4, F) float32    - see PLAYER_FEATURES
+The arrays are read-only views; copy them if you need to modify them.
+
+Usage:
+    env = BombervibeVecEnv(num_envs=64, seed=1)
+    obs = env.reset()
+    actions = np.random.randint(0, NUM_ACTIONS, size=(64, 4))
+    obs, rewards, dones, infos = env.step(actions)
+    env.close()
+"""
+
+import asyncio
+
+import numpy as np
+
+from .client import HeadlessEngine
+
+NUM_PLAYERS = 4
+GRID_WIDTH = 13
+GRID_HEIGHT = 11
+
+# Discrete actions: index -> (direction, dropBomb)
+ACTIONS = [
+    ('stay', False), ('up', False), ('down', False), ('left', False), ('right', False),
+    ('stay', True), ('up', True), ('down', True), ('left', True), ('right', True),
+]
+NUM_ACTIONS = len(ACTIONS)
+
+# Action value that lets the game's MockLLM choose for that player
+MOCK_ACTION = -1
+
+# Must match ObservationEncoder.js (checked against observation-spec on startup)
+OBSERVATION_PLANES = (
+    'hard', 'soft', 'bomb_timer', 'blast_range', 'loot_type',
+    'player_1', 'player_2', 'player_3', 'player_4', 'danger',
+)
+PLAYER_FEATURES = (
+    'x', 'y', 'alive', 'score', 'bombRange', 'maxBombs', 'activeBombs', 'canPickupBombs',
+)
+SCORE = PLAYER_FEATURES.index('score')
+ALIVE = PLAYER_FEATURES.index('alive')
+
+DEFAULT_DEATH_PENALTY = -100.0
+
+
+def decode_observations(response, num_games):
+    """
+    View encoded observation buffers as NumPy arrays (zero-copy)
+
+    Args:
+        response: dict with 'observations' and 'players' bytes
+        num_games: Number of games encoded
+
+    Returns:
+        dict: 'planes' (K, C, H, W) uint8 and 'players' (K, 4, F) float32
+    """
+    planes = np.frombuffer(response['observations'], dtype=np.uint8)
+    players = np.frombuffer(response['players'], dtype=np.float32)
+    return {
+        'planes': planes.reshape(num_games, len(OBSERVATION_PLANES), GRID_HEIGHT, GRID_WIDTH),
+        'players': players.reshape(num_games, NUM_PLAYERS, len(PLAYER_FEATURES)),
+    }
+
+
+class BombervibeVecEnv:
+    """
+    K Bombervibe games stepped in lockstep
+
+    Rewards per player are score deltas (Player.addScore: blocks and kills)
+    plus `death_penalty` on the step a player dies. A game is done when it
+    has a winner or reaches `max_rounds`; done games are reset automatically
+    with the next seed and their final summary is reported in infos.
+    """
+
+    def __init__(self, num_envs, seed=1, strategy='tactical', max_rounds=200,
+                 death_penalty=DEFAULT_DEATH_PENALTY, turn_delay=1000, node='node'):
+        """
+        Args:
+            num_envs: Number of games (K)
+            seed: Seed of the first game; later games and resets count upwards
+            strategy: MockLLM strategy for players given MOCK_ACTION
+            max_rounds: Episode round limit
+            death_penalty: Reward added when a player dies
+            turn_delay: Virtual ms per turn (explosion lifetimes)
+            node: Node.js executable
+        """
+        self.num_envs = num_envs
+        self.strategy = strategy
+        self.max_rounds = max_rounds
+        self.death_penalty = death_penalty
+        self.turn_delay = turn_delay
+
+        self.next_seed = seed
+        self.game_ids = [None] * num_envs
+        self.seeds = [None] * num_envs
+        self._scores = np.zeros((num_envs, NUM_PLAYERS), dtype=np.float32)
+        self._alive = np.ones((num_envs, NUM_PLAYERS), dtype=bool)
+
+        self._loop = asyncio.new_event_loop()
+        self.engine = self._loop.run_until_complete(HeadlessEngine(node=node).start())
+
+        spec = self._loop.run_until_complete(self.engine.observation_spec())
+        if tuple(spec['planes']) != OBSERVATION_PLANES or tuple(spec['playerFeatures']) != PLAYER_FEATURES:
+            self.close()
+            raise RuntimeError('ObservationEncoder layout does not match headless.env')
+
+    def _take_seed(self):
+        seed = self.next_seed
+        self.next_seed += 1
+        return seed
+
+    async def _new_game(self, index):
+        """Replace game `index` with a fresh one"""
+        if self.game_ids[index] is not None:
+            await self.engine.destroy_game(self.game_ids[index])
+
+        seed = self._take_seed()
+        self.game_ids[index] = await self.engine.create_game(
+            seed=seed, strategy=self.strategy, turn_delay=self.turn_delay
+        )
+        self.seeds[index] = seed
+
+    def _observe(self, response):
+        obs = decode_observations(response, self.num_envs)
+        self._scores = obs['players'][:, :, SCORE].copy()
+        self._alive = obs['players'][:, :, ALIVE] > 0
+        return obs
+
+    def reset(self, seed=None):
+        """
+        Start K new games
+
+        Args:
+            seed: Optional new base seed
+
+        Returns:
+            dict: Observations 'planes' and 'players' with a leading K axis
+        """
+        if seed is not None:
+            self.next_seed = seed
+
+        async def _reset():
+            # Seeds are taken in order, so create games sequentially
+            for i in range(self.num_envs):
+                await self._new_game(i)
+            return await self.engine.observe(self.game_ids)
+
+        return self._observe(self._loop.run_until_complete(_reset()))
+
+    def _moves_for(self, actions):
+        """Convert a (4,) row of action indices to a {player_id: move} dict"""
+        moves = {}
+        for player_index, action in enumerate(actions):
+            if action == MOCK_ACTION:
+                continue
+            direction, drop_bomb = ACTIONS[action]
+            moves[player_index + 1] = {'action': 'move', 'direction': direction, 'dropBomb': drop_bomb}
+        return moves
+
+    def step(self, actions):
+        """
+        Play one turn in every game
+
+        Args:
+            actions: (K, 4) ints in [0, NUM_ACTIONS) or MOCK_ACTION
+
+        Returns:
+            tuple: (observations, rewards (K, 4) float32, dones (K,) bool, infos list[dict])
+        """
+        actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs, NUM_PLAYERS)
+        steps = [(game_id, self._moves_for(row)) for game_id, row in zip(self.game_ids, actions)]
+
+        async def _step():
+            response = await self.engine.step_batch(steps, observations=True)
+            obs = decode_observations(response, self.num_envs)
+
+            scores = obs['players'][:, :, SCORE]
+            alive = obs['players'][:, :, ALIVE] > 0
+            rewards = (scores - self._scores).astype(np.float32)
+            rewards[self._alive & ~alive] += self.death_penalty
+
+            dones = np.zeros(self.num_envs, dtype=bool)
+            infos = [{} for _ in range(self.num_envs)]
+            for i, result in enumerate(response['results']):
+                dones[i] = result['gameOver'] or result['rounds'] >= self.max_rounds
+                if dones[i]:
+                    infos[i] = {'episode': result, 'truncated': not result['gameOver']}
+                    await self._new_game(i)
+
+            # Finished games were replaced: observe again so they show their first frame
+            if dones.any():
+                response = await self.engine.observe(self.game_ids)
+            return self._observe(response), rewards, dones, infos
+
+        return self._loop.run_until_complete(_step())
+
+    def close(self):
+        """Stop the engine process"""
+        if self.engine is not None:
+            self._loop.run_until_complete(self.engine.close())
+            self.engine = None
+        self._loop.close()
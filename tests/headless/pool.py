@@ -0,0 +1,105 @@
+"""
+Spread headless games across cores
+
+EnginePool runs one engine process per core and hands games out
+round-robin; each engine multiplexes its share of games concurrently.
+"""
+
+import asyncio
+import os
+
+from .client import HeadlessEngine
+
+# Concurrent games per engine process (each is cheap; this bounds memory)
+DEFAULT_GAMES_PER_ENGINE = 256
+
+
+class EnginePool:
+    """
+    Pool of HeadlessEngine processes
+
+    Usage:
+        async with EnginePool(size=8) as pool:
+            results = await pool.run_games(range(1000), strategy='aggressive')
+    """
+
+    def __init__(self, size=None, games_per_engine=DEFAULT_GAMES_PER_ENGINE, node='node'):
+        """
+        Args:
+            size: Number of engine processes (default: CPU count)
+            games_per_engine: Max concurrent games per process
+            node: Node.js executable
+        """
+        self.size = size or os.cpu_count() or 1
+        self.games_per_engine = games_per_engine
+        self.node = node
+        self.engines = []
+        self._slots = []
+
+    async def start(self):
+        """Spawn all engine processes"""
+        self.engines = await asyncio.gather(*(
+            HeadlessEngine(node=self.node).start() for _ in range(self.size)
+        ))
+        self._slots = [asyncio.Semaphore(self.games_per_engine) for _ in self.engines]
+        return self
+
+    async def play(self, index, seed, strategy='tactical', max_rounds=200, **options):
+        """
+        Play one game to completion on engine `index % size`
+
+        Returns:
+            dict: Game summary
+        """
+        slot = index % len(self.engines)
+        engine = self.engines[slot]
+
+        async with self._slots[slot]:
+            game_id = await engine.create_game(seed=seed, strategy=strategy, **options)
+            try:
+                return await engine.run_until_done(game_id, max_rounds=max_rounds)
+            finally:
+                await engine.destroy_game(game_id)
+
+    async def run_games(self, seeds, strategy='tactical', max_rounds=200, **options):
+        """
+        Play one game per seed across all engines
+
+        Args:
+            seeds: Iterable of world seeds
+            strategy: MockLLM strategy
+            max_rounds: Round limit per game
+            **options: Passed to HeadlessEngine.create_game
+
+        Returns:
+            list[dict]: Summaries in seed order
+        """
+        return await asyncio.gather(*(
+            self.play(i, seed, strategy=strategy, max_rounds=max_rounds, **options)
+            for i, seed in enumerate(seeds)
+        ))
+
+    async def close(self):
+        """Stop all engine processes"""
+        await asyncio.gather(*(engine.close() for engine in self.engines))
+        self.engines = []
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def run_games(seeds, strategy='tactical', max_rounds=200, workers=None, **options):
+    """
+    Synchronous convenience wrapper around EnginePool.run_games
+
+    Returns:
+        list[dict]: Summaries in seed order
+    """
+    async def _run():
+        async with EnginePool(size=workers) as pool:
+            return await pool.run_games(seeds, strategy=strategy, max_rounds=max_rounds, **options)
+
+    return asyncio.run(_run())
@@ -3,16 +3,25 @@
 Playwright Test Helpers for Bombervibe
 
 Provides utilities for:
+- Sharing warm Chromium pages across tests (browser pool)
 - Initializing game with specific seed
 - Injecting mock LLM
 - Fast-forwarding game state
-- Asserting game conditions
+- Draining structured game events
+- Asserting game conditions (batched with expect_state)
 """
 
 import os
 import json
+import time
+import atexit
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent.parent
+INDEX_PATH = PROJECT_ROOT / 'index.html'
+
 
 def get_game_url_with_seed(seed, max_rounds=None, api_key=None):
     """
@@ -26,9 +35,6 @@ def get_game_url_with_seed(seed, max_rounds=None, api_key=None):
     Returns:
         str: Complete file:// URL with fragment
     """
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-
     # Build fragment
     if api_key is None:
         api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
@@ -41,10 +47,293 @@ def get_game_url_with_seed(seed, max_rounds=None, api_key=None):
     if max_rounds:
         fragment += f'&maxRounds={max_rounds}'
 
-    return f'file://{index_path.absolute()}#{fragment}&seed={seed}'
+    return f'file://{INDEX_PATH.absolute()}#{fragment}&seed={seed}'
+
+
+def get_game_url(api_key=None):
+    """
+    Get file:// URL for index.html without requiring an API key
+
+    Falls back to a placeholder key so the page loads without the API modal
+    getting in the way of tests that use the mock LLM.
+    """
+    if api_key is None:
+        api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY') or 'test_key'
+
+    return f'file://{INDEX_PATH.absolute()}#{api_key}'
+
+
+class BrowserPool:
+    """
+    Session-wide pool of warm Chromium pages with index.html already loaded
+
+    Launching Chromium and loading the page dominates test wall-time, so the
+    pool launches one browser per process and recycles pages between tests.
+    Pages are reset with a seeded re-init of the game instead of page.goto.
+
+    Other pages (e.g. standalone test harnesses) can be checked out with
+    `url=`; they share the browser but are re-navigated on every checkout,
+    since only index.html knows how to reset itself in place.
+
+    Usage:
+        pool = get_browser_pool()
+        with pool.page(seed=123, options={'testingMode': True}) as page:
+            inject_mock_llm(page, 'tactical', seed=123)
+            fast_forward_rounds(page, 10)
+
+        with pool.page(url=f'file://{harness_path}') as page:
+            page.evaluate('testGame.turnCount')
+    """
+
+    def __init__(self, size=2, headless=True, api_key=None, launch_options=None, virtual_time=False):
+        self.size = size
+        self.headless = headless
+        self.url = get_game_url(api_key)
+        self.launch_options = launch_options or {}
+        self.virtual_time = virtual_time
+
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle = {}  # url -> idle pages
+        self._busy = set()
+
+    @property
+    def started(self):
+        return self._browser is not None
+
+    def start(self):
+        """Launch browser and pre-warm `size` pages"""
+        if self.started:
+            return self
+
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=self.headless, **self.launch_options)
+        self._context = self._browser.new_context()
+
+        self._idle[self.url] = [self._new_page() for _ in range(self.size)]
+
+        return self
+
+    def _new_page(self):
+        """Open a page and wait until the game globals exist"""
+        page = self._context.new_page()
+        page.goto(self.url)
+        wait_for_initialized(page)
+        if self.virtual_time:
+            page.virtual_time = enable_virtual_time(page)
+        page.pool_url = self.url
+        return page
+
+    def acquire(self, seed=None, options=None, url=None):
+        """
+        Check out a page with a freshly reset game
+
+        Args:
+            seed: Seed for world generation (None = engine.reset() with random seed)
+            options: Optional game options dict
+            url: Page to load instead of index.html (seed/options are ignored;
+                the page is freshly navigated)
+
+        Returns:
+            Page: Playwright page ready for the next test
+        """
+        self.start()
+        url = url or self.url
+
+        idle = self._idle.setdefault(url, [])
+        page = None
+        while idle and page is None:
+            candidate = idle.pop()
+            if not candidate.is_closed():
+                page = candidate
+
+        if url == self.url:
+            if page is None:
+                page = self._new_page()
+            reset_game(page, seed, options)
+        else:
+            if page is None:
+                page = self._context.new_page()
+                page.pool_url = url
+            page.goto(url)
+
+        self._busy.add(page)
+        return page
+
+    def release(self, page):
+        """Return a page to the pool (closed pages are dropped)"""
+        self._busy.discard(page)
+        if page.is_closed():
+            return
+        # Virtual time can't be switched back to real time, so don't recycle
+        # pages a test put under virtual time into a real-time pool
+        idle = self._idle.setdefault(page.pool_url, [])
+        if len(idle) >= self.size or (page in _virtual_time_pages and not self.virtual_time):
+            page.close()
+        else:
+            idle.append(page)
+
+    @contextmanager
+    def page(self, seed=None, options=None, url=None):
+        """Context manager around acquire()/release()"""
+        page = self.acquire(seed, options, url)
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    def close(self):
+        """Close all pages, the browser and Playwright"""
+        if not self.started:
+            return
+
+        self._idle.clear()
+        self._busy.clear()
+        self._context.close()
+        self._browser.close()
+        self._playwright.stop()
+
+        self._context = None
+        self._browser = None
+        self._playwright = None
+
+
+_browser_pool = None
+_virtual_time_pages = weakref.WeakSet()
+
+
+def get_browser_pool(**kwargs):
+    """
+    Get the process-wide browser pool (created on first use, closed at exit)
+
+    Keyword arguments are only used when the pool is first created.
+    """
+    global _browser_pool
+
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(**kwargs)
+        atexit.register(_browser_pool.close)
+
+    return _browser_pool
+
 
+class VirtualTime:
+    """
+    Drive a page under Chrome DevTools Protocol virtual time
+
+    While paused, page time stands still. advance() grants a virtual time
+    budget that Chrome burns through as fast as the page allows: timers,
+    Date.now() and the engine clock all jump ahead instead of sleeping, so
+    turnDelay and explosion lifetimes cost no wall-clock time. Network
+    fetches (real LLM calls) pause virtual time until they complete.
+
+    Usage:
+        vt = enable_virtual_time(page)
+        inject_mock_llm(page, 'tactical', seed=1)
+        page.evaluate('engine.start()')
+        vt.advance(10 * 60 * 1000)  # ten virtual minutes
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.cdp = page.context.new_cdp_session(page)
+        self.elapsed = 0
+        self._budget_expired = False
+        self.cdp.on('Emulation.virtualTimeBudgetExpired', self._on_budget_expired)
+        self.pause()
+
+    def _on_budget_expired(self, _params):
+        self._budget_expired = True
+
+    def pause(self):
+        """Freeze virtual time"""
+        self.cdp.send('Emulation.setVirtualTimePolicy', {'policy': 'pause'})
+
+    def advance(self, budget_ms, timeout=30000):
+        """
+        Let `budget_ms` of virtual time elapse, then pause again
+
+        Args:
+            budget_ms: Virtual milliseconds to run
+            timeout: Wall-clock milliseconds to wait for the budget to expire
+        """
+        self._budget_expired = False
+        self.cdp.send('Emulation.setVirtualTimePolicy', {
+            'policy': 'pauseIfNetworkFetchesPending',
+            'budget': budget_ms
+        })
+
+        deadline = time.monotonic() + timeout / 1000
+        while not self._budget_expired:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'Virtual time budget of {budget_ms}ms did not expire within {timeout}ms')
+            # Lets Playwright dispatch CDP events (real time, not virtual)
+            self.page.wait_for_timeout(1)
+
+        self.elapsed += budget_ms
+
+
+def enable_virtual_time(page, frame_interval=16):
+    """
+    Put a page under virtual time (paused until VirtualTime.advance())
 
-def inject_mock_llm(page, strategy='tactical', seed=None):
+    Switches the engine clock to timer-driven frames, since
+    requestAnimationFrame is paced by the compositor, not virtual time.
+
+    Args:
+        page: Playwright page with index.html loaded
+        frame_interval: Virtual milliseconds between engine loop frames
+
+    Returns:
+        VirtualTime: Controller for the page
+    """
+    page.evaluate(f'engine.setClock(new GameClock({{ useTimerFrames: true, frameInterval: {frame_interval} }}))')
+    _virtual_time_pages.add(page)
+    return VirtualTime(page)
+
+
+def reset_game(page, seed=None, options=None):
+    """
+    Reset a loaded page to a fresh game without reloading index.html
+
+    Stops the engine, drops mock LLM overrides and game-over overlays, then
+    either re-initializes the game with the given seed or falls back to
+    engine.reset() for a random world.
+
+    Args:
+        page: Playwright page with index.html loaded
+        seed: Seed for world generation (None = random)
+        options: Optional game options dict
+    """
+    page.evaluate("""
+    (function() {
+        engine.running = false;
+        engine.paused = false;
+        if (engine.animationFrameId) {
+            engine.clock.cancelFrame(engine.animationFrameId);
+            engine.animationFrameId = null;
+        }
+
+        // Drop instance-level overrides installed by inject_mock_llm()
+        delete ai.getAIMove;
+        delete ai.getAllPlayerMoves;
+        ai.clearAllMemories();
+
+        document.getElementById('gameOverOverlay')?.remove();
+        gameOverDetected = false;
+    })();
+    """)
+
+    if seed is None and not options:
+        page.evaluate('engine.reset()')
+    else:
+        init_game_with_seed(page, seed if seed is not None else 'Date.now()', options)
+
+
+def inject_mock_llm(page, strategy='tactical', seed=None, options=None):
     """
     Inject mock LLM controller into page
 
@@ -52,11 +341,12 @@ def inject_mock_llm(page, strategy='tactical', seed=None):
         page: Playwright page object
         strategy: Mock LLM strategy ('random', 'aggressive', 'defensive', 'tactical')
         seed: Optional seed for mock LLM RNG
+        options: Optional MockLLM options (e.g. {'scriptedMoves': {1: [...]}})
     """
     inject_script = f"""
     (function() {{
         // Create mock LLM with specified strategy
-        const mockLLM = new MockLLM('{strategy}', new SeededRNG({seed or 'Date.now()'}));
+        const mockLLM = new MockLLM('{strategy}', SeededRNG.forStream({seed or 'Date.now()'}, 'mock-llm'), {json.dumps(options or {})});
 
         // Replace ai controller's getAIMove method
         const originalGetAIMove = ai.getAIMove.bind(ai);
@@ -91,10 +381,14 @@ def init_game_with_seed(page, seed, options=None):
 
     init_script = f"""
     (function() {{
-        // Create game with seed
+        // Create game with seed and wire it into the running engine
         const gameOptions = {json.dumps(options)};
-        game = new Game({seed}, gameOptions);
+        game = new BombervibeGame(prompts, {seed}, gameOptions);
         game.initialize();
+        engine.setGame(game);
+        renderer.initialize(game, engine.config);
+        renderer.render(game.getGameState());
+        window.game = game;
 
         console.log('[TEST] Game initialized with seed: {seed}');
         console.log('[TEST] World analysis:', {{
@@ -117,10 +411,71 @@ def get_game_state(page):
     """
     return page.evaluate("""
     (function() {
-        return game.getCompleteState();
+        return game.getGameState();
+    })();
+    """)
+
+
+def drain_events(page, types=None):
+    """
+    Take all gameplay events recorded since the last drain in one call
+
+    Events are dicts like {'seq', 'type', 'turn', 'round', ...payload}
+    (types and payloads are listed in js/engine/GameEvents.js), oldest first.
+
+    Args:
+        page: Playwright page object
+        types: Optional list of event types to keep (others are discarded)
+
+    Returns:
+        list: Events
+
+    Raises:
+        RuntimeError: If the page's buffer overflowed since the last drain
+    """
+    result = page.evaluate('types => game.events.drain(types ? { types } : {})', types)
+    if result['dropped']:
+        raise RuntimeError(
+            f"{result['dropped']} game events were dropped; drain more often or raise the buffer capacity"
+        )
+    return result['events']
+
+
+def get_observation(page):
+    """
+    Encode the current game with ObservationEncoder and view it in NumPy
+
+    The page base64-encodes the encoder's typed buffers in one evaluate call,
+    so the grid is transferred without per-cell JSON.
+
+    Returns:
+        dict: 'planes' (C, H, W) uint8 and 'players' (4, F) float32
+              (plane order: headless.OBSERVATION_PLANES)
+    """
+    import base64
+    from headless.env import decode_observations
+
+    encoded = page.evaluate("""
+    (function() {
+        const toBase64 = typed => {
+            const bytes = new Uint8Array(typed.buffer, typed.byteOffset, typed.byteLength);
+            let binary = '';
+            for (let i = 0; i < bytes.length; i += 0x8000) {
+                binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+            }
+            return btoa(binary);
+        };
+        const encoder = new ObservationEncoder();
+        return {
+            observations: toBase64(encoder.encodeBatch([game])),
+            players: toBase64(encoder.encodePlayers([game]))
+        };
     })();
     """)
 
+    obs = decode_observations({key: base64.b64decode(value) for key, value in encoded.items()}, 1)
+    return {key: value[0] for key, value in obs.items()}
+
 
 def fast_forward_rounds(page, num_rounds):
     """
@@ -171,69 +526,219 @@ def fast_forward_rounds(page, num_rounds):
     return page.evaluate(script)
 
 
+# Evaluated in the page with the whole check list; returns one message per failed check
+_EXPECT_STATE_JS = """
+checks => {
+    const player = id => game.players.find(p => p.id === id);
+    const bombAt = (x, y) => game.bombs.some(b => b.x === x && b.y === y);
+    const where = p => p ? `at (${p.x}, ${p.y})` : 'missing';
+
+    const evaluators = {
+        player_at: (id, x, y) => {
+            const p = player(id);
+            return p && p.x === x && p.y === y ? null : `Player ${id} not at (${x}, ${y}) (${where(p)})`;
+        },
+        player_alive: id => {
+            const p = player(id);
+            return p && p.alive ? null : `Player ${id} is not alive`;
+        },
+        player_dead: id => {
+            const p = player(id);
+            return p && !p.alive ? null : `Player ${id} is not dead`;
+        },
+        cell_type: (x, y, type) => {
+            // Same value as game.grid[y][x] (bomb ID or terrain) without building the rows
+            const board = game.board;
+            let actual;
+            if (board.inBounds(x, y)) {
+                const bomb = board.getBomb(x, y);
+                actual = bomb && !bomb.isBeingCarried ? bomb.id : board.getTerrain(x, y);
+            }
+            return actual === type ? null : `Cell at (${x}, ${y}) is not type ${type} (found ${actual})`;
+        },
+        bomb_at: (x, y) => bombAt(x, y) ? null : `No bomb at (${x}, ${y})`,
+        no_bomb_at: (x, y) => bombAt(x, y) ? `Unexpected bomb at (${x}, ${y})` : null,
+        loot_at: (x, y, type = null) => {
+            const loot = game.loot.find(l => l.x === x && l.y === y);
+            if (!loot) return `No loot at (${x}, ${y})`;
+            return type === null || loot.type === type ? null : `Loot at (${x}, ${y}) is ${loot.type}, not ${type}`;
+        }
+    };
+
+    const failures = [];
+    for (const [kind, ...args] of checks) {
+        const evaluate = evaluators[kind];
+        const failure = evaluate ? evaluate(...args) : `Unknown check '${kind}'`;
+        if (failure) failures.push(failure);
+    }
+    return failures;
+}
+"""
+
+
+def expect_state(page, checks, raise_on_failure=True):
+    """
+    Check many conditions against the game in a single page round-trip
+
+    Each check is a tuple naming a condition and its arguments:
+        ('player_at', player_id, x, y)
+        ('player_alive', player_id)
+        ('player_dead', player_id)
+        ('cell_type', x, y, cell_type)
+        ('bomb_at', x, y)
+        ('no_bomb_at', x, y)
+        ('loot_at', x, y[, loot_type])
+
+    Usage:
+        expect_state(page, [
+            ('player_at', 1, 0, 0),
+            ('bomb_at', 5, 5),
+            ('player_dead', 2),
+        ])
+
+    Args:
+        page: Playwright page object
+        checks: Iterable of check tuples
+        raise_on_failure: Raise AssertionError listing every failure (default True)
+
+    Returns:
+        list: Failure messages (empty when every check passed)
+    """
+    failures = page.evaluate(_EXPECT_STATE_JS, [list(check) for check in checks])
+
+    if failures and raise_on_failure:
+        raise AssertionError('\n'.join(failures))
+    return failures
+
+
 def assert_player_at_position(page, player_id, x, y):
     """Assert player is at specific position"""
-    result = page.evaluate(f"""
-    (function() {{
-        const player = game.players.find(p => p.id === {player_id});
-        return player && player.x === {x} && player.y === {y};
-    }})();
-    """)
-
-    assert result, f"Player {player_id} not at ({x}, {y})"
+    expect_state(page, [('player_at', player_id, x, y)])
 
 
 def assert_cell_type(page, x, y, cell_type):
     """Assert cell at position has specific type"""
-    result = page.evaluate(f"""
-    (function() {{
-        return game.grid[{y}][{x}] === {cell_type};
-    }})();
-    """)
-
-    assert result, f"Cell at ({x}, {y}) is not type {cell_type}"
+    expect_state(page, [('cell_type', x, y, cell_type)])
 
 
 def assert_bomb_at_position(page, x, y):
     """Assert bomb exists at position"""
-    result = page.evaluate(f"""
-    (function() {{
-        return game.bombs.some(b => b.x === {x} && b.y === {y});
-    }})();
-    """)
-
-    assert result, f"No bomb at ({x}, {y})"
+    expect_state(page, [('bomb_at', x, y)])
 
 
 def assert_player_alive(page, player_id):
     """Assert player is alive"""
-    result = page.evaluate(f"""
-    (function() {{
-        const player = game.players.find(p => p.id === {player_id});
-        return player && player.alive;
-    }})();
-    """)
-
-    assert result, f"Player {player_id} is not alive"
+    expect_state(page, [('player_alive', player_id)])
 
 
 def assert_player_dead(page, player_id):
     """Assert player is dead"""
-    result = page.evaluate(f"""
-    (function() {{
-        const player = game.players.find(p => p.id === {player_id});
-        return player && !player.alive;
-    }})();
-    """)
+    expect_state(page, [('player_dead', player_id)])
+
+
+_START_SIGNAL_JS = """
+async ({ expression, timeout }) => {
+    const slots = window.__awaitedSignals || (window.__awaitedSignals = new Map());
+    const id = (window.__awaitedSignalSeq = (window.__awaitedSignalSeq || 0) + 1);
+    const slot = { state: 'pending', value: null, error: null };
+    slots.set(id, slot);
+
+    // In-page timeout: only fires on real-time pages (paused virtual time
+    // freezes it), so Python enforces the wall-clock deadline as well
+    const TIMED_OUT = {};
+    let timer;
+    const timedOut = new Promise(resolve => {
+        timer = setTimeout(() => resolve(TIMED_OUT), timeout);
+    });
+    const tracked = Promise.race([new Function(`return (${expression});`)(), timedOut]).then(
+        value => Object.assign(slot, value === TIMED_OUT ? { state: 'timeout' } : { state: 'resolved', value }),
+        error => Object.assign(slot, { state: 'rejected', error })
+    ).finally(() => clearTimeout(timer));
+
+    // Already-settled promises (e.g. whenTurn for a past turn) finish in this call
+    await Promise.race([tracked, Promise.resolve()]);
+    return id;
+}
+"""
+
+_TAKE_SIGNAL_JS = """
+id => {
+    const slots = window.__awaitedSignals;
+    const slot = slots && slots.get(id);
+    if (!slot || slot.state === 'pending') return null;
+    slots.delete(id);
+    if (slot.state === 'rejected') throw slot.error;
+    return { timedOut: slot.state === 'timeout', value: slot.value };
+}
+"""
+
+
+def _await_signal(page, promise_expression, timeout):
+    """
+    Await a game/engine readiness promise inside the page
+
+    The expression is passed as an argument (not spliced into the script).
+    The promise is started in the page and polled from Python against a
+    wall-clock deadline, so it also times out on pages whose virtual time
+    is paused (where the page's own setTimeout never fires).
+
+    Args:
+        page: Playwright page object
+        promise_expression: JS expression evaluating to a Promise
+        timeout: Milliseconds before failing
+
+    Returns:
+        Event data the promise resolved with
+
+    Raises:
+        TimeoutError: If the promise has not resolved after `timeout` ms
+    """
+    deadline = time.monotonic() + timeout / 1000
+    signal_id = page.evaluate(_START_SIGNAL_JS, {'expression': promise_expression, 'timeout': timeout})
+
+    while True:
+        result = page.evaluate(_TAKE_SIGNAL_JS, signal_id)
+        if result is not None and not result['timedOut']:
+            return result['value']
+        if result is not None or time.monotonic() >= deadline:
+            page.evaluate('id => window.__awaitedSignals.delete(id)', signal_id)
+            raise TimeoutError(f'Timed out after {timeout}ms waiting for: {promise_expression}')
+        # Lets Playwright dispatch CDP events (real time, not virtual)
+        page.wait_for_timeout(1)
+
+
+def wait_for_initialized(page, timeout=10000):
+    """Wait until index.html has created and initialized the engine"""
+    page.wait_for_function('typeof engine !== "undefined" && engine.initialized', timeout=timeout)
+
+
+def wait_for_turn(page, turn, timeout=30000):
+    """Wait until game.turnCount reaches `turn` (resolves immediately if already there)"""
+    return _await_signal(page, f'game.whenTurn({turn})', timeout)
+
+
+def wait_for_round(page, round_number, timeout=30000):
+    """Wait until game.roundCount reaches `round_number` (resolves immediately if already there)"""
+    return _await_signal(page, f'game.whenRound({round_number})', timeout)
+
+
+def wait_for_game_over(page, timeout=60000):
+    """Wait until the game is over (resolves immediately if already over)"""
+    return _await_signal(page, 'game.whenGameOver()', timeout)
+
 
-    assert result, f"Player {player_id} is not dead"
+def wait_for_round_or_game_over(page, round_number, timeout=60000):
+    """Wait for whichever comes first: round `round_number` or game over"""
+    return _await_signal(
+        page,
+        f'Promise.race([game.whenRound({round_number}), game.whenGameOver()])',
+        timeout
+    )
 
 
 def wait_for_explosions(page, timeout=5000):
     """Wait for all explosions to finish"""
-    page.wait_for_function("""
-    () => game.explosions.length === 0
-    """, timeout=timeout)
+    return _await_signal(page, 'game.whenExplosionsSettled()', timeout)
 
 
 def load_test_fixtures():
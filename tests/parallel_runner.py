@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Parallel Sharded Test Runner for Bombervibe
+
+Discovers every test_* function in tests/test_*.py, splits them into N
+shards balanced by historical per-test durations, and runs each shard in
+its own worker process (each worker owns one Chromium via the helpers
+browser pool). Results are merged into a single JUnit XML and JSON report.
+
+Usage:
+    python tests/parallel_runner.py                 # one worker per core
+    python tests/parallel_runner.py -n 8 -k mock    # 8 workers, filter by name
+    python tests/parallel_runner.py tests/test_seeded_world.py
+"""
+
+import argparse
+import ast
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+PROJECT_ROOT = TESTS_DIR.parent
+
+DEFAULT_DURATIONS_PATH = TESTS_DIR / '.test_durations.json'
+DEFAULT_JUNIT_PATH = PROJECT_ROOT / 'test-results' / 'junit.xml'
+DEFAULT_JSON_PATH = PROJECT_ROOT / 'test-results' / 'results.json'
+
+# Used for tests that have never been timed and no other history exists
+DEFAULT_TEST_DURATION = 5.0
+
+
+def discover_tests(paths=None, keyword=None):
+    """
+    Find test functions without importing the modules
+
+    Args:
+        paths: Optional list of test files (default: tests/test_*.py)
+        keyword: Optional substring filter on test ids
+
+    Returns:
+        list[str]: Test ids in the form 'test_file.py::test_name'
+    """
+    files = [Path(p) for p in paths] if paths else sorted(TESTS_DIR.glob('test_*.py'))
+
+    test_ids = []
+    for path in files:
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                test_id = f'{path.name}::{node.name}'
+                if keyword is None or keyword in test_id:
+                    test_ids.append(test_id)
+
+    return test_ids
+
+
+def load_durations(path):
+    """Load historical per-test durations ({test_id: seconds})"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_durations(path, durations, results):
+    """Merge fresh timings into the durations file"""
+    updated = dict(durations)
+    for result in results:
+        if result['outcome'] != 'error':
+            updated[result['id']] = round(result['duration'], 3)
+
+    with open(path, 'w') as f:
+        json.dump(updated, f, indent=2, sort_keys=True)
+
+
+def balance_shards(test_ids, durations, num_shards):
+    """
+    Split tests into shards with roughly equal expected wall-time
+
+    Longest-processing-time-first greedy: sort by expected duration and
+    always give the next test to the currently lightest shard.
+
+    Returns:
+        list[list[str]]: Non-empty shards
+    """
+    known = sorted(durations[t] for t in test_ids if t in durations)
+    fallback = known[len(known) // 2] if known else DEFAULT_TEST_DURATION
+
+    def expected(test_id):
+        return durations.get(test_id, fallback)
+
+    num_shards = max(1, min(num_shards, len(test_ids)))
+    shards = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+
+    for test_id in sorted(test_ids, key=expected, reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(test_id)
+        loads[lightest] += expected(test_id)
+
+    return [shard for shard in shards if shard]
+
+
+def _load_module(filename):
+    """Import a test module by file name (cached per worker)"""
+    name = Path(filename).stem
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, TESTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_shard(shard_index, test_ids):
+    """
+    Run one shard of tests sequentially in this worker process
+
+    Returns:
+        list[dict]: One result per test
+    """
+    sys.path.insert(0, str(TESTS_DIR))
+    os.chdir(PROJECT_ROOT)
+
+    results = []
+    try:
+        for test_id in test_ids:
+            filename, func_name = test_id.split('::')
+            output = io.StringIO()
+            outcome = 'passed'
+            message = ''
+            start = time.perf_counter()
+
+            try:
+                with redirect_stdout(output), redirect_stderr(output):
+                    module = _load_module(filename)
+                    getattr(module, func_name)()
+            except AssertionError as e:
+                outcome = 'failed'
+                message = str(e) or traceback.format_exc()
+            except SystemExit as e:
+                outcome = 'failed' if e.code not in (0, None) else 'passed'
+                message = f'SystemExit({e.code})' if outcome == 'failed' else ''
+            except Exception:
+                outcome = 'error'
+                message = traceback.format_exc()
+
+            results.append({
+                'id': test_id,
+                'file': filename,
+                'name': func_name,
+                'outcome': outcome,
+                'duration': time.perf_counter() - start,
+                'worker': shard_index,
+                'message': message,
+                'output': output.getvalue()
+            })
+    finally:
+        # Worker processes skip atexit handlers, so close the pooled browser here
+        helpers = sys.modules.get('helpers')
+        if helpers is not None and getattr(helpers, '_browser_pool', None) is not None:
+            helpers._browser_pool.close()
+
+    return results
+
+
+def shard_error_results(shard_index, test_ids, error):
+    """
+    Results for a shard whose worker failed before returning
+
+    Returns:
+        list[dict]: One 'error' result per test, carrying the exception text
+    """
+    message = f'Shard {shard_index} failed: ' + ''.join(
+        traceback.format_exception(type(error), error, error.__traceback__))
+
+    results = []
+    for test_id in test_ids:
+        filename, func_name = test_id.split('::')
+        results.append({
+            'id': test_id,
+            'file': filename,
+            'name': func_name,
+            'outcome': 'error',
+            'duration': 0.0,
+            'worker': shard_index,
+            'message': message,
+            'output': ''
+        })
+    return results
+
+
+def write_junit(path, results, elapsed):
+    """Write merged results as a single JUnit XML testsuite"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    suite = ET.Element('testsuite', {
+        'name': 'bombervibe',
+        'tests': str(len(results)),
+        'failures': str(sum(r['outcome'] == 'failed' for r in results)),
+        'errors': str(sum(r['outcome'] == 'error' for r in results)),
+        'time': f'{elapsed:.3f}'
+    })
+
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': Path(result['file']).stem,
+            'name': result['name'],
+            'time': f"{result['duration']:.3f}"
+        })
+        if result['outcome'] in ('failed', 'error'):
+            tag = 'failure' if result['outcome'] == 'failed' else 'error'
+            failure = ET.SubElement(case, tag, {'message': result['message'].splitlines()[0] if result['message'] else ''})
+            failure.text = result['message']
+        if result['output']:
+            ET.SubElement(case, 'system-out').text = result['output']
+
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def write_json(path, results, elapsed, workers):
+    """Write merged results as JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    report = {
+        'workers': workers,
+        'elapsed': round(elapsed, 3),
+        'summary': {
+            outcome: sum(r['outcome'] == outcome for r in results)
+            for outcome in ('passed', 'failed', 'error')
+        },
+        'tests': results
+    }
+
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run Bombervibe tests in parallel shards')
+    parser.add_argument('files', nargs='*', help='Test files to run (default: tests/test_*.py)')
+    parser.add_argument('-n', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('-k', '--keyword', help='Only run tests whose id contains this substring')
+    parser.add_argument('--durations', default=str(DEFAULT_DURATIONS_PATH), help='Historical durations file')
+    parser.add_argument('--junit', default=str(DEFAULT_JUNIT_PATH), help='JUnit XML report path')
+    parser.add_argument('--json', default=str(DEFAULT_JSON_PATH), help='JSON report path')
+    args = parser.parse_args(argv)
+
+    test_ids = discover_tests(args.files, args.keyword)
+    if not test_ids:
+        print('No tests found')
+        return 1
+
+    durations = load_durations(args.durations)
+    shards = balance_shards(test_ids, durations, args.workers)
+
+    print(f'Running {len(test_ids)} tests in {len(shards)} shards')
+
+    start = time.perf_counter()
+    results = []
+
+    # Playwright's sync API is not fork-safe, so always spawn fresh workers
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        futures = [executor.submit(run_shard, i, shard) for i, shard in enumerate(shards)]
+        for shard_index, (future, shard) in enumerate(zip(futures, shards)):
+            try:
+                shard_results = future.result()
+            except Exception as e:
+                # A crashed worker (e.g. BrokenProcessPool) loses its whole shard;
+                # report those tests as errors and keep collecting the others
+                shard_results = shard_error_results(shard_index, shard, e)
+            for result in shard_results:
+                symbol = '✓' if result['outcome'] == 'passed' else '✗'
+                print(f"{symbol} {result['id']} ({result['duration']:.2f}s, worker {result['worker']})")
+                results.append(result)
+
+    elapsed = time.perf_counter() - start
+
+    write_junit(args.junit, results, elapsed)
+    write_json(args.json, results, elapsed, len(shards))
+    save_durations(args.durations, durations, results)
+
+    passed = sum(r['outcome'] == 'passed' for r in results)
+    failed = len(results) - passed
+    print(f'\nPassed: {passed}  Failed: {failed}  Wall time: {elapsed:.2f}s')
+
+    for result in results:
+        if result['outcome'] != 'passed':
+            print(f"\n✗ {result['id']}\n{result['message']}")
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
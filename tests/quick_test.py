@@ -10,6 +10,12 @@ from playwright.sync_api import sync_playwright
 # Load API keys
 load_dotenv(Path(__file__).parent / '.env')
 
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import wait_for_initialized, wait_for_round_or_game_over
+
+TARGET_ROUNDS = 20
+
 def main():
     api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
     if not api_key:
@@ -32,14 +38,15 @@ def main():
 
         # Load game
         page.goto(file_url, wait_until='load', timeout=10000)
-        page.wait_for_timeout(2000)
+        wait_for_initialized(page)
 
         # Start game
         page.click('#startGame')
-        print('Game started, waiting for 5 rounds...')
+        print(f'Game started, waiting for {TARGET_ROUNDS} rounds...')
 
-        # Wait for 20 rounds (about 60 seconds)
-        page.wait_for_timeout(60000)
+        # Returns as soon as the round is reached or the game ends
+        wait_for_round_or_game_over(page, TARGET_ROUNDS, timeout=180000)
+        rounds_completed = page.evaluate('game.roundCount')
 
         browser.close()
 
@@ -52,8 +59,7 @@ def main():
     print(f'\nSaved {len(console_logs)} console logs to {log_file}')
 
     # Print summary
-    round_logs = [l for l in console_logs if '[ROUND' in l and 'START' in l]
-    print(f'Rounds completed: {len(round_logs)}')
+    print(f'Rounds completed: {rounds_completed}')
 
     # Show AI deaths
     death_logs = [l for l in console_logs if 'died' in l.lower() or '💀' in l]
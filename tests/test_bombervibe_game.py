@@ -6,11 +6,14 @@ Validates the new game implementation matches legacy behavior
 
 import sys
 import os
-from playwright.sync_api import sync_playwright
 
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(TEST_DIR)
 
+# Add helpers to path
+sys.path.insert(0, TEST_DIR)
+from helpers import get_browser_pool
+
 # Create a minimal test HTML file
 TEST_HTML = """
 <!DOCTYPE html>
@@ -24,9 +27,19 @@ TEST_HTML = """
 
     <!-- Dependencies -->
     <script src="../js/rng.js"></script>
+    <script src="../js/engine/Logger.js"></script>
     <script src="../js/config/blocks.js"></script>
+    <script src="../js/engine/GameSignals.js"></script>
+    <script src="../js/engine/GameEvents.js"></script>
+    <script src="../js/engine/HandleRegistry.js"></script>
+    <script src="../js/engine/GameClock.js"></script>
     <script src="../js/games/bombervibe/config.js"></script>
     <script src="../js/games/bombervibe/BombervibePlayer.js"></script>
+    <script src="../js/games/bombervibe/BlastFootprints.js"></script>
+    <script src="../js/games/bombervibe/BombervibeGrid.js"></script>
+    <script src="../js/games/bombervibe/SpatialIndex.js"></script>
+    <script src="../js/games/bombervibe/DangerMap.js"></script>
+    <script src="../js/games/bombervibe/BombSchedule.js"></script>
     <script src="../js/games/bombervibe/BombervibePrompts.js"></script>
     <script src="../js/games/bombervibe/BombervibeGame.js"></script>
 
@@ -60,11 +73,7 @@ def test_initialization():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             # Check game object exists
             game_exists = page.evaluate('typeof testGame !== "undefined"')
             assert game_exists, "Game object should exist"
@@ -84,7 +93,6 @@ def test_initialization():
             assert seed == 12345, f"Seed should be 12345, got {seed}"
 
             print("✓ Initialization test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -96,11 +104,7 @@ def test_player_positions():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             positions = page.evaluate('''
                 testGame.players.map(p => ({id: p.id, x: p.x, y: p.y, alive: p.alive}))
             ''')
@@ -120,7 +124,6 @@ def test_player_positions():
                 assert actual['alive'] == exp['alive'], f"Player {i+1} should be alive"
 
             print("✓ Player positions test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -132,11 +135,7 @@ def test_movement():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             # Test valid move
             result = page.evaluate('testGame.movePlayer(1, "down")')
             assert result == True, "Move should succeed"
@@ -149,7 +148,6 @@ def test_movement():
             assert result_stay == True, "Stay should succeed"
 
             print("✓ Movement test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -161,11 +159,7 @@ def test_bomb_placement():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             # Place bomb
             result = page.evaluate('testGame.playerPlaceBomb(1)')
             assert result == True, "Bomb placement should succeed"
@@ -183,7 +177,6 @@ def test_bomb_placement():
             assert bomb['roundsUntilExplode'] == 4, "Bomb should explode in 4 rounds"
 
             print("✓ Bomb placement test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -195,11 +188,7 @@ def test_game_state():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             state = page.evaluate('testGame.getGameState()')
 
             # Check structure
@@ -219,7 +208,6 @@ def test_game_state():
             assert len(state['players']) == 4, "Should have 4 players"
 
             print("✓ getGameState test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -231,11 +219,7 @@ def test_turn_management():
     test_html_path = setup_test_html()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(f'file://{test_html_path}')
-
+        with get_browser_pool().page(url=f'file://{test_html_path}') as page:
             # Initial state
             turn = page.evaluate('testGame.turnCount')
             round_count = page.evaluate('testGame.roundCount')
@@ -256,7 +240,6 @@ def test_turn_management():
             assert round_after == 1, "Round should increment after full cycle"
 
             print("✓ Turn management test passed")
-            browser.close()
 
     finally:
         cleanup_test_html(test_html_path)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test the canvas rendering backend (index.html?renderer=canvas)
+"""
+
+import sys
+from pathlib import Path
+
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import *
+
+
+def get_canvas_url():
+    """index.html with the canvas renderer selected"""
+    return get_game_url().replace('#', '?renderer=canvas#', 1)
+
+
+def wait_for_frames(page, count=2):
+    """Let ResizeObserver callbacks and layout run"""
+    page.evaluate(f"""
+    new Promise(resolve => {{
+        let left = {count};
+        const tick = () => (--left <= 0 ? resolve() : requestAnimationFrame(tick));
+        requestAnimationFrame(tick);
+    }})
+    """)
+
+
+def test_resize_keeps_players_on_canvas():
+    """Resizing redraws the canvas without adding DOM player entities over it"""
+
+    print('Testing canvas renderer resize...')
+
+    test_seed = 2024
+
+    with get_browser_pool().page(url=get_canvas_url()) as page:
+        wait_for_initialized(page)
+        # Re-initialize twice, like pooled resets do (one resize watcher must remain)
+        init_game_with_seed(page, test_seed)
+        init_game_with_seed(page, test_seed)
+
+        assert page.evaluate('renderer instanceof BombervibeCanvasRenderer'), 'Canvas backend should be active'
+
+        for width, height in [(900, 700), (1400, 1000), (1100, 800)]:
+            page.set_viewport_size({'width': width, 'height': height})
+            wait_for_frames(page)
+
+            state = page.evaluate("""
+            (() => {
+                const grid = document.getElementById(renderer.config.gridId);
+                const canvas = grid.querySelector('canvas.board-canvas');
+                const ratio = renderer.config.pixelRatio;
+                return {
+                    playerEntities: grid.querySelectorAll('.player-entity').length,
+                    hasCanvas: !!canvas,
+                    canvasWidth: canvas ? canvas.width : 0,
+                    expectedWidth: Math.max(1, Math.round(grid.clientWidth * ratio))
+                };
+            })()
+            """)
+
+            assert state['hasCanvas'], f'Canvas missing after resize to {width}x{height}'
+            assert state['playerEntities'] == 0, \
+                f"Found {state['playerEntities']} .player-entity nodes over the canvas at {width}x{height}"
+            assert state['canvasWidth'] == state['expectedWidth'], \
+                f"Canvas not redrawn at new size ({state['canvasWidth']} != {state['expectedWidth']})"
+
+            print(f'✓ {width}x{height}: canvas redrawn, no DOM player entities')
+
+    print('\n✓ Canvas renderer resize test passed!')
+
+
+if __name__ == '__main__':
+    test_resize_keeps_players_on_canvas()
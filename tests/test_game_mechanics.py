@@ -7,7 +7,6 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
 
 # Load API keys
 load_dotenv(Path(__file__).parent / '.env')
@@ -20,36 +19,18 @@ from helpers import *
 def test_bomb_explosion():
     """Test bomb placement and explosion mechanics"""
 
-    api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print('ERROR: No API key found in tests/.env')
-        sys.exit(1)
-
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-    file_url = f'file://{index_path.absolute()}#{api_key}'
-
     print('Testing bomb explosion mechanics...')
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Load game
-        page.goto(file_url)
-        page.wait_for_timeout(500)
-
-        # Initialize with specific bomb setup
-        test_seed = 777
-        init_options = {
-            'testingMode': True,
-            'initialBombs': [
-                {'x': 5, 'y': 5, 'playerId': 1, 'stage': 1, 'range': 1}
-            ]
-        }
-        init_game_with_seed(page, test_seed, init_options)
+    # Initialize with specific bomb setup
+    test_seed = 777
+    init_options = {
+        'testingMode': True,
+        'initialBombs': [
+            {'x': 5, 'y': 5, 'playerId': 1, 'stage': 1, 'range': 1}
+        ]
+    }
 
+    with get_browser_pool().page(test_seed, init_options) as page:
         # Inject mock LLM
         inject_mock_llm(page, strategy='defensive', seed=test_seed)
 
@@ -63,51 +44,31 @@ def test_bomb_explosion():
         fast_forward_rounds(page, 5)
 
         # Wait for explosion animation
-        page.wait_for_timeout(1000)
+        wait_for_explosions(page)
 
         # Verify bomb is gone
         bombs_count = page.evaluate('game.bombs.length')
         assert bombs_count == 0, 'Bomb should have exploded'
         print('✓ Bomb exploded after correct number of rounds')
 
-        browser.close()
-
     print('\n✓ Bomb explosion test passed!')
 
 
 def test_loot_mechanics():
     """Test loot spawning, pickup, and destruction"""
 
-    api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print('ERROR: No API key found in tests/.env')
-        sys.exit(1)
-
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-    file_url = f'file://{index_path.absolute()}#{api_key}'
-
     print('\nTesting loot mechanics...')
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Load game
-        page.goto(file_url)
-        page.wait_for_timeout(500)
-
-        # Initialize with loot
-        test_seed = 888
-        init_options = {
-            'testingMode': True,
-            'initialLoot': [
-                {'x': 2, 'y': 2, 'type': 'flash_radius'}
-            ]
-        }
-        init_game_with_seed(page, test_seed, init_options)
+    # Initialize with loot
+    test_seed = 888
+    init_options = {
+        'testingMode': True,
+        'initialLoot': [
+            {'x': 2, 'y': 2, 'type': 'flash_radius'}
+        ]
+    }
 
+    with get_browser_pool().page(test_seed, init_options) as page:
         # Inject mock LLM
         inject_mock_llm(page, strategy='tactical', seed=test_seed)
 
@@ -150,44 +111,24 @@ def test_loot_mechanics():
 
         print('✓ Loot pickup and stat increase working correctly')
 
-        browser.close()
-
     print('\n✓ Loot mechanics test passed!')
 
 
 def test_player_death():
     """Test player death from bomb explosion"""
 
-    api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print('ERROR: No API key found in tests/.env')
-        sys.exit(1)
-
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-    file_url = f'file://{index_path.absolute()}#{api_key}'
-
     print('\nTesting player death mechanics...')
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Load game
-        page.goto(file_url)
-        page.wait_for_timeout(500)
-
-        # Initialize with bomb near player
-        test_seed = 666
-        init_options = {
-            'testingMode': True,
-            'initialBombs': [
-                {'x': 1, 'y': 0, 'playerId': 2, 'stage': 1, 'range': 2}
-            ]
-        }
-        init_game_with_seed(page, test_seed, init_options)
+    # Initialize with bomb near player
+    test_seed = 666
+    init_options = {
+        'testingMode': True,
+        'initialBombs': [
+            {'x': 1, 'y': 0, 'playerId': 2, 'stage': 1, 'range': 2}
+        ]
+    }
 
+    with get_browser_pool().page(test_seed, init_options) as page:
         # Inject mock LLM with scripted moves to keep player in place
         inject_mock_llm(page, strategy='random', seed=test_seed)
 
@@ -199,7 +140,7 @@ def test_player_death():
 
         # Fast-forward to explosion
         fast_forward_rounds(page, 5)
-        page.wait_for_timeout(1000)
+        wait_for_explosions(page)
 
         # Check if player 1 died (they're at 0,0 and bomb explodes with range 2 from 1,0)
         # This will hit player 1 if they didn't move
@@ -209,8 +150,6 @@ def test_player_death():
         # Note: Player may have moved, so this test verifies explosion logic works
         # not necessarily that player died
 
-        browser.close()
-
     print('\n✓ Player death test complete!')
 
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test the headless JSON-RPC engine (Node, no browser)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add tests dir to path
+sys.path.insert(0, str(Path(__file__).parent))
+import numpy as np
+
+from headless import EnginePool, HeadlessEngine, HeadlessEngineError
+from headless import BombervibeVecEnv, NUM_ACTIONS, MOCK_ACTION, OBSERVATION_PLANES, decode_observations
+
+
+def test_rpc_calls():
+    """create-game, step, get-state and run-until-done round-trip"""
+
+    print('Testing headless engine RPC calls...')
+
+    async def run():
+        async with HeadlessEngine() as engine:
+            game_id = await engine.create_game(seed=12345, strategy='tactical')
+            print(f'✓ Created game {game_id}')
+
+            stay = {'direction': 'stay', 'dropBomb': False}
+            summary = await engine.step(game_id, moves={1: stay, 2: stay, 3: stay, 4: stay})
+            assert summary['turns'] == 1, f"Expected 1 turn, got {summary['turns']}"
+
+            state = await engine.get_state(game_id)
+            assert state['turnCount'] == 1
+            assert len(state['grid']) == 11 and len(state['grid'][0]) == 13
+            print('✓ step and get-state agree')
+
+            summary = await engine.run_until_done(game_id, max_rounds=50)
+            assert summary['gameOver'] or summary['rounds'] >= 50
+            print(f"✓ run-until-done finished at round {summary['rounds']}")
+
+            try:
+                await engine.get_state(9999)
+                assert False, 'Unknown game should raise'
+            except HeadlessEngineError as e:
+                print(f'✓ Unknown game rejected: {e}')
+
+    asyncio.run(run())
+
+
+def test_same_seed_same_world():
+    """Seeded games start from identical worlds"""
+
+    print('\nTesting seeded world determinism over RPC...')
+
+    async def run():
+        async with HeadlessEngine() as engine:
+            first = await engine.create_game(seed=777)
+            second = await engine.create_game(seed=777)
+            state_a = await engine.get_state(first)
+            state_b = await engine.get_state(second)
+            assert state_a['grid'] == state_b['grid'], 'Same seed should produce same grid'
+            print('✓ Same seed produces identical grids')
+
+    asyncio.run(run())
+
+
+def test_same_seed_same_game():
+    """Seed and strategy alone reproduce a whole game (loot and fallback moves included)"""
+
+    print('\nTesting seeded game replay determinism over RPC...')
+
+    async def run():
+        async with HeadlessEngine() as engine:
+            finals = []
+            for _ in range(2):
+                game_id = await engine.create_game(seed=4242, strategy='aggressive')
+                summary = await engine.run_until_done(game_id, max_rounds=60)
+                state = await engine.get_state(game_id)
+                finals.append((summary['turns'], state['grid'], state['players'], state['loot']))
+                await engine.destroy_game(game_id)
+
+            assert finals[0] == finals[1], 'Same seed and strategy should replay the same game'
+            print(f'✓ Same seed replays an identical {finals[0][0]}-turn game')
+
+    asyncio.run(run())
+
+
+def test_pool_multiplexes_games():
+    """Hundreds of concurrent games across a small pool"""
+
+    print('\nTesting engine pool...')
+
+    async def run():
+        async with EnginePool(size=2) as pool:
+            results = await pool.run_games(range(1, 201), strategy='aggressive', max_rounds=50)
+
+        assert len(results) == 200
+        assert [r['seed'] for r in results] == list(range(1, 201)), 'Results should be in seed order'
+        assert all(r['gameOver'] or r['rounds'] >= 50 for r in results)
+        finished = sum(r['gameOver'] for r in results)
+        print(f'✓ 200 games played on 2 engines ({finished} ended with a winner)')
+
+    asyncio.run(run())
+
+
+def test_observation_planes_match_state():
+    """Encoded planes agree with getGameState()"""
+
+    print('\nTesting observation planes...')
+
+    async def run():
+        async with HeadlessEngine() as engine:
+            game_id = await engine.create_game(seed=2024, strategy='aggressive')
+            for _ in range(6):
+                await engine.step(game_id)
+
+            state = await engine.get_state(game_id)
+            obs = decode_observations(await engine.observe([game_id]), 1)
+            planes = {name: obs['planes'][0, i] for i, name in enumerate(OBSERVATION_PLANES)}
+
+            grid = np.array([[cell if isinstance(cell, int) else 0 for cell in row] for row in state['grid']])
+            assert (planes['hard'] == (grid == 2)).all(), 'Hard plane should match grid'
+            assert (planes['soft'] == (grid == 1)).all(), 'Soft plane should match grid'
+
+            for player in state['players']:
+                if player['alive']:
+                    assert planes[f"player_{player['id']}"][player['y'], player['x']] == 1
+                    assert obs['players'][0, player['id'] - 1, 3] == player['score']
+
+            for bomb in state['bombs']:
+                assert planes['bomb_timer'][bomb['y'], bomb['x']] == max(1, bomb['turnsUntilExplode'])
+                assert planes['blast_range'][bomb['y'], bomb['x']] == bomb['range']
+                assert planes['danger'][bomb['y'], bomb['x']] > 0
+
+            print(f"✓ Planes match state ({len(state['bombs'])} bombs, {len(state['loot'])} loot)")
+
+    asyncio.run(run())
+
+
+def test_vec_env_lockstep():
+    """K games step together and return NumPy batches"""
+
+    print('\nTesting vectorized environment...')
+
+    num_envs = 16
+    env = BombervibeVecEnv(num_envs=num_envs, seed=100, max_rounds=20)
+    try:
+        obs = env.reset()
+        assert obs['planes'].shape == (num_envs, len(OBSERVATION_PLANES), 11, 13)
+        assert obs['players'].shape[:2] == (num_envs, 4)
+        print('✓ reset() returns batched observations')
+
+        rng = np.random.default_rng(0)
+        episodes = 0
+        for _ in range(100):
+            actions = rng.integers(0, NUM_ACTIONS, size=(num_envs, 4))
+            actions[:, 3] = MOCK_ACTION  # Player 4 is driven by the MockLLM
+            obs, rewards, dones, infos = env.step(actions)
+            assert rewards.shape == (num_envs, 4) and rewards.dtype == np.float32
+            assert dones.shape == (num_envs,)
+            episodes += sum('episode' in info for info in infos)
+
+        # 100 turns exceed 20 rounds, so every game finished at least once
+        assert episodes >= num_envs, f'Expected at least {num_envs} episodes, got {episodes}'
+        print(f'✓ 100 lockstep steps, {episodes} episodes auto-reset')
+    finally:
+        env.close()
+
+
+if __name__ == '__main__':
+    test_rpc_calls()
+    test_same_seed_same_world()
+    test_same_seed_same_game()
+    test_pool_multiplexes_games()
+    test_observation_planes_match_state()
+    test_vec_env_lockstep()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the virtualized event log panel (#gameLog)
+"""
+
+import sys
+from pathlib import Path
+
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import *
+
+
+def wait_for_frames(page, count=3):
+    """Let ResizeObserver callbacks and batched redraws run"""
+    page.evaluate(f"""
+    new Promise(resolve => {{
+        let left = {count};
+        const tick = () => (--left <= 0 ? resolve() : requestAnimationFrame(tick));
+        requestAnimationFrame(tick);
+    }})
+    """)
+
+
+def test_visible_rows_fill_viewport():
+    """Once the log grows past max-height, every row in view is rendered"""
+
+    print('Testing log panel viewport fill...')
+
+    with get_browser_pool().page() as page:
+        page.set_viewport_size({'width': 1280, 'height': 1000})
+        page.evaluate("""
+        (() => {
+            for (let i = 0; i < 300; i++) {
+                log(`filler line ${i}`);
+            }
+        })()
+        """)
+        wait_for_frames(page)
+
+        view = page.evaluate("""
+        (() => {
+            const scroller = logPanel.scroller;
+            const content = logPanel.content;
+            const rowHeight = logPanel.options.rowHeight;
+
+            const scrollTop = Math.max(0, scroller.scrollTop - content.offsetTop);
+            const visibleTop = Math.max(0, content.offsetTop - scroller.scrollTop);
+            const first = Math.floor(scrollTop / rowHeight);
+            const last = Math.min(logPanel.count, Math.ceil((scrollTop + scroller.clientHeight - visibleTop) / rowHeight));
+
+            const rendered = new Set();
+            for (const line of logPanel.lines) {
+                if (line.style.display === 'none') continue;
+                const match = /translateY\\((\\d+(?:\\.\\d+)?)px\\)/.exec(line.style.transform);
+                if (match) rendered.add(Math.round(Number(match[1]) / rowHeight));
+            }
+
+            const missing = [];
+            for (let row = first; row < last; row++) {
+                if (!rendered.has(row)) missing.push(row);
+            }
+
+            return {
+                clientHeight: scroller.clientHeight,
+                scrollHeight: scroller.scrollHeight,
+                rowsInView: last - first,
+                rendered: rendered.size,
+                missing
+            };
+        })()
+        """)
+
+        assert view['scrollHeight'] > view['clientHeight'], \
+            f"Log should overflow its max-height ({view['scrollHeight']} <= {view['clientHeight']})"
+        assert view['rowsInView'] > 10, f"Expected a tall log viewport, got {view['rowsInView']} rows"
+        assert not view['missing'], \
+            f"Rows {view['missing']} are in view but not rendered ({view['rendered']} lines rendered)"
+
+        print(f"✓ {view['rowsInView']} rows in a {view['clientHeight']}px viewport, all rendered")
+
+    print('\n✓ Log panel test passed!')
+
+
+if __name__ == '__main__':
+    test_visible_rows_fill_viewport()
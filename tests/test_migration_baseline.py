@@ -5,27 +5,18 @@ Tests core game mechanics without LLM calls to establish baseline behavior
 """
 
 import sys
-import os
-from playwright.sync_api import sync_playwright, expect
-import time
+from pathlib import Path
 
-# Get test directory
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_DIR = os.path.dirname(TEST_DIR)
-INDEX_PATH = os.path.join(PROJECT_DIR, 'index.html')
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import get_browser_pool
 
 def test_game_initialization():
     """Test that game initializes correctly"""
     print("Testing game initialization...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        # Load with mock API key to bypass modal
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-
-        # Wait for game to initialize
+    with get_browser_pool().page() as page:
+        # Pooled pages are already loaded; the grid should be on screen
         page.wait_for_selector('#grid', state='visible', timeout=5000)
 
         # Check game object exists
@@ -62,19 +53,12 @@ def test_game_initialization():
             assert actual['alive'] == True, f"Player {i+1} should be alive"
 
         print("✓ Game initialization test passed")
-        browser.close()
 
 def test_player_movement():
     """Test player movement mechanics"""
     print("Testing player movement...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-        page.wait_for_selector('#grid', state='visible', timeout=5000)
-
+    with get_browser_pool().page() as page:
         # Get initial position
         initial_pos = page.evaluate('({x: game.players[0].x, y: game.players[0].y})')
 
@@ -108,19 +92,12 @@ def test_player_movement():
         assert new_pos3['y'] == new_pos2['y'], "Y should not change"
 
         print("✓ Player movement test passed")
-        browser.close()
 
 def test_bomb_placement():
     """Test bomb placement and explosion mechanics"""
     print("Testing bomb placement...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-        page.wait_for_selector('#grid', state='visible', timeout=5000)
-
+    with get_browser_pool().page() as page:
         # Player 1 starts at (0, 0)
         initial_bombs = page.evaluate('game.bombs.length')
         assert initial_bombs == 0, "Should start with no bombs"
@@ -144,19 +121,12 @@ def test_bomb_placement():
         assert bomb['x'] == 0 and bomb['y'] == 0, "Bomb should be at player position"
 
         print("✓ Bomb placement test passed")
-        browser.close()
 
 def test_grid_state():
     """Test grid initialization and block placement"""
     print("Testing grid state...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-        page.wait_for_selector('#grid', state='visible', timeout=5000)
-
+    with get_browser_pool().page() as page:
         # Check hard block pattern (every odd x,y should be hard block = 2)
         hard_block_check = page.evaluate('''
             game.grid[1][1] === 2 && // (1,1) should be hard
@@ -178,19 +148,12 @@ def test_grid_state():
         assert cell_count == 143, "Total cells should be 13 * 11 = 143"
 
         print("✓ Grid state test passed")
-        browser.close()
 
 def test_turn_management():
     """Test turn and round counting"""
     print("Testing turn management...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-        page.wait_for_selector('#grid', state='visible', timeout=5000)
-
+    with get_browser_pool().page() as page:
         # Check initial state
         initial_turn = page.evaluate('game.turnCount')
         initial_round = page.evaluate('game.roundCount')
@@ -221,19 +184,12 @@ def test_turn_management():
         assert player_final == 0, "Should cycle back to player 0"
 
         print("✓ Turn management test passed")
-        browser.close()
 
 def test_game_state_serialization():
     """Test getGameState returns proper structure"""
     print("Testing game state serialization...")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        page.goto(f'file://{INDEX_PATH}#test_key_12345')
-        page.wait_for_selector('#grid', state='visible', timeout=5000)
-
+    with get_browser_pool().page() as page:
         # Get game state
         state = page.evaluate('game.getGameState()')
 
@@ -254,7 +210,6 @@ def test_game_state_serialization():
         assert all('id' in p and 'x' in p and 'y' in p for p in state['players']), "Players should have id, x, y"
 
         print("✓ Game state serialization test passed")
-        browser.close()
 
 def run_all_tests():
     """Run all baseline tests"""
@@ -8,7 +8,6 @@ import sys
 import time
 from pathlib import Path
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
 
 # Load API keys
 load_dotenv(Path(__file__).parent / '.env')
@@ -21,30 +20,12 @@ from helpers import *
 def test_mock_llm_strategies():
     """Test different mock LLM strategies"""
 
-    api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print('ERROR: No API key found in tests/.env')
-        sys.exit(1)
-
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-    file_url = f'file://{index_path.absolute()}#{api_key}'
-
     print('Testing mock LLM strategies...')
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Load game
-        page.goto(file_url)
-        page.wait_for_timeout(500)
-
-        # Initialize with seed
-        test_seed = 999
-        init_game_with_seed(page, test_seed, {'testingMode': True})
+    # Initialize with seed
+    test_seed = 999
 
+    with get_browser_pool().page(test_seed, {'testingMode': True}) as page:
         # Inject mock LLM
         inject_mock_llm(page, strategy='tactical', seed=test_seed)
 
@@ -73,37 +54,19 @@ def test_mock_llm_strategies():
         total_bombs_placed = any(p['hasBomb'] for p in state['players'])
         print(f'✓ Bombs placed: {total_bombs_placed}')
 
-        browser.close()
-
     print('\n✓ All mock LLM tests passed!')
 
 
 def test_mock_llm_performance():
     """Test mock LLM performance compared to real API"""
 
-    api_key = os.environ.get('GROQ_API_KEY') or os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print('ERROR: No API key found in tests/.env')
-        sys.exit(1)
-
-    project_root = Path(__file__).parent.parent
-    index_path = project_root / 'index.html'
-    file_url = f'file://{index_path.absolute()}#{api_key}'
-
     print('\nTesting mock LLM performance...')
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
+    test_seed = 12345
+    num_rounds = 20
 
-        test_seed = 12345
-        num_rounds = 20
-
-        # Test with mock LLM
-        page_mock = context.new_page()
-        page_mock.goto(file_url)
-        page_mock.wait_for_timeout(500)
-        init_game_with_seed(page_mock, test_seed, {'testingMode': True})
+    # Test with mock LLM
+    with get_browser_pool().page(test_seed, {'testingMode': True}) as page_mock:
         inject_mock_llm(page_mock, strategy='tactical', seed=test_seed)
 
         start_mock = time.time()
@@ -118,8 +81,6 @@ def test_mock_llm_performance():
         assert elapsed_mock < 5.0, 'Mock LLM should complete 20 rounds in under 5 seconds'
         print(f'✓ Mock LLM is fast enough for testing')
 
-        browser.close()
-
     print('\n✓ Performance tests passed!')
 
 
@@ -5,11 +5,18 @@ Captures prompts, analyzes bomb placement decisions, and validates gameplay logi
 """
 
 import json
+import os
 import re
+import sys
+from pathlib import Path
 from playwright.sync_api import sync_playwright, Page
 import time
 from datetime import datetime
 
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import drain_events
+
 def analyze_prompt_structure(prompt_text):
     """Analyze prompt structure and extract key information"""
     analysis = {
@@ -40,30 +47,14 @@ def analyze_prompt_structure(prompt_text):
 
     return analysis
 
-def capture_console_logs(page: Page):
-    """Capture and categorize console logs"""
-    console_logs = []
-    prompts_captured = []
-    ai_decisions = []
-
-    def on_console(msg):
-        text = msg.text
-        console_logs.append({'type': msg.type, 'text': text})
-
-        # Capture full prompts when they appear
-        if '=== USER PROMPT ===' in text or '=== SYSTEM PROMPT ===' in text:
-            prompts_captured.append(text)
-
-        # Capture AI decisions
-        if '[AI P' in text and 'Move:' in text:
-            ai_decisions.append(text)
+EVENT_TYPES = ['prompt-built', 'llm-response', 'bomb-placed']
 
-        # Capture bomb placement attempts
-        if 'dropBomb' in text:
-            ai_decisions.append(text)
-
-    page.on('console', on_console)
-    return console_logs, prompts_captured, ai_decisions
+def format_prompt(event):
+    """Render a prompt-built event the way the AI sees it"""
+    return (f"=== COMPLETE PROMPT FOR P{event['playerId']} (ROUND {event['round']}) ===\n"
+            f"=== SYSTEM PROMPT ===\n{event['system']}\n\n"
+            f"=== USER PROMPT (GAME STATE) ===\n{event['user']}\n"
+            f"=== END PROMPT ===")
 
 def analyze_bomb_placement_behavior(page: Page, max_rounds=20):
     """Analyze why bombs are/aren't being placed"""
@@ -76,67 +67,64 @@ def analyze_bomb_placement_behavior(page: Page, max_rounds=20):
         'missed_opportunities': []
     }
 
-    console_logs, prompts, decisions = capture_console_logs(page)
+    events = []
 
     # Wait for game to start
     time.sleep(2)
 
     current_round = 0
-    round_data = {}
-
     for i in range(max_rounds * 10):  # Check frequently
-        # Look for round start markers
-        for log in console_logs[-5:]:
-            if '[ROUND' in log['text'] and 'START' in log['text']:
-                match = re.search(r'\[ROUND (\d+)\]', log['text'])
-                if match:
-                    new_round = int(match.group(1))
-                    if new_round > current_round:
-                        current_round = new_round
-                        round_data[current_round] = {
-                            'prompts': [],
-                            'decisions': [],
-                            'outcomes': []
-                        }
-
-        # Capture decisions for current round
-        for log in console_logs[-10:]:
-            if f'[ROUND {current_round}]' in log['text']:
-                if 'P1:' in log['text'] or 'P2:' in log['text'] or 'P3:' in log['text'] or 'P4:' in log['text']:
-                    round_data[current_round]['outcomes'].append(log['text'])
-
-            if '[AI P' in log['text'] and 'dropBomb' in log['text']:
-                round_data[current_round]['decisions'].append(log['text'])
+        events.extend(drain_events(page, types=EVENT_TYPES))
+        current_round = page.evaluate('game.roundCount')
 
         time.sleep(0.2)
 
         if current_round >= max_rounds:
             break
 
+    events.extend(drain_events(page, types=EVENT_TYPES))
+
     results['rounds_analyzed'] = current_round
+    results['prompts'] = [e for e in events if e['type'] == 'prompt-built']
+
+    # Group decisions and placements per round
+    round_data = {}
+    for event in events:
+        if event['type'] == 'prompt-built':
+            continue
+        data = round_data.setdefault(event['round'], {'decisions': [], 'outcomes': []})
+        if event['type'] == 'llm-response':
+            data['decisions'].append(event)
+        else:
+            data['outcomes'].append(event)
     results['round_data'] = round_data
 
-    # Analyze bomb placement patterns
+    # Analyze bomb placement patterns: an attempt with no matching
+    # bomb-placed for that player in that round was blocked
     for round_num, data in round_data.items():
+        attempts = {}
         for decision in data['decisions']:
-            if 'dropBomb: true' in decision:
+            if (decision.get('move') or {}).get('dropBomb') is True:
                 results['bomb_attempts'].append({
                     'round': round_num,
                     'decision': decision
                 })
+                attempts.setdefault(decision['playerId'], []).append(decision)
 
+        placed = {}
         for outcome in data['outcomes']:
-            if '+BOMB' in outcome:
-                if 'BLOCKED' in outcome:
-                    results['bomb_blocks'].append({
-                        'round': round_num,
-                        'outcome': outcome
-                    })
-                else:
-                    results['bomb_successes'].append({
-                        'round': round_num,
-                        'outcome': outcome
-                    })
+            results['bomb_successes'].append({
+                'round': round_num,
+                'outcome': outcome
+            })
+            placed[outcome['playerId']] = placed.get(outcome['playerId'], 0) + 1
+
+        for player_id, player_attempts in attempts.items():
+            for decision in player_attempts[placed.get(player_id, 0):]:
+                results['bomb_blocks'].append({
+                    'round': round_num,
+                    'outcome': decision
+                })
 
     return results
 
@@ -157,48 +145,13 @@ def test_prompt_effectiveness():
         url = f"file://{index_path.absolute()}#{api_key}"
         page.goto(url)
 
-        # Setup console capture
-        console_logs, prompts, decisions = capture_console_logs(page)
-
         # Wait for AI controller to load
         time.sleep(2)
 
-        # Enable prompt logging by injecting code
-        try:
-            page.evaluate("""
-                // Intercept AI controller to log full prompts
-                if (window.ai && window.ai.getAIMove) {
-                    const originalGetAIMove = window.ai.getAIMove.bind(window.ai);
-                    window.ai.getAIMove = async function(...args) {
-                        const [gameState, playerId, game] = args;
-
-                        // Generate and log the full prompt
-                        const gameDescription = this.generateGameStateDescription(gameState, playerId, game);
-                        const playerStrategy = this.prompts[playerId] || 'Make smart moves to survive and win.';
-                        const userPrompt = `${gameDescription}
-STRATEGY: ${playerStrategy}
-
-Respond with JSON: {"direction":"up|down|left|right","dropBomb":true|false,"thought":"why (50 words max)"}`;
-
-                        console.log(`\\n=== COMPLETE PROMPT FOR P${playerId} (ROUND ${gameState.roundCount}) ===`);
-                        console.log('=== SYSTEM PROMPT ===');
-                        console.log(this.systemPrompt);
-                        console.log('\\n=== USER PROMPT (GAME STATE) ===');
-                        console.log(userPrompt);
-                        console.log('=== END PROMPT ===\\n');
-
-                        return originalGetAIMove.apply(this, args);
-                    };
-                    console.log('[TEST] Prompt logging enabled');
-                } else {
-                    console.log('[TEST] AI controller not ready yet');
-                }
-            """)
-        except Exception as e:
-            print(f"Warning: Could not inject prompt logging: {e}")
-
         # Wait for game initialization (grid element loads)
         page.wait_for_selector('div#grid', timeout=10000)
+        # prompt-built events carry only lengths/hashes outside testing mode
+        page.evaluate('game.events.promptText = true')
         time.sleep(2)
 
         # Click START button (correct selector: #startGame)
@@ -235,30 +188,28 @@ Respond with JSON: {"direction":"up|down|left|right","dropBomb":true|false,"thou
         print("📝 SAMPLE PROMPT CAPTURED:")
         print(f"{'='*80}\n")
 
-        for prompt in prompts[:2]:
-            if '=== COMPLETE PROMPT' in prompt:
-                print(prompt[:2000])  # First 2000 chars
-                print("...[truncated]...\n")
+        prompts = [format_prompt(event) for event in results.pop('prompts')]
+        for prompt in prompts[:1]:
+            print(prompt[:2000])  # First 2000 chars
+            print("...[truncated]...\n")
 
-                # Analyze structure
-                analysis = analyze_prompt_structure(prompt)
-                print("PROMPT STRUCTURE ANALYSIS:")
-                for key, value in analysis.items():
-                    print(f"  {key}: {value}")
-                break
+            # Analyze structure
+            analysis = analyze_prompt_structure(prompt)
+            print("PROMPT STRUCTURE ANALYSIS:")
+            for key, value in analysis.items():
+                print(f"  {key}: {value}")
 
         # Wait a bit more to see results
         time.sleep(3)
 
         # Save full logs to file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = f"/Users/user/dev/bombervibe/tests/prompt_analysis_{timestamp}.json"
+        log_file = Path(__file__).parent / f"prompt_analysis_{timestamp}.json"
 
         with open(log_file, 'w') as f:
             json.dump({
                 'results': results,
-                'prompts': prompts[:10],
-                'console_logs': [log for log in console_logs if any(keyword in log['text'] for keyword in ['[AI', '[ROUND', 'BOMB', 'dropBomb'])]
+                'prompts': prompts[:10]
             }, f, indent=2)
 
         print(f"\n💾 Full logs saved to: {log_file}")
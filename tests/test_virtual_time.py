@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test virtual-time mode: long scripted games run without wall-clock sleeps
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import *
+
+
+def test_scripted_game_under_virtual_time():
+    """200 rounds at the default 1s turn delay finish in far less real time"""
+
+    print('Testing 200-round scripted game under virtual time...')
+
+    test_seed = 4242
+    target_rounds = 200
+
+    with get_browser_pool().page(test_seed, {'testingMode': True}) as page:
+        # Everyone stands still, so nobody dies and the game lasts all 200 rounds
+        stay = [{'direction': 'stay', 'dropBomb': False}]
+        scripted = {player_id: stay for player_id in range(1, 5)}
+        inject_mock_llm(page, strategy='scripted', seed=test_seed, options={'scriptedMoves': scripted})
+
+        turn_delay = page.evaluate('engine.config.turnDelay')
+        vt = enable_virtual_time(page, frame_interval=100)
+        page.evaluate('engine.start()')
+
+        # 4 turns per round, each gated by turnDelay in engine.gameLoop, plus slack
+        budget = target_rounds * 4 * (turn_delay + 200)
+
+        start = time.time()
+        vt.advance(budget, timeout=120000)
+        elapsed = time.time() - start
+
+        rounds = page.evaluate('game.roundCount')
+        assert rounds >= target_rounds, f'Expected {target_rounds} rounds, got {rounds}'
+        # ~16 virtual minutes must play out in seconds: at least 100x faster than real time
+        assert elapsed * 1000 < budget / 100, (
+            f'Virtual time should run at least 100x real time '
+            f'({budget / 1000:.0f}s virtual took {elapsed:.2f}s real)'
+        )
+
+        print(f'✓ {rounds} rounds ({budget / 1000:.0f}s virtual) in {elapsed:.2f}s real time')
+
+    print('\n✓ Virtual time test passed!')
+
+
+if __name__ == '__main__':
+    test_scripted_game_under_virtual_time()
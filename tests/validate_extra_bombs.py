@@ -4,10 +4,17 @@ Quick validation script for extra_bomb loot feature
 Runs a short test to verify the basic functionality works
 """
 
+import sys
 from playwright.sync_api import sync_playwright
 import time
 from pathlib import Path
 
+# Add helpers to path
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import drain_events
+
+EVENT_TYPES = ['loot-picked', 'bomb-placed', 'bomb-exploded']
+
 def validate():
     """Quick validation test"""
 
@@ -44,26 +51,29 @@ def validate():
             'bombs_placed': [],
             'activeBombs_2': False
         }
-
-        def on_console(msg):
-            text = msg.text
-
-            # Check for pickup
-            if 'Picked up Extra Bomb' in text:
-                events['extra_bomb_pickup'] = True
-                print(f"✅ {text}")
-
-            # Check for bomb placements by P1
-            if 'P1' in text and '💣 BOMB' in text:
-                events['bombs_placed'].append(text)
-                print(f"✅ {text}")
-
-            # Check for 2 active bombs
-            if 'P1' in text and 'activeBombs: 2' in text:
-                events['activeBombs_2'] = True
-                print(f"✅ {text}")
-
-        page.on('console', on_console)
+        active_bombs = 0
+
+        def collect():
+            nonlocal active_bombs
+            for event in drain_events(page, types=EVENT_TYPES):
+                if event.get('playerId') != 1:
+                    continue
+
+                # Check for pickup
+                if event['type'] == 'loot-picked' and event['lootType'] == 'extra_bomb':
+                    events['extra_bomb_pickup'] = True
+                    print(f"✅ P1 picked up extra_bomb at ({event['x']}, {event['y']}) on turn {event['turn']}")
+
+                # Check for bomb placements by P1 (and how many are live at once)
+                elif event['type'] == 'bomb-placed':
+                    events['bombs_placed'].append(event)
+                    active_bombs += 1
+                    print(f"✅ P1 placed a bomb at ({event['x']}, {event['y']}) - activeBombs: {active_bombs}")
+                    if active_bombs >= 2:
+                        events['activeBombs_2'] = True
+
+                elif event['type'] == 'bomb-exploded':
+                    active_bombs -= 1
 
         # Load game with extra_bomb for Player 1
         url = f"file://{Path(__file__).parent.parent / 'index.html'}#{api_key}&extrabomb_player1=true&maxRounds=8"
@@ -83,6 +93,7 @@ def validate():
         start_time = time.time()
         while (time.time() - start_time) < 20:
             time.sleep(0.5)
+            collect()
 
             # Check if we have enough data
             if events['extra_bomb_pickup'] and len(events['bombs_placed']) >= 2:
@@ -90,6 +101,7 @@ def validate():
                 break
 
         time.sleep(2)
+        collect()
         browser.close()
 
         # Validate results
@@ -114,7 +126,7 @@ def validate():
         if events['activeBombs_2']:
             print("✅ PASS: Player 1 had 2 active bombs simultaneously")
         else:
-            print("⚠️  WARNING: Did not see 'activeBombs: 2' log (may not be an issue)")
+            print("⚠️  WARNING: Player 1 never had 2 bombs on the board at once (may not be an issue)")
 
         print("\n" + "="*70)
         if success:
@@ -126,6 +138,5 @@ def validate():
         return success
 
 if __name__ == "__main__":
-    import sys
     success = validate()
     sys.exit(0 if success else 1)